@@ -1,19 +1,23 @@
 import os
+import sys
 import json
 import re
 import pandas as pd
-import time
-import requests
 from typing import List, TypedDict, Optional
 from dotenv import load_dotenv
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_fireworks import ChatFireworks
 from langgraph.graph import END, StateGraph
-from bs4 import BeautifulSoup
 import datetime
 from datetime import datetime
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scrappers"))
+from http_transport import http_get
+from container_finder import find_card_containers
+from debug_snapshots import save_snapshot
+from html_parser import make_soup
+
 load_dotenv()
 
 # Define State for our scraping workflow
@@ -29,22 +33,14 @@ llm = ChatFireworks(model="accounts/fireworks/models/llama-v3p3-70b-instruct")
 
 def scrape_timesjobs_live(url):
     """Scrape live TimesJobs mobile site with direct parsing based on actual HTML structure"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1'
-    }
-    
     try:
         print(f"🌐 Scraping URL: {url}")
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_get(url, timeout=10)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = make_soup(response.content)
         jobs = []
         
-        # Save HTML for debugging
-        with open("debug_page.html", "w", encoding="utf-8") as f:
-            f.write(str(soup))
-        
         print("🔍 Analyzing page structure...")
         
         # METHOD 1: Look for job listing containers based on actual HTML structure
@@ -74,9 +70,8 @@ def scrape_timesjobs_live(url):
         # If no specific containers found, look for any divs with substantial content
         if not job_containers:
             print("🔄 No specific job containers found. Looking for content-rich divs...")
-            all_divs = soup.find_all('div')
-            # Filter divs that likely contain job data (have reasonable text length and structure)
-            job_containers = [div for div in all_divs if 100 < len(div.get_text(strip=True)) < 2000]
+            # Repeated card-like elements with a reasonable amount of text
+            job_containers = find_card_containers(soup, keywords=[], min_text=100, max_text=2000)
             print(f"🔄 Found {len(job_containers)} potential job containers")
         
         # Remove duplicates
@@ -113,6 +108,8 @@ def scrape_timesjobs_live(url):
             print("🔄 Trying full page analysis...")
             jobs = parse_full_page_structure(soup, url)
         
+        # Keep the raw page for debugging: always when nothing was found, else sampled
+        save_snapshot("timesjobs", response.content, url, reason="sample" if jobs else "failure")
         print(f"✅ Found {len(jobs)} total jobs")
         return jobs
         
@@ -241,19 +238,14 @@ def parse_full_page_structure(soup, url):
     """Parse the entire page structure to find jobs"""
     jobs = []
     
-    # Look for any structured data or lists that might contain jobs
-    lists = soup.find_all(['ul', 'ol', 'div'])
+    # Look for repeated list items / cards that read like job content
+    items = find_card_containers(soup, keywords=['developer', 'engineer', 'years experience', 'location'],
+                                 min_text=50, max_text=500)
     
-    for list_elem in lists:
-        items = list_elem.find_all(['li', 'div'])
-        for item in items:
-            text = item.get_text(strip=True)
-            if len(text) > 50 and len(text) < 500:
-                # Check if this looks like job content
-                if any(keyword in text.lower() for keyword in ['developer', 'engineer', 'years experience', 'location']):
-                    job_data = extract_job_data(item, url)
-                    if is_valid_job(job_data):
-                        jobs.append(job_data)
+    for item in items:
+        job_data = extract_job_data(item, url)
+        if is_valid_job(job_data):
+            jobs.append(job_data)
     
     return jobs
 
@@ -295,8 +287,6 @@ Source: {job['source']}
             print(f"✅ Found {len(jobs)} jobs")
         else:
             print("❌ No jobs found")
-        
-        time.sleep(1)  # Be polite
     
     print(f"✅ TimesJobs scraping completed: {len(all_scraped_data)} total jobs found")
     return all_scraped_data
@@ -1,25 +1,40 @@
 import os
+import sys
 import json
 import re
 import pandas as pd
-import time
-import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import zip_longest
 from typing import List, TypedDict, Optional, Dict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 from dotenv import load_dotenv
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_fireworks import ChatFireworks
 from langgraph.graph import END, StateGraph
-from bs4 import BeautifulSoup
 import datetime
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scrappers"))
+from crawl_frontier import CrawlFrontier
+from container_finder import find_card_containers
+from html_parser import make_soup, select_containers
+from debug_snapshots import save_snapshot, snapshot_driver
+from dom_waits import scroll_until_settled
+from driver_pool import get_driver_pool
+from driver_profile import apply_blocking, apply_chrome_options, report_transfer
+from normalize import normalize_jobs
+from page_load import open_page
+from parse_pool import ParsePool
+from rate_limiter import get_limiter
+from skill_taxonomy import find_skills
+from structured_data import extract_structured_jobs, job_data_from_structured
+from record_replay import ReplayDriver, replaying, wrap_driver
+
 load_dotenv()
 
 class ScrapingState(TypedDict):
@@ -136,6 +151,10 @@ SITE_CONFIGS = {
 
 SITES = list(SITE_CONFIGS.keys())
 
+# Browser sessions scrape_node runs at once, and at most this many on one site
+DEFAULT_BROWSERS = 3
+BROWSERS_PER_SITE = 1
+
 url_prompt = ChatPromptTemplate.from_messages([
     ("system", """You are a URL generator for job sites. Given a job query, generate 10 paginated search URLs for each specified site.
     Use the base patterns provided. Replace {{query}} with URL-encoded query. Add &page=1 to 10 for pagination.
@@ -210,6 +229,9 @@ def generate_urls_node(state: ScrapingState):
     return {"urls": state["urls"], "query": query}
 
 def init_driver():
+    if replaying():
+        return ReplayDriver()
+    
     options = Options()
     options.add_argument("--headless")
     options.add_argument("--no-sandbox")
@@ -219,81 +241,92 @@ def init_driver():
     options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
+    apply_chrome_options(options)
     driver = webdriver.Chrome(options=options)
+    apply_blocking(driver)
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-    return driver
+    return wrap_driver(driver)
 
-def scrape_site_specific(url_info: Dict[str, str]) -> List[dict]:
+def parse_site_page(page_source: str, site: str, url: str) -> List[dict]:
+    """Extract valid jobs from a rendered listing page of one of SITE_CONFIGS."""
+    jobs = []
+    # Embedded JSON-LD / hydration state first; CSS selectors only when it is absent
+    structured = extract_structured_jobs(page_source, site, url)
+    if structured:
+        for found in structured[:50]:  # Same 50-per-page cap as the cards below
+            job_data = job_data_from_structured(found, url, site)
+            if is_valid_job(job_data):
+                jobs.append(job_data)
+                print(f"📝 {site}: {job_data['title'][:50]} at {job_data['company']} (structured)")
+        return jobs
+
+    selectors = SITE_CONFIGS[site]["selectors"]
+    containers = select_containers(page_source, selectors.get("job_container", "div[class*='job']"), limit=50)
+
+    if not containers:
+        containers = find_card_containers(make_soup(page_source), keywords=["python"], min_text=200, max_text=3000)
+
+    for container in containers[:50]:  # 50 per page
+        try:
+            text_content = container.get_text(strip=True)
+            if len(text_content) < 100 or 'python' not in text_content.lower():
+                continue
+
+            skip_keywords = ['sign in', 'register', 'footer', 'header', 'advertisement']
+            if any(kw in text_content.lower() for kw in skip_keywords):
+                continue
+
+            job_data = extract_job_data(container, url, site, selectors, text_content)
+
+            if job_data.get('title') != "Not specified" and job_data.get('company') != "Not specified":
+                if is_valid_job(job_data):
+                    jobs.append(job_data)
+                    print(f"📝 {site}: {job_data['title'][:50]} at {job_data['company']}")
+
+        except Exception as e:
+            print(f"❌ Error in {site} container: {e}")
+            continue
+    
+    return jobs
+
+def load_site_page(url_info: Dict[str, str]) -> Optional[str]:
+    """Render a search URL and return its page source, or None on failure."""
     site = url_info["site"]
     url = url_info["url"]
     config = SITE_CONFIGS.get(site, {})
     if not config:
-        return []
+        return None
     
-    driver = None
-    try:
-        driver = init_driver()
-        print(f"🌐 Selenium scraping {site}: {url}")
-        driver.get(url)
-        
-        # Scroll to load dynamic content (3 times for Naukri/Indeed)
-        for _ in range(3):
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(5)  # Wait for load after scroll
-        
-        # Wait for jobs (30s timeout)
-        wait = WebDriverWait(driver, 30)
-        wait_for = config.get("wait_for", "div[class*='job']")
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, wait_for)))
-        
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        
-        debug_file = f"debug_{site}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-        with open(debug_file, "w", encoding="utf-8") as f:
-            f.write(soup.prettify())
-        
-        jobs = []
-        selectors = config["selectors"]
-        containers = soup.select(selectors.get("job_container", "div[class*='job']"))
-        
-        if not containers:
-            all_divs = soup.find_all('div')
-            containers = [div for div in all_divs if 200 < len(div.get_text(strip=True)) < 3000 and 'python' in div.get_text().lower()]
-        
-        for container in containers[:50]:  # 50 per page
-            try:
-                text_content = container.get_text(strip=True)
-                if len(text_content) < 100 or 'python' not in text_content.lower():
-                    continue
-                
-                skip_keywords = ['sign in', 'register', 'footer', 'header', 'advertisement']
-                if any(kw in text_content.lower() for kw in skip_keywords):
-                    continue
-                
-                job_data = extract_job_data(container, url, site, selectors, text_content)
-                
-                if job_data.get('title') != "Not specified" and job_data.get('company') != "Not specified":
-                    if is_valid_job(job_data):
-                        jobs.append(job_data)
-                        print(f"📝 {site}: {job_data['title'][:50]} at {job_data['company']}")
-                
-            except Exception as e:
-                print(f"❌ Error in {site} container: {e}")
-                continue
-        
-        print(f"✅ {site}: {len(jobs)} jobs scraped (Selenium + Scroll)")
-        return jobs
-        
-    except TimeoutException:
-        print(f"❌ Timeout loading {site} (increase time if needed)")
-    except WebDriverException as e:
-        print(f"❌ Selenium error on {site}: {e}")
-    finally:
-        if driver:
-            driver.quit()
+    with get_driver_pool(init_driver).lease(site) as driver:
+        try:
+            print(f"🌐 Selenium scraping {site}: {url}")
+            get_limiter().acquire(url)
+            # Returns once the first cards are in (30s timeout), without waiting on the rest of the page
+            wait_for = config["selectors"].get("wait_for", "div[class*='job']")
+            open_page(driver, url, wait_for)
+            
+            # Scroll to load dynamic content (up to 3 times), stopping when a scroll adds no cards
+            scroll_until_settled(driver, wait_for, max_scrolls=3)
+            
+            report_transfer(driver, url)
+            return driver.page_source
+            
+        except TimeoutException:
+            print(f"❌ Timeout loading {site} (increase time if needed)")
+            snapshot_driver(driver, site, url)
+        except WebDriverException as e:
+            print(f"❌ Selenium error on {site}: {e}")
     
-    time.sleep(random.uniform(5, 10))
-    return []
+    return None
+
+def scrape_site_specific(url_info: Dict[str, str]) -> List[dict]:
+    page_source = load_site_page(url_info)
+    if page_source is None:
+        return []
+    jobs = parse_site_page(page_source, url_info["site"], url_info["url"])
+    save_snapshot(url_info["site"], page_source, url_info["url"], reason="sample" if jobs else "failure")
+    print(f"✅ {url_info['site']}: {len(jobs)} jobs scraped (Selenium + Scroll)")
+    return jobs
 
 # Unchanged functions (extract_job_data, is_valid_job, etc.) - same as previous
 def extract_job_data(container, base_url: str, site: str, selectors: Dict, text_content: str) -> dict:
@@ -341,8 +374,8 @@ def extract_job_data(container, base_url: str, site: str, selectors: Dict, text_
                 job_data["company"] = match
                 break
     
-    common_skills = ['python', 'django', 'flask', 'java', 'javascript', 'react', 'angular', 'node', 'sql', 'mysql', 'postgresql', 'aws', 'docker', 'git', 'api', 'machine learning']
-    job_data["skills"] = [s.capitalize() for s in common_skills if s in text_content.lower()]
+    # text_content is joined without separators, so re-read with spaces for word-boundary matching
+    job_data["skills"] = find_skills(container.get_text(" ", strip=True))
     
     return job_data
 
@@ -356,14 +389,82 @@ def is_valid_job(job_data: dict) -> bool:
         return False
     return bool(job_data.get('title') and job_data.get('company'))
 
+def frontier_path(query: str) -> str:
+    return os.getenv("CRAWL_FRONTIER_PATH", f"crawl_frontier_{query.replace('+', '_') or 'default'}.sqlite")
+
+def frontier_key(url_info: Dict[str, str]):
+    """(site, base URL, page) for a generated search URL."""
+    parts = urlsplit(url_info["url"])
+    params = parse_qsl(parts.query, keep_blank_values=True)
+    pages = [value for key, value in params if key == "page" and value.isdigit()]
+    page = int(pages[0]) if pages else 1
+    query = urlencode([(key, value) for key, value in params if key != "page"])
+    return url_info["site"], urlunsplit(parts._replace(query=query)), page
+
+def browser_count() -> int:
+    return int(os.getenv("SCRAPER_BROWSERS", DEFAULT_BROWSERS))
+
+def round_robin(keys: List[tuple]) -> List[tuple]:
+    """Frontier keys interleaved by site (a1, b1, c1, a2, b2, ...), keeping each site's page order."""
+    by_site: Dict[str, List[tuple]] = {}
+    for key in keys:
+        by_site.setdefault(key[0], []).append(key)
+    return [key for batch in zip_longest(*by_site.values()) for key in batch if key is not None]
+
+def scrape_url(url_info: Dict[str, str], parse_pool: ParsePool, site_slot: threading.Semaphore) -> Optional[List[dict]]:
+    """Load and parse one search page on a worker thread; None if the page did not load."""
+    with site_slot:
+        page_source = load_site_page(url_info)
+    if page_source is None:
+        return None
+    jobs = parse_pool.parse(parse_site_page, page_source, url_info["site"], url_info["url"])
+    save_snapshot(url_info["site"], page_source, url_info["url"], reason="sample" if jobs else "failure")
+    return jobs
+
 def scrape_node(state: ScrapingState):
     print("🔍 Starting multi-site scraping...")
     if not state.get("urls"):
         return state
     
-    all_scraped_data = []
+    # Progress is checkpointed per page so a restarted run only crawls what is left
+    frontier = CrawlFrontier(frontier_path(state.get("query", "")))
+    url_by_key = {}
     for url_info in state["urls"]:
-        jobs = scrape_site_specific(url_info)
+        key = frontier_key(url_info)
+        url_by_key[key] = url_info
+        frontier.add(*key, url_info["url"])
+    
+    remaining = [key for key in frontier.pending() if key[:3] in url_by_key]
+    print(f"📌 Frontier: {len(url_by_key) - len(remaining)} pages already done, {len(remaining)} to crawl")
+    
+    # Several browsers run at once, but never more than BROWSERS_PER_SITE on one site;
+    # each page is checkpointed as soon as it finishes, in whatever order that is
+    workers = browser_count()
+    get_driver_pool(init_driver).resize(workers)
+    site_slots = {site: threading.Semaphore(BROWSERS_PER_SITE) for site in dict.fromkeys(key[0] for key in remaining)}
+    with ParsePool() as parse_pool, ThreadPoolExecutor(max_workers=workers, thread_name_prefix="browser") as executor:
+        futures = {
+            executor.submit(scrape_url, url_by_key[key[:3]], parse_pool, site_slots[key[0]]): key[:3]
+            for key in round_robin(remaining)
+        }
+        for future in as_completed(futures):
+            site, base_url, page = futures[future]
+            try:
+                jobs = future.result()
+            except Exception as e:
+                print(f"❌ Error scraping {site} page {page}: {e}")
+                jobs = None
+            # A page that loaded but lists no jobs is past the end of the results, not a failure
+            if jobs is None:
+                frontier.mark_failed(site, base_url, page, "page did not load")
+            else:
+                frontier.mark_done(site, base_url, page, jobs)
+            print(f"✅ {site} page {page}: {len(jobs or [])} jobs scraped")
+    
+    # Build the output from the frontier so pages finished by earlier runs are included
+    all_scraped_data = []
+    for site, base_url in dict.fromkeys(key[:2] for key in url_by_key):
+        jobs = frontier.results(site=site, base_url=base_url)
         for job in jobs:
             clean_content = f"""
 Title: {job['title']}
@@ -384,7 +485,7 @@ Source: {job['source']}
             }
             all_scraped_data.append(scraped_item)
         
-        print(f"✅ {url_info['site']}: {len(jobs)} jobs scraped")
+        print(f"📦 {site}: {len(jobs)} jobs collected from {base_url}")
     
     state["raw_data"] = all_scraped_data
     success_count = len([r for r in all_scraped_data if r["status"] == "success"])
@@ -423,7 +524,7 @@ def extract_node(state: ScrapingState):
                 "skills": job_data["skills"],
                 "description": job_data["description"],
                 "salary": job_data.get("salary", "Not specified"),
-                "posted_date": "Not specified",
+                "posted_date": job_data.get("posted_date", "Not specified"),
                 "job_url": job_data["url"],
                 "source_portal": job_data["source"],
                 "scraping_status": "success",
@@ -444,7 +545,7 @@ def export_node(state: ScrapingState):
         return state
     
     df = pd.DataFrame(state["structured_data"])
-    df = df.drop_duplicates(subset=['job_title', 'company', 'job_url'])
+    df = normalize_jobs(df.drop_duplicates(subset=['job_title', 'company', 'job_url']))
     df['skills'] = df['skills'].apply(lambda x: ', '.join(x) if isinstance(x, list) else str(x))
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -452,6 +553,9 @@ def export_node(state: ScrapingState):
     filename = f"jobs_{query_clean}_{timestamp}.csv"
     df.to_csv(filename, index=False)
     
+    # The crawl is exported, so the next run starts from a clean frontier
+    CrawlFrontier(frontier_path(state["query"])).reset()
+    
     print(f"✅ Saved {len(df)} unique jobs to {filename}")
     return {
         "messages": state["messages"] + [HumanMessage(content=f"Exported {len(df)} unique jobs to {filename}")],
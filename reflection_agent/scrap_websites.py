@@ -1,18 +1,21 @@
 import os
+import sys
 import json
 import re
 import pandas as pd
-import time
-import requests
 from typing import List, TypedDict, Optional
 from dotenv import load_dotenv
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_fireworks import ChatFireworks
 from langgraph.graph import END, StateGraph
-from bs4 import BeautifulSoup
 import datetime
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scrappers"))
+from http_transport import http_get
+from html_parser import make_soup
+from pagination import paginate_all
+
 load_dotenv()
 
 # Environment variable checks
@@ -74,15 +77,19 @@ validation_prompt = ChatPromptTemplate.from_messages([
 
 def scrape_timesjobs_live(url):
     """Scrape live TimesJobs mobile site"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1'
-    }
-    
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_get(url, timeout=10)
         response.raise_for_status()
+        return parse_timesjobs_page(response.content, url)
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+    except Exception as e:
+        print(f"Error scraping {url}: {e}")
+        return []
+
+def parse_timesjobs_page(content, url):
+    """Parse a fetched TimesJobs listing page"""
+    try:
+        soup = make_soup(content)
         jobs = []
         
         # Find job listings - TimesJobs mobile structure
@@ -137,7 +144,7 @@ def scrape_timesjobs_live(url):
         return jobs
         
     except Exception as e:
-        print(f"Error scraping {url}: {e}")
+        print(f"Error parsing {url}: {e}")
         return []
 
 def scrape_with_timesjobs(urls: List[str]) -> List[dict]:
@@ -148,22 +155,13 @@ def scrape_with_timesjobs(urls: List[str]) -> List[dict]:
     
     all_scraped_data = []
     
+    # Paginate all searches at once; pages are requested ahead and cancelled once results run out
+    pages_by_search = paginate_all(urls, parse_timesjobs_page, max_pages=5)
+    
     for base_url in urls:
-        print(f"--- Scraping search: {base_url.split('?')[1][:50]}... ---")
-        current_page = 1
+        print(f"--- Scraped search: {base_url.split('?')[1][:50]}... ---")
         total_jobs_from_url = 0
-        i = 0
-        while i < 10:
-            # Construct the URL for the current page
-            paginated_url = f"{base_url}&curPage={current_page}"
-            
-            print(f"Scraping: {paginated_url}")
-            jobs = scrape_timesjobs_live(paginated_url)
-            
-            if not jobs:
-                print(f"No more jobs found at page {current_page}. Moving to next URL.")
-                break
-                
+        for jobs in pages_by_search[base_url]:
             # Convert to the format expected by the rest of the system
             for job in jobs:
                 # Create clean content for LLM processing
@@ -188,18 +186,6 @@ def scrape_with_timesjobs(urls: List[str]) -> List[dict]:
                 }
                 all_scraped_data.append(scraped_item)
                 total_jobs_from_url += 1
-            
-            print(f"Found {len(jobs)} jobs on this page.")
-            
-            # Move to the next page
-            current_page += 1
-            if current_page > 5:  # Limit pages for demo
-                print("Reached page limit. Moving to next URL.")
-                break
-            
-            # Be polite: add a small delay to avoid spamming the server
-            time.sleep(1)
-            i += 1
         
         print(f"Total jobs from this URL: {total_jobs_from_url}")
     
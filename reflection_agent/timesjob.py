@@ -1,20 +1,28 @@
-import requests
-from bs4 import BeautifulSoup
+import os
+import sys
 import json
 from datetime import datetime
-import time  
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "scrappers"))
+from http_transport import http_get
+from html_parser import make_soup
+from pagination import paginate_all
 
 def scrape_timesjobs_live(url):
     """Scrape live TimesJobs mobile site"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1'
-    }
-    
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = http_get(url, timeout=10)
         response.raise_for_status()
+        return parse_timesjobs_page(response.content, url)
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+    except Exception as e:
+        print(f"Error scraping {url}: {e}")
+        return []
+
+def parse_timesjobs_page(content, url):
+    """Parse a fetched TimesJobs listing page"""
+    try:
+        soup = make_soup(content)
         jobs = []
         
         # Find job listings - TimesJobs mobile structure
@@ -47,7 +55,7 @@ def scrape_timesjobs_live(url):
         return jobs
         
     except Exception as e:
-        print(f"Error scraping {url}: {e}")
+        print(f"Error parsing {url}: {e}")
         return []
 
 # --- MODIFIED LOGIC HERE ---
@@ -61,36 +69,13 @@ base_urls = [
 
 all_jobs = []
 
-# Loop through each of your base search URLs
+# Paginate all searches at once; pages are requested ahead and cancelled once results run out
+pages_by_search = paginate_all(base_urls, parse_timesjobs_page, max_pages=10)
+
 for base_url in base_urls:
-    print(f"--- Scraping search: {base_url.split('?')[1][:50]}... ---")
-    current_page = 1
-    
-    i = 0
-    while i < 10:
-        # Construct the URL for the current page
-        paginated_url = f"{base_url}&curPage={current_page}"
-        
-        print(f"Scraping: {paginated_url}")
-        jobs = scrape_timesjobs_live(paginated_url)
-        
-        if not jobs:
-            # If no jobs are found, we've reached the last page
-            print(f"No more jobs found at page {current_page}. Moving to next URL.")
-            break
-            
+    print(f"--- Scraped search: {base_url.split('?')[1][:50]}... ---")
+    for jobs in pages_by_search[base_url]:
         all_jobs.extend(jobs)
-        print(f"Found {len(jobs)} jobs on this page.")
-        
-        # Move to the next page
-        current_page += 1
-        if current_page > 10: 
-            print("Reached page limit for demo. Moving to next URL.")
-            break
-        
-        # Be polite: add a small delay to avoid spamming the server
-        time.sleep(1) 
-        i += 1
 
 print(f"\n--- Total jobs found: {len(all_jobs)} ---")
 
@@ -0,0 +1,94 @@
+# async_fetch.py
+import asyncio
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from http_transport import DEFAULT_HEADERS, MAX_CONNECTIONS_PER_HOST
+from rate_limiter import get_limiter
+from record_replay import get_store, recording, replaying
+from response_cache import get_cache
+
+# Ceiling on simultaneous requests to a single host
+MAX_PER_HOST = MAX_CONNECTIONS_PER_HOST
+# Ceiling on simultaneous requests overall
+MAX_TOTAL = 20
+
+
+class AsyncFetcher:
+    """Fetch many URLs concurrently with a per-host concurrency ceiling."""
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, per_host: int = MAX_PER_HOST,
+                 total: int = MAX_TOTAL, timeout: float = 15):
+        self.headers = headers or DEFAULT_HEADERS
+        self.per_host = per_host
+        self.total = total
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.total, limit_per_host=self.per_host)
+        self._session = aiohttp.ClientSession(headers=self.headers, timeout=self.timeout, connector=connector)
+        return self
+
+    async def __aexit__(self, *exc):
+        await self._session.close()
+        self._session = None
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc.lower()
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.per_host)
+        return self._host_limits[host]
+
+    async def fetch(self, url: str) -> Optional[bytes]:
+        """Fetch a single URL, returning the body or None on failure."""
+        if replaying():
+            response = get_store().replay_http(url)
+            return response.content if response is not None and response.status_code == 200 else None
+        
+        body = await self._fetch(url)
+        if recording() and body is not None:
+            get_store().record_http(url, 200, {}, body)
+        return body
+
+    async def _fetch(self, url: str) -> Optional[bytes]:
+        # sqlite calls block, so they run on a worker thread rather than the event loop
+        cache = get_cache()
+        entry = await asyncio.to_thread(cache.lookup, url, self.headers) if cache else None
+        if entry and entry.fresh:
+            return entry.body
+        
+        headers = entry.validators() if entry else {}
+        async with self._host_limit(url):
+            await get_limiter().acquire_async(url)
+            try:
+                async with self._session.get(url, headers=headers) as response:
+                    if entry and response.status == 304:
+                        await asyncio.to_thread(cache.refresh, url, response.headers, self.headers)
+                        return entry.body
+                    response.raise_for_status()
+                    body = await response.read()
+                    if cache and response.status == 200:
+                        await asyncio.to_thread(cache.store, url, response.status, response.headers, body, self.headers)
+                    return body
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"❌ Network error scraping {url}: {e}")
+                return None
+
+    async def fetch_all(self, urls: List[str]) -> Dict[str, Optional[bytes]]:
+        """Fetch every URL at once, keyed by URL."""
+        bodies = await asyncio.gather(*(self.fetch(url) for url in urls))
+        return dict(zip(urls, bodies))
+
+
+async def _fetch_all(urls: List[str], **kwargs) -> Dict[str, Optional[bytes]]:
+    async with AsyncFetcher(**kwargs) as fetcher:
+        return await fetcher.fetch_all(urls)
+
+
+def fetch_all(urls: List[str], **kwargs) -> Dict[str, Optional[bytes]]:
+    """Blocking wrapper around AsyncFetcher.fetch_all for script entry points."""
+    return asyncio.run(_fetch_all(urls, **kwargs))
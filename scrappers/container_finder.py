@@ -0,0 +1,85 @@
+# container_finder.py
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+from bs4 import CData, NavigableString, Tag
+
+# Only visible text counts, as with get_text(): not comments, scripts or styles
+_TEXT_TYPES = (NavigableString, CData)
+_DIGITS_RE = re.compile(r"\d+")
+
+
+def annotate(root: Tag, keywords: Iterable[str]) -> Tuple[Dict[int, int], Dict[int, int]]:
+    """Stripped text length and keyword bitmask for every tag under root, in one pass.
+
+    Walking the descendants in reverse document order visits each tag after
+    all of its children, so a tag's totals are complete by the time they
+    are added to its parent. Keyed by id(tag).
+    """
+    keywords = [k.lower() for k in keywords]
+    text_len: Dict[int, int] = defaultdict(int)
+    masks: Dict[int, int] = defaultdict(int)
+    for node in reversed(list(root.descendants)):
+        parent = node.parent
+        if parent is None:
+            continue
+        if isinstance(node, Tag):
+            text_len[id(parent)] += text_len[id(node)]
+            masks[id(parent)] |= masks[id(node)]
+        elif type(node) in _TEXT_TYPES:
+            text = node.strip()
+            if text:
+                text_len[id(parent)] += len(text)
+                lowered = text.lower()
+                for bit, keyword in enumerate(keywords):
+                    if keyword in lowered:
+                        masks[id(parent)] |= 1 << bit
+    return text_len, masks
+
+
+def _signature(tag: Tag) -> tuple:
+    # Per-card class tokens such as "job_1234" would split a group, so digits are ignored
+    classes = tag.get("class") or []
+    return tag.name, frozenset(_DIGITS_RE.sub("", c) for c in classes)
+
+
+def find_card_containers(root: Tag, keywords: Iterable[str] = ("python",), min_text: int = 200,
+                         max_text: int = 3000, min_group: int = 3) -> List[Tag]:
+    """Job-card-like elements on a page whose selectors are unknown.
+
+    A card has between min_text and max_text characters of text and mentions
+    one of the keywords (any text will do when keywords is empty). The best
+    answer is the largest group of same-shaped siblings (same tag and
+    classes) that are cards, e.g. the <li>s of a result list; failing that,
+    the innermost cards are returned, so nested wrappers are not reported
+    along with what they wrap.
+    """
+    keywords = list(keywords)
+    text_len, masks = annotate(root, keywords)
+
+    def is_card(tag: Tag) -> bool:
+        return min_text < text_len[id(tag)] < max_text and (not keywords or masks[id(tag)] != 0)
+
+    tags = root.find_all(True)
+    best: List[Tag] = []
+    for parent in [root, *tags]:
+        siblings = defaultdict(list)
+        for child in parent.children:
+            if isinstance(child, Tag) and is_card(child):
+                siblings[_signature(child)].append(child)
+        for members in siblings.values():
+            if len(members) >= min_group and len(members) > len(best):
+                best = members
+    if best:
+        return best
+
+    innermost, holds_card = [], set()
+    for tag in reversed(tags):
+        card = is_card(tag)
+        if card and id(tag) not in holds_card:
+            innermost.append(tag)
+        if card or id(tag) in holds_card:
+            holds_card.add(id(tag.parent))
+    innermost.reverse()
+    return innermost
@@ -0,0 +1,133 @@
+# crawl_frontier.py
+import json
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+# Failed pages are retried on restart until they have been attempted this many times
+MAX_ATTEMPTS = 3
+
+
+class CrawlFrontier:
+    """Persisted (site, base URL, page) work list with incrementally stored results.
+
+    A restarted crawl skips pages already marked done and reloads their jobs
+    from disk instead of fetching them again.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS pages (
+                site TEXT NOT NULL,
+                base_url TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                url TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (site, base_url, page)
+            );
+            CREATE TABLE IF NOT EXISTS results (
+                site TEXT NOT NULL,
+                base_url TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                position INTEGER NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (site, base_url, page, position)
+            );
+        """)
+        self._conn.commit()
+
+    def add(self, site: str, base_url: str, page: int, url: str):
+        """Register a page as pending unless it is already known."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR IGNORE INTO pages (site, base_url, page, url, status, updated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (site, base_url, page, url, PENDING, time.time()),
+            )
+            self._conn.commit()
+
+    def status(self, site: str, base_url: str, page: int) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status FROM pages WHERE site = ? AND base_url = ? AND page = ?", (site, base_url, page)
+            ).fetchone()
+        return row[0] if row else None
+
+    def is_done(self, site: str, base_url: str, page: int) -> bool:
+        return self.status(site, base_url, page) == DONE
+
+    def pending(self) -> List[Tuple[str, str, int, str]]:
+        """Pages still to crawl: never attempted, or failed with retries left."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT site, base_url, page, url FROM pages "
+                "WHERE status = ? OR (status = ? AND attempts < ?) ORDER BY site, base_url, page",
+                (PENDING, FAILED, MAX_ATTEMPTS),
+            ).fetchall()
+
+    def mark_done(self, site: str, base_url: str, page: int, jobs: List[dict]):
+        """Store a page's jobs and mark it done in one transaction."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM results WHERE site = ? AND base_url = ? AND page = ?", (site, base_url, page)
+            )
+            self._conn.executemany(
+                "INSERT INTO results (site, base_url, page, position, data) VALUES (?, ?, ?, ?, ?)",
+                [(site, base_url, page, i, json.dumps(job, default=str)) for i, job in enumerate(jobs)],
+            )
+            self._conn.execute(
+                "UPDATE pages SET status = ?, attempts = attempts + 1, error = NULL, updated_at = ? "
+                "WHERE site = ? AND base_url = ? AND page = ?",
+                (DONE, time.time(), site, base_url, page),
+            )
+            self._conn.commit()
+
+    def mark_failed(self, site: str, base_url: str, page: int, error: str = ""):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE pages SET status = ?, attempts = attempts + 1, error = ?, updated_at = ? "
+                "WHERE site = ? AND base_url = ? AND page = ?",
+                (FAILED, error, time.time(), site, base_url, page),
+            )
+            self._conn.commit()
+
+    def results(self, site: Optional[str] = None, base_url: Optional[str] = None) -> List[dict]:
+        """All stored jobs, optionally filtered by site and base URL, in crawl order."""
+        query = "SELECT data FROM results"
+        clauses, params = [], []
+        if site is not None:
+            clauses.append("site = ?")
+            params.append(site)
+        if base_url is not None:
+            clauses.append("base_url = ?")
+            params.append(base_url)
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY site, base_url, page, position"
+        with self._lock:
+            return [json.loads(row[0]) for row in self._conn.execute(query, params).fetchall()]
+
+    def summary(self) -> dict:
+        with self._lock:
+            return dict(self._conn.execute("SELECT status, COUNT(*) FROM pages GROUP BY status").fetchall())
+
+    def reset(self):
+        """Forget all progress, e.g. once a crawl has been exported."""
+        with self._lock:
+            self._conn.execute("DELETE FROM pages")
+            self._conn.execute("DELETE FROM results")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,186 @@
+# debug_snapshots.py
+import atexit
+import gzip
+import hashlib
+import os
+import queue
+import random
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional, Union
+
+try:
+    import zstandard
+    COMPRESSED_EXT = ".html.zst"
+except ImportError:
+    zstandard = None
+    COMPRESSED_EXT = ".html.gz"
+
+DEFAULT_SNAPSHOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "debug_snapshots")
+# Share of successful pages that are kept; failures are always kept
+DEFAULT_SAMPLE_RATE = 0.1
+# Compressed bytes kept on disk before the oldest snapshots are evicted
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+_NAME_RE = re.compile(r"_([0-9a-f]{16})\.html\.(?:zst|gz)$")
+_LABEL_RE = re.compile(r"[^a-zA-Z0-9_-]+")
+
+
+def compress(body: bytes) -> bytes:
+    if zstandard is not None:
+        return zstandard.ZstdCompressor(level=10).compress(body)
+    return gzip.compress(body, compresslevel=6)
+
+
+def read_snapshot(path: str) -> str:
+    """HTML of a snapshot file, for opening saved pages in an editor or parser."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if path.endswith(".zst"):
+        if zstandard is None:
+            raise RuntimeError("zstandard is needed to read .zst snapshots (pip install zstandard)")
+        data = zstandard.ZstdDecompressor().decompressobj().decompress(data)
+    else:
+        data = gzip.decompress(data)
+    return data.decode("utf-8", errors="replace")
+
+
+class DebugSnapshotStore:
+    """Compressed, deduplicated page snapshots written on a background thread.
+
+    save() only queues the page; hashing, compression and the disk write
+    happen on a worker thread so the scraper never waits on them. A page whose
+    content was already saved is not written again, and once the directory
+    exceeds max_bytes the oldest snapshots are deleted first.
+    """
+
+    def __init__(self, root: str = DEFAULT_SNAPSHOT_DIR, sample_rate: float = DEFAULT_SAMPLE_RATE,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = root
+        self.sample_rate = sample_rate
+        self.max_bytes = max_bytes
+        self._queue: "queue.Queue" = queue.Queue()
+        self._files: Dict[str, tuple] = {}  # content hash -> (path, size, mtime)
+        self._scan()
+        self._worker = threading.Thread(target=self._run, name="debug-snapshots", daemon=True)
+        self._worker.start()
+
+    def _scan(self):
+        if not os.path.isdir(self.root):
+            return
+        for name in os.listdir(self.root):
+            match = _NAME_RE.search(name)
+            if match:
+                path = os.path.join(self.root, name)
+                stat = os.stat(path)
+                self._files[match.group(1)] = (path, stat.st_size, stat.st_mtime)
+
+    def save(self, label: str, html: Union[str, bytes], url: str = "", reason: str = "sample") -> bool:
+        """Queue a snapshot of html; returns False when sampling skips it.
+
+        reason "sample" is kept at sample_rate; anything else ("failure",
+        "manual") is always kept.
+        """
+        if not html or not self.wants(reason):
+            return False
+        self.put(label, html, url, reason)
+        return True
+
+    def wants(self, reason: str) -> bool:
+        """Sampling decision, so callers can skip fetching a page that would be dropped."""
+        return reason != "sample" or random.random() < self.sample_rate
+
+    def put(self, label: str, html: Union[str, bytes], url: str = "", reason: str = "sample"):
+        """Queue a snapshot without sampling."""
+        self._queue.put((label, html, url, reason, datetime.now()))
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            try:
+                self._write(*item)
+            except Exception as e:
+                print(f"⚠️ Could not write debug snapshot: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, label: str, html: Union[str, bytes], url: str, reason: str, taken_at: datetime):
+        body = html.encode("utf-8") if isinstance(html, str) else html
+        digest = hashlib.sha256(body).hexdigest()[:16]
+        if digest in self._files:
+            # Same content as an existing snapshot: keep it from being evicted as old
+            path, size, _ = self._files[digest]
+            now = time.time()
+            os.utime(path, (now, now))
+            self._files[digest] = (path, size, now)
+            return
+
+        os.makedirs(self.root, exist_ok=True)
+        name = f"{taken_at.strftime('%Y%m%d_%H%M%S')}_{_LABEL_RE.sub('_', label)}_{reason}_{digest}{COMPRESSED_EXT}"
+        path = os.path.join(self.root, name)
+        data = compress(body)
+        with open(path, "wb") as f:
+            f.write(data)
+        self._files[digest] = (path, len(data), time.time())
+        print(f"💾 Saved {reason} snapshot of {url or label} to {path} ({len(body):,} -> {len(data):,} bytes)")
+        self._evict()
+
+    def _evict(self):
+        total = sum(size for _, size, _ in self._files.values())
+        for digest, (path, size, _) in sorted(self._files.items(), key=lambda item: item[1][2]):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            del self._files[digest]
+            total -= size
+
+    def flush(self):
+        """Wait until every queued snapshot is on disk."""
+        self._queue.join()
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_snapshot_store() -> Optional[DebugSnapshotStore]:
+    """Shared store, or None when disabled with SCRAPER_DEBUG_SNAPSHOTS=off."""
+    global _store
+    if os.getenv("SCRAPER_DEBUG_SNAPSHOTS", "on").lower() in ("off", "0", "false"):
+        return None
+    with _store_lock:
+        if _store is None:
+            _store = DebugSnapshotStore(
+                root=os.getenv("SCRAPER_DEBUG_DIR", DEFAULT_SNAPSHOT_DIR),
+                sample_rate=float(os.getenv("SCRAPER_DEBUG_SAMPLE_RATE", DEFAULT_SAMPLE_RATE)),
+                max_bytes=int(os.getenv("SCRAPER_DEBUG_MAX_BYTES", DEFAULT_MAX_BYTES)),
+            )
+            # The worker is a daemon thread, so drain the queue before the interpreter exits
+            atexit.register(_store.flush)
+        return _store
+
+
+def save_snapshot(label: str, html: Union[str, bytes], url: str = "", reason: str = "sample") -> bool:
+    """Snapshot a page for debugging: failures always, other pages at the sampling rate."""
+    store = get_snapshot_store()
+    return store.save(label, html, url, reason) if store else False
+
+
+def snapshot_driver(driver, label: str, url: str = "", reason: str = "failure") -> bool:
+    """save_snapshot of the browser's current page; never raises, as it runs in error handlers."""
+    store = get_snapshot_store()
+    # Serialising the DOM is the expensive part, so sample before asking for it
+    if driver is None or store is None or not store.wants(reason):
+        return False
+    try:
+        html = driver.page_source
+    except Exception:
+        return False
+    if html:
+        store.put(label, html, url, reason)
+    return bool(html)
@@ -0,0 +1,75 @@
+# delta_extract.py
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+SEEN_MARKER = "data-scraper-seen"
+
+# Returns the outerHTML of every card not handed over before, then tags it
+# (and any cards nested inside it) so the next call skips them.
+TAKE_NEW_CARDS_JS = """
+const [selector, marker] = arguments;
+const fresh = [];
+for (const card of document.querySelectorAll(selector)) {
+    if (card.hasAttribute(marker)) { continue; }
+    fresh.push(card.outerHTML);
+    card.setAttribute(marker, '');
+    card.querySelectorAll(selector).forEach(inner => inner.setAttribute(marker, ''));
+}
+return fresh;
+"""
+
+
+class DeltaExtractor:
+    """Extracts cards from an infinite-scroll page as they are appended.
+
+    Call take() after each load step (scroll, "Show more" click): only the
+    cards added since the previous call cross the WebDriver connection, and
+    they are parsed on a worker thread while the browser loads the next
+    batch. results() waits for the worker and returns every parsed job.
+
+        with DeltaExtractor(driver, ".jobTuple", parse_naukri_page) as delta:
+            for _ in range(5):
+                scroll(driver)
+                delta.take()
+            jobs = delta.results()
+    """
+
+    def __init__(self, driver, selector: str, parse: Callable[[str], List[dict]], marker: str = SEEN_MARKER):
+        self.driver = driver
+        self.selector = selector
+        self.parse = parse
+        self.marker = marker
+        self.cards_taken = 0
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="delta-parse")
+        self._futures = []
+
+    def take(self) -> int:
+        """Hand the cards appended since the last call to the parser worker; returns how many."""
+        try:
+            fragments = self.driver.execute_script(TAKE_NEW_CARDS_JS, self.selector, self.marker) or []
+        except Exception as e:
+            print(f"⚠️ Could not collect new cards: {e}")
+            return 0
+        if fragments:
+            self.cards_taken += len(fragments)
+            self._futures.append(self._executor.submit(self.parse, "\n".join(fragments)))
+        return len(fragments)
+
+    def results(self) -> List[dict]:
+        jobs = []
+        for future in self._futures:
+            try:
+                jobs.extend(future.result())
+            except Exception as e:
+                print(f"⚠️ Error parsing a batch of cards: {e}")
+        self._futures = []
+        return jobs
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
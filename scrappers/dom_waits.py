@@ -0,0 +1,113 @@
+# dom_waits.py
+from typing import Optional
+
+# How long the page must stay quiet, and the most any single wait may take
+DEFAULT_QUIET_MS = 700
+DEFAULT_TIMEOUT = 10
+
+# Resolves once, for quietMs, the number of elements matching `selector` has
+# not changed (tracked with a MutationObserver) and, with `network` set, no
+# fetch/XHR is in flight and no resource has finished loading. fetch and XHR
+# are counted by wrappers installed on the first call in each document.
+SETTLE_JS = """
+const opts = arguments[0];
+const done = arguments[arguments.length - 1];
+
+if (!window.__scraperNet) {
+    const net = {pending: 0};
+    if (window.fetch) {
+        const fetch = window.fetch;
+        window.fetch = function (...args) {
+            net.pending++;
+            return fetch.apply(this, args).finally(() => { net.pending--; });
+        };
+    }
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        net.pending++;
+        this.addEventListener('loadend', () => { net.pending--; }, {once: true});
+        return send.apply(this, args);
+    };
+    window.__scraperNet = net;
+}
+const net = window.__scraperNet;
+
+const count = () => opts.selector ? document.querySelectorAll(opts.selector).length : 0;
+const resources = () => performance.getEntriesByType('resource').length;
+const start = performance.now();
+let lastCount = count();
+let lastResources = resources();
+let lastChange = start;
+
+const observer = new MutationObserver(() => {
+    const now = count();
+    if (now !== lastCount) {
+        lastCount = now;
+        lastChange = performance.now();
+    }
+});
+observer.observe(document.documentElement, {childList: true, subtree: true});
+
+const timer = setInterval(() => {
+    const now = performance.now();
+    if (opts.network) {
+        const loaded = resources();
+        if (loaded !== lastResources || net.pending > 0) {
+            lastResources = loaded;
+            lastChange = now;
+        }
+    }
+    const settled = now - lastChange >= opts.quietMs && lastCount >= opts.minCount;
+    if (settled || now - start >= opts.timeoutMs) {
+        observer.disconnect();
+        clearInterval(timer);
+        done({count: lastCount, settled: settled, elapsed_ms: Math.round(now - start), pending: net.pending});
+    }
+}, 50);
+"""
+
+
+def wait_until_settled(driver, selector: Optional[str] = None, quiet_ms: int = DEFAULT_QUIET_MS,
+                       timeout: float = DEFAULT_TIMEOUT, min_count: int = 0, network: bool = True) -> dict:
+    """Wait in-browser until the page stops changing, instead of sleeping a fixed time.
+
+    Settled means the count of `selector` matches (job cards) held steady,
+    and with network=True no request was in flight, for quiet_ms, with at
+    least min_count cards present. Returns {"count", "settled",
+    "elapsed_ms", "pending"}; "settled" is False when timeout ran out first.
+    Drivers that cannot run scripts (replay) return at once with count None.
+    """
+    options = {"selector": selector, "quietMs": quiet_ms, "timeoutMs": int(timeout * 1000),
+               "minCount": min_count, "network": network}
+    try:
+        driver.set_script_timeout(timeout + 5)
+        result = driver.execute_async_script(SETTLE_JS, options)
+    except Exception as e:
+        print(f"⚠️ Settle wait failed: {e}")
+        result = None
+    return result or {"count": None, "settled": False, "elapsed_ms": 0, "pending": 0}
+
+
+def wait_for_network_idle(driver, quiet_ms: int = DEFAULT_QUIET_MS, timeout: float = DEFAULT_TIMEOUT) -> dict:
+    """Wait until no fetch/XHR is in flight and nothing has loaded for quiet_ms."""
+    return wait_until_settled(driver, None, quiet_ms, timeout, network=True)
+
+
+def scroll_until_settled(driver, selector: str, max_scrolls: int = 3, quiet_ms: int = DEFAULT_QUIET_MS,
+                         timeout: float = DEFAULT_TIMEOUT, on_scroll=None) -> Optional[int]:
+    """Scroll to the bottom until a scroll brings no new cards; returns the final card count.
+
+    Each scroll waits only until the cards it triggered have arrived, and
+    scrolling stops as soon as one adds nothing. on_scroll, if given, is
+    called after each settled scroll (e.g. DeltaExtractor.take).
+    """
+    count = wait_until_settled(driver, selector, quiet_ms, timeout)["count"]
+    for _ in range(max_scrolls):
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        state = wait_until_settled(driver, selector, quiet_ms, timeout)
+        if on_scroll:
+            on_scroll()
+        if state["count"] is None or state["count"] <= (count or 0):
+            break
+        count = state["count"]
+    return count
@@ -0,0 +1,168 @@
+# driver_pool.py
+import atexit
+import os
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+# Browsers kept alive per driver factory
+DEFAULT_POOL_SIZE = 2
+# Pages a browser serves before it is quit and replaced, so leaks and
+# accumulated state do not build up over a long crawl
+DEFAULT_MAX_USES = 20
+
+CLEAR_STORAGE_JS = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+class PooledDriver:
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.site: Optional[str] = None
+
+
+class DriverPool:
+    """Warm WebDriver instances leased per page and reused across URLs and sites.
+
+    Chrome is started at most `size` times instead of once per URL. A
+    driver is health-checked on every lease, has its cookies and storage
+    cleared when it moves to a different site, and is retired after
+    max_uses leases. lease() blocks while all drivers are out.
+
+        with get_driver_pool(init_driver).lease("indeed") as driver:
+            driver.get(url)
+    """
+
+    def __init__(self, factory: Callable, size: int = DEFAULT_POOL_SIZE, max_uses: int = DEFAULT_MAX_USES):
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self._idle: List[PooledDriver] = []
+        self._live = 0
+        self._cond = threading.Condition()
+
+    def resize(self, size: int):
+        """Allow at least `size` drivers at once, e.g. one per concurrent worker."""
+        with self._cond:
+            if size > self.size:
+                self.size = size
+                self._cond.notify_all()
+
+    def acquire(self, site: str) -> PooledDriver:
+        with self._cond:
+            while not self._idle and self._live >= self.size:
+                self._cond.wait()
+            if self._idle:
+                # Prefer a driver already on this site: its session needs no reset
+                same_site = [entry for entry in self._idle if entry.site == site]
+                entry = same_site[-1] if same_site else self._idle[-1]
+                self._idle.remove(entry)
+            else:
+                entry = None
+                self._live += 1
+
+        if entry is not None and not self._healthy(entry):
+            print("♻️ Replacing an unresponsive browser")
+            self._quit(entry)
+            entry = None
+        if entry is None:
+            try:
+                entry = PooledDriver(self.factory())
+            except Exception:
+                with self._cond:
+                    self._live -= 1
+                    self._cond.notify()
+                raise
+        elif entry.site != site:
+            self._reset(entry)
+
+        entry.uses += 1
+        entry.site = site
+        return entry
+
+    def release(self, entry: PooledDriver, broken: bool = False):
+        if broken or entry.uses >= self.max_uses:
+            self._quit(entry)
+            with self._cond:
+                self._live -= 1
+                self._cond.notify()
+            return
+        with self._cond:
+            self._idle.append(entry)
+            self._cond.notify()
+
+    @contextmanager
+    def lease(self, site: str):
+        """A warm driver for one unit of work on `site`, returned to the pool afterwards."""
+        entry = self.acquire(site)
+        broken = False
+        try:
+            yield entry.driver
+        except Exception:
+            broken = not self._healthy(entry)
+            raise
+        finally:
+            self.release(entry, broken)
+
+    def _healthy(self, entry: PooledDriver) -> bool:
+        try:
+            entry.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _reset(self, entry: PooledDriver):
+        """Drop the previous site's cookies and web storage."""
+        driver = entry.driver
+        try:
+            # Storage belongs to the origin still loaded, so clear it before navigating away
+            driver.execute_script(CLEAR_STORAGE_JS)
+            driver.delete_all_cookies()
+            # delete_all_cookies() only reaches the current domain; CDP clears every domain on Chrome
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except Exception as e:
+            print(f"⚠️ Could not fully reset browser session: {e}")
+
+    def _quit(self, entry: PooledDriver):
+        try:
+            entry.driver.quit()
+        except Exception:
+            pass
+
+    def close(self):
+        """Quit every idle driver; leased drivers are quit when they come back."""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._live -= len(idle)
+            self.max_uses = 0
+        for entry in idle:
+            self._quit(entry)
+
+
+_pools: Dict[Callable, DriverPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_driver_pool(factory: Callable) -> DriverPool:
+    """The shared pool of drivers built by factory (each scraper's init_driver)."""
+    with _pools_lock:
+        if factory not in _pools:
+            _pools[factory] = DriverPool(
+                factory,
+                size=int(os.getenv("SCRAPER_DRIVER_POOL_SIZE", DEFAULT_POOL_SIZE)),
+                max_uses=int(os.getenv("SCRAPER_DRIVER_MAX_USES", DEFAULT_MAX_USES)),
+            )
+        return _pools[factory]
+
+
+def close_driver_pools():
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_driver_pools)
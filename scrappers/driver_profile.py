@@ -0,0 +1,137 @@
+# driver_profile.py
+import fnmatch
+import json
+import os
+from collections import Counter
+from typing import Dict, List, Optional
+
+from page_load import apply_load_strategy
+
+# URL patterns (Network.setBlockedURLs wildcards) per blockable resource class.
+# Scripts are never blocked by type, only known trackers, so job cards still render.
+RESOURCE_PATTERNS: Dict[str, List[str]] = {
+    "image": ["*.png", "*.png?*", "*.jpg", "*.jpg?*", "*.jpeg", "*.jpeg?*", "*.gif", "*.gif?*",
+              "*.webp", "*.webp?*", "*.avif", "*.avif?*", "*.svg", "*.svg?*", "*.ico", "*.ico?*"],
+    "font": ["*.woff", "*.woff?*", "*.woff2", "*.woff2?*", "*.ttf", "*.ttf?*", "*.otf", "*.otf?*",
+             "*.eot", "*.eot?*", "*fonts.googleapis.com*", "*fonts.gstatic.com*"],
+    "media": ["*.mp4", "*.mp4?*", "*.webm", "*.webm?*", "*.mp3", "*.m3u8", "*.m3u8?*"],
+    "stylesheet": ["*.css", "*.css?*"],
+    "tracker": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*googleadservices.com*",
+        "*googlesyndication.com*", "*doubleclick.net*", "*adservice.google.*",
+        "*connect.facebook.net*", "*facebook.com/tr*", "*hotjar.com*", "*clarity.ms*",
+        "*segment.io*", "*cdn.segment.com*", "*nr-data.net*", "*js-agent.newrelic.com*",
+        "*amplitude.com*", "*mixpanel.com*", "*optimizely.com*", "*scorecardresearch.com*",
+        "*criteo.com*", "*criteo.net*", "*taboola.com*", "*outbrain.com*", "*bat.bing.com*",
+        "*snap.licdn.com*", "*ads.linkedin.com*", "*quantserve.com*", "*moengage.com*",
+        "*webengage.com*", "*clevertap*", "*branch.io*",
+    ],
+}
+# Stylesheets are left on by default: some "Show more" buttons are only clickable once laid out
+DEFAULT_BLOCKED = "image,font,media,tracker"
+
+
+def blocked_classes() -> List[str]:
+    """Resource classes to block, from SCRAPER_BLOCK_RESOURCES ("none" to load everything)."""
+    value = os.getenv("SCRAPER_BLOCK_RESOURCES", DEFAULT_BLOCKED).lower()
+    if value in ("none", "off", "0", "false", ""):
+        return []
+    return [name.strip() for name in value.split(",") if name.strip() in RESOURCE_PATTERNS]
+
+
+def blocked_patterns(classes: Optional[List[str]] = None) -> List[str]:
+    classes = blocked_classes() if classes is None else classes
+    return [pattern for name in classes for pattern in RESOURCE_PATTERNS[name]]
+
+
+def transfer_report_enabled() -> bool:
+    return os.getenv("SCRAPER_TRANSFER_REPORT", "on").lower() not in ("off", "0", "false")
+
+
+def apply_chrome_options(options):
+    """Chrome options for the shared profile; call before webdriver.Chrome(options=...)."""
+    apply_load_strategy(options)
+    if "image" in blocked_classes():
+        # Also stops images that are requested before the CDP block is in place
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    if transfer_report_enabled():
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+
+def apply_blocking(driver):
+    """Block the configured resource classes for every page this driver loads.
+
+    Uses Network.setBlockedURLs, which Chrome applies to every request from
+    the page, including ones issued by scripts. Full Fetch-domain
+    interception would need a CDP event listener, which classic WebDriver
+    cannot provide, so classification is by URL pattern.
+    """
+    patterns = blocked_patterns()
+    if not patterns:
+        return driver
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    except Exception as e:
+        print(f"⚠️ Could not enable resource blocking: {e}")
+    return driver
+
+
+def classify(url: str, classes: Optional[List[str]] = None) -> str:
+    """The blocked resource class a URL falls in, or "other"."""
+    for name in (blocked_classes() if classes is None else classes):
+        # CDP patterns only wildcard "*"; a literal "?" must not act as fnmatch's single-character wildcard
+        if any(fnmatch.fnmatchcase(url.lower(), pattern.replace("?", "[?]")) for pattern in RESOURCE_PATTERNS[name]):
+            return name
+    return "other"
+
+
+def transfer_report(driver) -> Optional[dict]:
+    """Bytes transferred and requests blocked since the previous call, from Chrome's performance log.
+
+    Returns {"bytes", "requests", "blocked", "blocked_by_class"}, or None
+    when the driver has no performance log (logging disabled, replaying).
+    The log is drained, so call once after each page.
+    """
+    if not transfer_report_enabled():
+        return None
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        return None
+    if not entries:
+        return None
+
+    urls: Dict[str, str] = {}
+    total_bytes, finished = 0, 0
+    blocked = Counter()
+    for entry in entries:
+        try:
+            message = json.loads(entry["message"])["message"]
+        except (KeyError, TypeError, ValueError):
+            continue
+        method, params = message.get("method"), message.get("params", {})
+        if method == "Network.requestWillBeSent":
+            urls[params.get("requestId")] = params.get("request", {}).get("url", "")
+        elif method == "Network.loadingFinished":
+            total_bytes += int(params.get("encodedDataLength", 0))
+            finished += 1
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            blocked[classify(urls.get(params.get("requestId"), ""))] += 1
+    return {
+        "bytes": total_bytes,
+        "requests": finished,
+        "blocked": sum(blocked.values()),
+        "blocked_by_class": dict(blocked),
+    }
+
+
+def report_transfer(driver, label: str) -> Optional[dict]:
+    """Print transfer_report() for the page just loaded."""
+    report = transfer_report(driver)
+    if report:
+        detail = ", ".join(f"{name} {count}" for name, count in sorted(report["blocked_by_class"].items()))
+        print(f"📉 {label}: {report['bytes'] / 1024:.0f} KB over {report['requests']} requests, "
+              f"{report['blocked']} blocked" + (f" ({detail})" if detail else ""))
+    return report
@@ -1,20 +1,22 @@
 # test_foundit_access.py
-import requests
-from bs4 import BeautifulSoup
+import re
+from debug_snapshots import save_snapshot
+from html_parser import make_soup
+from http_transport import DESKTOP_USER_AGENT, http_get
 
 def test_foundit_access():
     """Test if we can access Foundit and see what we get"""
     url = "https://www.foundit.in/search/python-jobs-in-pune?query=python&locations=%22Pune%22&queryDerived=true"
     
     headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        'User-Agent': DESKTOP_USER_AGENT
     }
     
     print("🧪 Testing Foundit Access...")
     print(f"URL: {url}")
     
     try:
-        response = requests.get(url, headers=headers, timeout=15)
+        response = http_get(url, headers=headers, timeout=15)
         print(f"Status Code: {response.status_code}")
         print(f"Content Length: {len(response.text)}")
         
@@ -24,7 +26,7 @@ def test_foundit_access():
         elif "errors.edgesuite.net" in response.text:
             print("❌ BLOCKED: Got Akamai error page") 
         else:
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             title = soup.find('title')
             if title:
                 print(f"Page Title: {title.get_text()}")
@@ -40,9 +42,7 @@ def test_foundit_access():
             print(f"Potential Job Containers: {len(job_like_containers)}")
             
             # Save the actual content for inspection
-            with open("foundit_test_output.html", "w", encoding="utf-8") as f:
-                f.write(response.text)
-            print("💾 Saved response to foundit_test_output.html")
+            save_snapshot("foundit", response.content, url, reason="manual")
             
     except Exception as e:
         print(f"❌ Error: {e}")
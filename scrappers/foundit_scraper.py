@@ -1,15 +1,22 @@
 # foundit_selenium_scraper.py
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 import pandas as pd
-import time
 import re
+from dom_waits import wait_for_network_idle
+from driver_pool import get_driver_pool
+from driver_profile import apply_blocking, apply_chrome_options, report_transfer
+from html_parser import make_soup
+from page_load import open_page
+from rate_limiter import get_limiter
+from skill_taxonomy import find_skills
+from record_replay import ReplayDriver, replaying, wrap_driver
 
 def setup_driver():
     """Setup Chrome driver with realistic settings"""
+    if replaying():
+        return ReplayDriver()
+    
     options = Options()
     
     # Remove headless for better success rate
@@ -23,10 +30,12 @@ def setup_driver():
     options.add_experimental_option('useAutomationExtension', False)
     options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
     
+    apply_chrome_options(options)
     driver = webdriver.Chrome(options=options)
+    apply_blocking(driver)
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
     
-    return driver
+    return wrap_driver(driver)
 
 def scrape_foundit_selenium(search_queries=None, locations=None, output_file="foundit_jobs_selenium.csv"):
     """Scrape Foundit using Selenium with real browser"""
@@ -36,10 +45,9 @@ def scrape_foundit_selenium(search_queries=None, locations=None, output_file="fo
     if locations is None:
         locations = ["Pune", "Bangalore", "Hyderabad"]
     
-    driver = setup_driver()
     all_jobs = []
     
-    try:
+    with get_driver_pool(setup_driver).lease("foundit") as driver:
         for query in search_queries:
             for location in locations:
                 print(f"🔍 Searching: {query} in {location}")
@@ -47,15 +55,14 @@ def scrape_foundit_selenium(search_queries=None, locations=None, output_file="fo
                 url = f"https://www.foundit.in/search/{query.lower().replace(' ', '-')}-jobs-in-{location.lower()}?query={query.replace(' ', '%20')}&locations=%22{location}%22&queryDerived=true"
                 
                 try:
-                    driver.get(url)
-                    
-                    # Wait for page to load
-                    WebDriverWait(driver, 10).until(
-                        EC.presence_of_element_located((By.TAG_NAME, "body"))
-                    )
+                    get_limiter().acquire(url)
+                    # No card selector to wait on: the parser looks for card-like classes, so the
+                    # page keeps loading and the network-idle wait below decides when it is rendered
+                    open_page(driver, url, "body", timeout=10, stop=False)
                     
-                    # Wait a bit more for JavaScript to render
-                    time.sleep(3)
+                    # Wait until JavaScript has finished fetching and rendering
+                    wait_for_network_idle(driver)
+                    report_transfer(driver, url)
                     
                     # Check if we got blocked
                     if "Access Denied" in driver.page_source or "403" in driver.page_source:
@@ -63,7 +70,7 @@ def scrape_foundit_selenium(search_queries=None, locations=None, output_file="fo
                         continue
                     
                     # Parse the rendered HTML
-                    soup = BeautifulSoup(driver.page_source, 'html.parser')
+                    soup = make_soup(driver.page_source)
                     jobs = parse_selenium_jobs(soup, query, location)
                     all_jobs.extend(jobs)
                     
@@ -74,14 +81,9 @@ def scrape_foundit_selenium(search_queries=None, locations=None, output_file="fo
                         df = pd.DataFrame(all_jobs)
                         df.to_csv(output_file, index=False)
                     
-                    time.sleep(2)  # Be polite
-                    
                 except Exception as e:
                     print(f"   ❌ Error: {e}")
                     continue
-        
-    finally:
-        driver.quit()
     
     if all_jobs:
         df = pd.DataFrame(all_jobs)
@@ -121,7 +123,7 @@ def parse_selenium_jobs(soup, query, location):
                     'location': location,
                     'experience': 'Not specified',
                     'salary': 'Not specified',
-                    'skills': extract_skills_from_text(text_content),
+                    'skills': extract_skills_from_text(card.get_text(" ", strip=True)),
                     'description': text_content[:300] + "..." if len(text_content) > 300 else text_content,
                     'job_url': extract_job_url(card),
                     'search_query': query,
@@ -185,18 +187,7 @@ def extract_best_guess_company(card):
 
 def extract_skills_from_text(text):
     """Extract skills from text content"""
-    skills = []
-    text_lower = text.lower()
-    
-    common_skills = ['python', 'java', 'javascript', 'react', 'angular', 'node', 'sql',
-                    'mongodb', 'aws', 'docker', 'kubernetes', 'html', 'css', 'php',
-                    'c++', 'c#', '.net', 'spring', 'hibernate', 'rest api', 'git']
-    
-    for skill in common_skills:
-        if skill in text_lower:
-            skills.append(skill)
-    
-    return ', '.join(skills)
+    return ', '.join(find_skills(text))
 
 def extract_job_url(card):
     """Extract job URL"""
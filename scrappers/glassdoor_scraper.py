@@ -1,12 +1,8 @@
 import os
-import json
 import re
 import pandas as pd
-import time
-import random
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
-from bs4 import BeautifulSoup
 import datetime
 from datetime import datetime
 from selenium import webdriver
@@ -14,7 +10,21 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, WebDriverException
+
+from delta_extract import DeltaExtractor
+from dom_waits import wait_until_settled
+from html_parser import make_soup, select_containers
+from debug_snapshots import save_snapshot, snapshot_driver
+from driver_pool import get_driver_pool
+from driver_profile import apply_blocking, apply_chrome_options, report_transfer
+from normalize import normalize_jobs
+from page_load import open_page
+from parse_pool import ParsePool
+from rate_limiter import get_limiter
+from skill_taxonomy import find_skills
+from structured_data import json_ld_postings
+from record_replay import ReplayDriver, get_store, recording, replaying, wrap_driver
 
 load_dotenv()
 
@@ -80,6 +90,9 @@ def generate_glassdoor_urls(query: str, _num_pages: int = 1) -> List[Dict[str, s
 
 def init_driver():
     """Initialize headless Chrome driver."""
+    if replaying():
+        return ReplayDriver()
+    
     options = Options()
     # options.add_argument("--headless")
     options.add_argument("--no-sandbox")
@@ -89,9 +102,11 @@ def init_driver():
     options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
+    apply_chrome_options(options)
     driver = webdriver.Chrome(options=options)
+    apply_blocking(driver)
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-    return driver
+    return wrap_driver(driver)
 
 def dismiss_alert_modal(driver, selectors: Dict):
     """Dismiss job alert modal if present."""
@@ -101,52 +116,86 @@ def dismiss_alert_modal(driver, selectors: Dict):
         close_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, close_selectors)))
         close_button.click()
         print("🔔 Dismissed job alert modal")
-        time.sleep(2)
+        wait_until_settled(driver, quiet_ms=300, timeout=3, network=False)
     except TimeoutException:
         print("ℹ️ No alert modal found")
     except Exception as e:
         print(f"⚠️ Could not dismiss modal: {e}")
 
-def load_more_jobs(driver, selectors: Dict, max_clicks: int = 10, max_jobs: int = 50):
-    """Click 'Show more jobs' button repeatedly to load more results."""
+# Counts loaded job cards and, while fewer than arguments[2] are loaded, clicks the
+# first visible and enabled "Show more jobs" button (JS click to avoid overlay issues).
+LOAD_MORE_STEP_JS = """
+const [containerSelector, buttonSelector, clickBelow] = arguments;
+const count = document.querySelectorAll(containerSelector).length;
+const button = Array.from(document.querySelectorAll(buttonSelector))
+    .find(b => b.offsetParent !== null && !b.disabled);
+const clicked = Boolean(button) && count < clickBelow;
+if (clicked) { button.click(); }
+return {count: count, ready: Boolean(button), clicked: clicked};
+"""
+
+def load_more_step(driver, selectors: Dict, click_below: int = 0) -> dict:
+    """Count job cards and click 'Show more jobs' if it is ready, in one round trip (click_below=0 never clicks)."""
+    state = driver.execute_script(
+        LOAD_MORE_STEP_JS, selectors["search_job_container"], selectors["show_more_button"], click_below
+    )
+    return state or {"count": 0, "ready": False, "clicked": False}
+
+def load_more_jobs(driver, selectors: Dict, max_clicks: int = 10, max_jobs: int = 50,
+                   delta: Optional[DeltaExtractor] = None):
+    """Click 'Show more jobs' button repeatedly to load more results.
+
+    With a DeltaExtractor, the cards appended by each click are handed off for
+    parsing while the next batch loads.
+    """
+    if replaying():
+        return 0  # The recorded page_source already holds every card loaded while recording
     jobs_loaded = 0
     clicks = 0
     wait = WebDriverWait(driver, 10)
     
+    def click_when_ready(d):
+        state = load_more_step(d, selectors, max_jobs)
+        return state if state["clicked"] or state["count"] >= max_jobs else False
+    
+    if delta:
+        delta.take()
+    
     while clicks < max_clicks:
         # *** KEY FIX: Dismiss modal INSIDE the loop ***
         # This handles the popup appearing after the first click
         dismiss_alert_modal(driver, selectors)
         
         try:
-            # Check current jobs
-            soup_temp = BeautifulSoup(driver.page_source, 'html.parser')
-            current_containers = soup_temp.select(selectors["search_job_container"])
-            jobs_loaded = len(current_containers)
+            # Count and click in one script; if the button is not clickable yet, keep polling it in-browser
+            state = click_when_ready(driver) or wait.until(click_when_ready)
+            jobs_loaded = state["count"]
             print(f"📊 Currently loaded: {jobs_loaded} jobs")
             
-            if jobs_loaded >= max_jobs:
+            if not state["clicked"]:
                 print("✅ Reached max jobs limit")
                 break
             
-            # Find and click show more button
-            button_selectors = selectors["show_more_button"]
-            show_more_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, button_selectors)))
-            driver.execute_script("arguments[0].click();", show_more_button)  # JS click to avoid issues
-            print(f"🔄 Clicked 'Show more jobs' ({clicks + 1}/{max_clicks})")
-            time.sleep(random.uniform(3, 6))  # Wait for load
             clicks += 1
+            print(f"🔄 Clicked 'Show more jobs' ({clicks}/{max_clicks})")
+            
+            # Wait for the new cards instead of a fixed sleep
+            try:
+                WebDriverWait(driver, 15).until(lambda d: load_more_step(d, selectors)["count"] > jobs_loaded)
+            except TimeoutException:
+                print("No new jobs appeared after clicking - all loaded")
+                break
+            if delta:
+                delta.take()
             
         except TimeoutException:
             print("No more 'Show more jobs' button found - all loaded")
             break
-        except NoSuchElementException:
-            print("'Show more jobs' button not found")
-            break
         except Exception as e:
             print(f"⚠️ Error clicking show more: {e}")
             break
     
+    jobs_loaded = load_more_step(driver, selectors)["count"] or jobs_loaded
     print(f"✅ Loading complete: {clicks} clicks, {jobs_loaded} jobs available")
     return jobs_loaded
 
@@ -184,69 +233,208 @@ def extract_search_data(container, base_url: str, site: str, selectors: Dict) ->
         "scraped_at": datetime.now().isoformat()
     }
 
-def extract_detail_data(driver, selectors: Dict, base_info: dict) -> dict:
-    """Extract full data from detail page."""
-    try:
-        dismiss_alert_modal(driver, selectors)
-        
-        wait = WebDriverWait(driver, 20)
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selectors["wait_for_detail"])))
-        
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        
-        title_elem = soup.select_one(selectors["detail_title"])
-        if title_elem:
-            base_info["title"] = title_elem.get_text(strip=True)
-        
-        company_elem = soup.select_one(selectors["detail_company"])
-        if company_elem:
-            base_info["company"] = company_elem.get_text(strip=True)
-        
-        location_elem = soup.select_one(selectors["detail_location"])
-        if location_elem:
-            base_info["location"] = location_elem.get_text(strip=True)
-        
-        desc_elem = soup.select_one(selectors["detail_description"])
-        description = desc_elem.get_text(strip=True) if desc_elem else base_info.get("snippet", "")
+def parse_detail_html(page_source: str, selectors: Dict, base_info: dict) -> dict:
+    """Fill base_info with the fields of a rendered job detail page."""
+    # Detail pages embed a JSON-LD JobPosting with the full description, salary and posted date
+    postings = json_ld_postings(page_source)
+    if postings and postings[0].get("title"):
+        posting = postings[0]
+        for field in ("title", "company", "location"):
+            if posting.get(field):
+                base_info[field] = posting[field]
+        description = posting.get("description") or base_info.get("snippet", "")
         base_info["description"] = description[:2000] + "..." if len(description) > 2000 else description
-        
-        skills_elems = soup.select(selectors["detail_skills"])
-        detail_skills = [s.get_text(strip=True).strip('-• ').strip() for s in skills_elems 
-                         if any(keyword in s.get_text(strip=True).lower() for keyword in 
-                                ['python', 'sql', 'aws', 'django', 'flask', 'git', 'docker', 'react', 'javascript', 'ml', 'ai'])]
-        base_info["skills"].extend(detail_skills)
+        base_info["skills"].extend(find_skills(" ".join([posting.get("skills_text", ""), description])))
         base_info["skills"] = list(set([s for s in base_info["skills"] if s]))
-        
-        salary_elem = soup.select_one(selectors["detail_salary"])
-        base_info["salary"] = salary_elem.get_text(strip=True) if salary_elem else "Not specified"
-        
-        posted_elem = soup.select_one(selectors["detail_posted"])
-        base_info["posted_date"] = posted_elem.get_text(strip=True) if posted_elem else "Not specified"
-        
-        exp_match = re.search(r'(\d+[\s-]?years?|entry level|senior|mid[\s-]?level)', base_info["description"], re.I)
-        base_info["experience"] = exp_match.group(1) if exp_match else "Not specified"
-        
+        base_info["salary"] = posting.get("salary") or "Not specified"
+        base_info["posted_date"] = posting.get("posted_date") or "Not specified"
+        # Otherwise filled from the description by normalize_jobs at export
+        base_info["experience"] = posting.get("experience") or "Not specified"
         return base_info
+
+    soup = make_soup(page_source)
+
+    title_elem = soup.select_one(selectors["detail_title"])
+    if title_elem:
+        base_info["title"] = title_elem.get_text(strip=True)
+
+    company_elem = soup.select_one(selectors["detail_company"])
+    if company_elem:
+        base_info["company"] = company_elem.get_text(strip=True)
+
+    location_elem = soup.select_one(selectors["detail_location"])
+    if location_elem:
+        base_info["location"] = location_elem.get_text(strip=True)
+
+    desc_elem = soup.select_one(selectors["detail_description"])
+    description = desc_elem.get_text(strip=True) if desc_elem else base_info.get("snippet", "")
+    base_info["description"] = description[:2000] + "..." if len(description) > 2000 else description
+
+    skills_elems = soup.select(selectors["detail_skills"])
+    base_info["skills"].extend(find_skills(" ".join(s.get_text(" ", strip=True) for s in skills_elems)))
+    base_info["skills"] = list(set([s for s in base_info["skills"] if s]))
+
+    salary_elem = soup.select_one(selectors["detail_salary"])
+    base_info["salary"] = salary_elem.get_text(strip=True) if salary_elem else "Not specified"
+
+    posted_elem = soup.select_one(selectors["detail_posted"])
+    base_info["posted_date"] = posted_elem.get_text(strip=True) if posted_elem else "Not specified"
+
+    # Filled from the description by normalize_jobs at export
+    base_info["experience"] = "Not specified"
+    
+    return base_info
+
+def load_detail_page(driver, selectors: Dict, base_info: dict) -> Optional[str]:
+    """Open the detail page and return its source; None (base_info kept as the job) on failure."""
+    try:
+        # Only the description is needed, so stop loading the rest once it is in
+        open_page(driver, base_info["url"], selectors["wait_for_detail"], timeout=20)
+        dismiss_alert_modal(driver, selectors)
+        
+        report_transfer(driver, base_info["url"])
+        return driver.page_source
         
     except TimeoutException:
         print(f"❌ Timeout on detail: {base_info['url']}")
+        snapshot_driver(driver, "glassdoor_detail", base_info["url"])
         base_info["description"] = base_info.get("snippet", "Not specified")
-        return base_info
+        return None
     except Exception as e:
         print(f"❌ Error on detail {base_info['url']}: {e}")
-        return base_info
+        return None
+
+# Fetches detail pages with the browser's own cookies, at most `concurrency` at a time and
+# none before its start time (ms, from the rate limiter), and resolves with every page in
+# one round trip. Pages are slimmed to what parse_detail_html reads: scripts other than
+# JSON-LD, styles and embeds are dropped before the HTML is sent back.
+FETCH_DETAILS_JS = """
+const [urls, startAt, concurrency, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const begin = performance.now();
+const slim = html => {
+    const doc = new DOMParser().parseFromString(html, 'text/html');
+    doc.querySelectorAll('script:not([type="application/ld+json"]), style, noscript, svg, iframe, link')
+        .forEach(e => e.remove());
+    return '<!DOCTYPE html>' + doc.documentElement.outerHTML;
+};
+const results = new Array(urls.length).fill(null);
+let next = 0;
+async function worker() {
+    while (next < urls.length) {
+        const i = next++;
+        const wait = startAt[i] - (performance.now() - begin);
+        if (wait > 0) { await new Promise(r => setTimeout(r, wait)); }
+        const controller = new AbortController();
+        const timer = setTimeout(() => controller.abort(), timeoutMs);
+        try {
+            const response = await fetch(urls[i], {credentials: 'include', signal: controller.signal});
+            const html = response.ok ? slim(await response.text()) : null;
+            results[i] = {status: response.status, html: html};
+        } catch (e) {
+            results[i] = {status: 0, error: String(e)};
+        } finally {
+            clearTimeout(timer);
+        }
+    }
+}
+Promise.all(Array.from({length: Math.min(concurrency, urls.length)}, worker)).then(() => done(results));
+"""
+
+# Detail requests in flight at once from the browser session
+DEFAULT_DETAIL_CONCURRENCY = 4
+DETAIL_TIMEOUT = 20
 
-def is_valid_job(job_data: dict) -> bool:
-    """Validate job posting."""
+def fetch_detail_pages(driver, urls: List[str], concurrency: Optional[int] = None,
+                       timeout: float = DETAIL_TIMEOUT) -> Optional[List[Optional[str]]]:
+    """HTML of every detail URL, fetched inside the logged-in browser session in one round trip.
+
+    Replaces navigating to each detail page and back. Requests still go
+    through the per-domain rate limiter: each one is given a start time from
+    its token bucket and run at most `concurrency` at a time. Returns one
+    entry per URL (None where that fetch failed), or None when the driver
+    cannot run scripts (replaying) or the batch failed, so callers fall back
+    to load_detail_page. Either way the fallback acquires a fresh token: the
+    ones reserved here stay spent, so it is paced behind them.
+    """
+    if not urls or isinstance(driver, ReplayDriver):
+        return None
+    if concurrency is None:
+        concurrency = int(os.getenv("SCRAPER_DETAIL_CONCURRENCY", DEFAULT_DETAIL_CONCURRENCY))
+    limiter = get_limiter()
+    start_at = [int(limiter.bucket(url).reserve() * 1000) for url in urls]
+    
+    try:
+        previous_timeout = driver.timeouts.script
+    except Exception:
+        previous_timeout = None
+    try:
+        # Room for the last scheduled start plus every batch of requests timing out
+        driver.set_script_timeout(max(start_at) / 1000 + timeout * (len(urls) // max(concurrency, 1) + 1) + 10)
+        results = driver.execute_async_script(FETCH_DETAILS_JS, urls, start_at, concurrency, int(timeout * 1000))
+    except WebDriverException as e:
+        print(f"⚠️ In-session detail fetch failed: {e}")
+        results = None
+    finally:
+        # The driver goes back to a shared pool; do not leave it with this batch's timeout
+        if previous_timeout is not None:
+            try:
+                driver.set_script_timeout(previous_timeout)
+            except WebDriverException:
+                pass
+    if not results:
+        return None
+    
+    pages = []
+    for url, result in zip(urls, results):
+        html = (result or {}).get("html")
+        if not html:
+            print(f"⚠️ Detail fetch failed ({(result or {}).get('status') or (result or {}).get('error')}): {url}")
+        elif recording():
+            # Keep fetched pages replayable: replay opens them through load_detail_page
+            store = get_store()
+            store.start_page(url)
+            store.record_page(url, html)
+        pages.append(html or None)
+    return pages
+
+def is_valid_job(job_data: dict, require_description: bool = True) -> bool:
+    """Validate job posting.
+
+    Search cards only carry a snippet, so they are checked with
+    require_description=False; the description length is enforced once
+    the detail page has been parsed.
+    """
     title = job_data.get('title', '').lower()
     company = job_data.get('company', '').lower()
-    description = job_data.get('description', '').lower()
+    description = (job_data.get('description') or job_data.get('snippet', '')).lower()
     invalids = ['not specified', 'search', 'trending', 'top companies', 'advertisement', 'create alert']
     if any(inv in title or inv in company or inv in description for inv in invalids):
         return False
     if 'python' not in title and 'python' not in description:
         return False
-    return bool(job_data.get('title') and job_data.get('company') and len(job_data.get('description', '')) > 50)
+    if require_description and len(job_data.get('description', '')) <= 50:
+        return False
+    return bool(job_data.get('title') and job_data.get('company'))
+
+def parse_search_page(page_source: str, url: str, site: str = "glassdoor", max_jobs: int = 50) -> List[dict]:
+    """Extract valid job cards from a rendered Glassdoor search page."""
+    selectors = SITE_CONFIG[site]["selectors"]
+    containers = select_containers(page_source, selectors["search_job_container"], limit=max_jobs)
+    
+    if not containers:
+        all_articles = make_soup(page_source).find_all('article')
+        containers = [art for art in all_articles if 'job' in art.get('class', []) or ('python' in art.get_text().lower() and len(art.get_text(strip=True)) > 200)]
+        print(f"🔍 Fallback: {len(containers)} containers")
+    
+    print(f"📋 Parsing {len(containers)} job cards")
+    
+    valid_search_jobs = []
+    for container in containers[:max_jobs]:
+        search_data = extract_search_data(container, url, site, selectors)
+        if search_data and is_valid_job(search_data, require_description=False):
+            valid_search_jobs.append(search_data)
+    return valid_search_jobs
 
 def scrape_glassdoor_site(url_info: Dict[str, str], max_jobs: int = 50) -> List[dict]:
     """Scrape Glassdoor search page, load more via button, extract search data, then details for valid jobs."""
@@ -256,89 +444,80 @@ def scrape_glassdoor_site(url_info: Dict[str, str], max_jobs: int = 50) -> List[
     if not config:
         return []
     
-    driver = None
-    try:
-        driver = init_driver()
-        print(f"🌐 Loading {site} search: {url}")
-        driver.get(url)
-        
-        dismiss_alert_modal(driver, config["selectors"])
-        
-        # Load more jobs via button
-        load_more_jobs(driver, config["selectors"], max_clicks=10, max_jobs=max_jobs)
-        
-        # Scroll one more time for any lazy loads
-        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(3)
-        
-        # Wait for at least one job
-        wait = WebDriverWait(driver, 30)
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, config["selectors"]["wait_for_search"])))
-        
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        
-        # Debug save
-        debug_file = f"debug_glassdoor_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-        with open(debug_file, "w", encoding="utf-8") as f:
-            f.write(soup.prettify())
-        
-        jobs = []
-        selectors = config["selectors"]
-        containers = soup.select(selectors["search_job_container"])
-        
-        if not containers:
-            all_articles = soup.find_all('article')
-            containers = [art for art in all_articles if 'job' in art.get('class', []) or ('python' in art.get_text().lower() and len(art.get_text(strip=True)) > 200)]
-            print(f"🔍 Fallback: {len(containers)} containers")
-        
-        print(f"📋 Parsing {len(containers)} job cards")
-        
-        valid_search_jobs = []
-        for container in containers[:max_jobs]:
-            search_data = extract_search_data(container, url, site, selectors)
-            if search_data and is_valid_job(search_data):
-                valid_search_jobs.append(search_data)
-        
-        print(f"📝 {len(valid_search_jobs)} valid jobs found for details")
-        
-        # Now visit details for each (limit to avoid blocks)
-        for i, search_data in enumerate(valid_search_jobs[:20]):  # Limit details to 20 per run
-            try:
-                print(f"🔗 Detail {i+1}: {search_data['title'][:50]} at {search_data['company']}")
-                driver.get(search_data["url"])
-                time.sleep(random.uniform(3, 5))
+    with get_driver_pool(init_driver).lease(site) as driver:
+        try:
+            print(f"🌐 Loading {site} search: {url}")
+            get_limiter().acquire(url)
+            # Scripts keep loading: "Show more" only works once the page has hydrated
+            open_page(driver, url, config["selectors"]["wait_for_search"], stop=False)
+            
+            dismiss_alert_modal(driver, config["selectors"])
+            
+            selectors = config["selectors"]
+            with DeltaExtractor(driver, selectors["search_job_container"],
+                                lambda html: parse_search_page(html, url, site, max_jobs)) as delta:
+                # Load more jobs via button, parsing each new batch of cards as it arrives
+                load_more_jobs(driver, selectors, max_clicks=10, max_jobs=max_jobs, delta=delta)
                 
-                job_data = extract_detail_data(driver, selectors, search_data)
+                # Scroll one more time for any lazy loads
+                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                wait_until_settled(driver, selectors["search_job_container"])
                 
-                if is_valid_job(job_data):
-                    jobs.append(job_data)
+                # Wait for at least one job
+                wait = WebDriverWait(driver, 30)
+                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selectors["wait_for_search"])))
+                delta.take()
+                valid_search_jobs = delta.results()[:max_jobs]
+            
+            report_transfer(driver, url)
+            page_source = driver.page_source
+            
+            jobs = []
+            if not delta.cards_taken:
+                # No cards matched in-browser (or replaying): fall back to the full page and its heuristics
+                valid_search_jobs = parse_search_page(page_source, url, site, max_jobs)
+            save_snapshot(site, page_source, url, reason="sample" if valid_search_jobs else "failure")
+            
+            print(f"📝 {len(valid_search_jobs)} valid jobs found for details")
+            
+            # Fetch every detail page in one round trip from inside the browser session,
+            # then parse them in worker processes
+            detail_urls = [search_data["url"] for search_data in valid_search_jobs]
+            print(f"🔗 Fetching {len(detail_urls)} detail pages in-session")
+            pages = fetch_detail_pages(driver, detail_urls)
+            report_transfer(driver, f"{site} details")
+            
+            with ParsePool() as pool:
+                for i, search_data in enumerate(valid_search_jobs):
+                    page_source = pages[i] if pages else None
+                    if page_source is None:
+                        # Not fetched (blocked, replaying): open it in the browser instead
+                        print(f"🔗 Detail {i+1}: {search_data['title'][:50]} at {search_data['company']}")
+                        # A failed fetch may have reached the server, so re-requesting needs its own
+                        # token; it queues after every slot fetch_detail_pages reserved
+                        get_limiter().acquire(search_data["url"])
+                        page_source = load_detail_page(driver, selectors, search_data)
+                    if page_source is None:
+                        if is_valid_job(search_data):
+                            jobs.append(search_data)
+                    else:
+                        pool.submit(parse_detail_html, page_source, selectors, search_data, key=i)
                 
-                if i < len(valid_search_jobs) - 1:
-                    driver.back()
-                    time.sleep(2)
-                    dismiss_alert_modal(driver, selectors)
+                for i, job_data in pool.results():
+                    # A page that failed to parse keeps its search-card data
+                    job_data = job_data or valid_search_jobs[i]
+                    if is_valid_job(job_data):
+                        jobs.append(job_data)
             
-            except Exception as e:
-                print(f"❌ Detail error {i+1}: {e}")
-                try:
-                    driver.back()
-                    time.sleep(1)
-                except:
-                    pass
-                continue
-        
-        print(f"✅ {site}: {len(jobs)} detailed jobs scraped")
-        return jobs
-        
-    except TimeoutException:
-        print(f"❌ Timeout on {site} (check query/URL)")
-    except WebDriverException as e:
-        print(f"❌ Selenium error: {e}")
-    finally:
-        if driver:
-            driver.quit()
+            print(f"✅ {site}: {len(jobs)} detailed jobs scraped")
+            return jobs
+            
+        except TimeoutException:
+            print(f"❌ Timeout on {site} (check query/URL)")
+            snapshot_driver(driver, site, url)
+        except WebDriverException as e:
+            print(f"❌ Selenium error: {e}")
     
-    time.sleep(random.uniform(5, 10))
     return []
 
 def scrape_glassdoor(query: str, max_jobs: int = 50):
@@ -353,7 +532,7 @@ def scrape_glassdoor(query: str, max_jobs: int = 50):
     
     df = pd.DataFrame(all_jobs)
     if not df.empty:
-        df = df.drop_duplicates(subset=['title', 'company', 'url'])
+        df = normalize_jobs(df.drop_duplicates(subset=['title', 'company', 'url']))
         df['skills'] = df['skills'].apply(lambda x: ', '.join(x) if isinstance(x, list) else str(x))
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -0,0 +1,214 @@
+# html_parser.py
+import os
+import re
+from typing import List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml  # noqa: F401  (C-backed tree builder for BeautifulSoup)
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as FastHTMLParser
+except ImportError:
+    try:
+        from selectolax.parser import HTMLParser as FastHTMLParser
+    except ImportError:
+        FastHTMLParser = None
+
+# auto | selectolax | lxml | html.parser
+HTML_PARSER = os.getenv("SCRAPER_HTML_PARSER", "auto").lower()
+
+if HTML_PARSER == "html.parser" or not LXML_AVAILABLE:
+    BS4_FEATURES = "html.parser"
+else:
+    BS4_FEATURES = "lxml"
+
+SELECTOLAX_ENABLED = FastHTMLParser is not None and HTML_PARSER in ("auto", "selectolax")
+
+
+def make_soup(markup) -> BeautifulSoup:
+    """BeautifulSoup on the fastest installed tree builder (lxml, else html.parser)."""
+    return BeautifulSoup(markup, BS4_FEATURES)
+
+
+_COMPOUND_RE = re.compile(r"^(\*|[a-zA-Z][\w-]*)?((?:[.#][\w-]+|\[[^\]]*\])*)$")
+_SIMPLE_RE = re.compile(
+    r"([.#])([\w-]+)"
+    r"|\[\s*([\w-]+)\s*(?:([*^$~|]?=)\s*(?:\"([^\"]*)\"|'([^']*)'|([^\]\s'\"]+))\s*)?\]"
+)
+
+
+def _split_outside_brackets(selector: str, separators: str) -> List[str]:
+    parts, depth, quote, current = [], 0, None, ""
+    for ch in selector:
+        if quote:
+            quote = None if ch == quote else quote
+        elif ch in "'\"":
+            quote = ch
+        elif ch in "[(":
+            depth += 1
+        elif ch in "])":
+            depth -= 1
+        elif depth == 0 and ch in separators:
+            parts.append(current)
+            current = ""
+            continue
+        current += ch
+    parts.append(current)
+    return [p.strip() for p in parts if p.strip()]
+
+
+def _parse_compound(compound: str):
+    """(tag, [(attr, op, value)]) for a compound selector such as li.card[data-id], else None."""
+    match = _COMPOUND_RE.match(compound)
+    if not match or not compound:
+        return None
+    tests = []
+    rest = match.group(2)
+    for simple in _SIMPLE_RE.finditer(rest):
+        if simple.group(1) == ".":
+            tests.append(("class", "~=", simple.group(2)))
+        elif simple.group(1) == "#":
+            tests.append(("id", "=", simple.group(2)))
+        else:
+            value = next((v for v in simple.group(5, 6, 7) if v is not None), None)
+            tests.append((simple.group(3).lower(), simple.group(4), value))
+    if "".join(m.group(0) for m in _SIMPLE_RE.finditer(rest)) != rest:
+        return None
+    tag = (match.group(1) or "*").lower()
+    return tag, tests
+
+
+def _attr_matches(actual, op: Optional[str], expected: Optional[str]) -> bool:
+    if actual is None:
+        return False
+    if isinstance(actual, (list, tuple)):
+        actual = " ".join(actual)
+    if op is None:
+        return True
+    if op == "=":
+        return actual == expected
+    if op == "~=":
+        return expected in actual.split()
+    if op == "|=":
+        return actual == expected or actual.startswith(expected + "-")
+    if not expected:
+        return False
+    if op == "*=":
+        return expected in actual
+    if op == "^=":
+        return actual.startswith(expected)
+    return actual.endswith(expected)
+
+
+class ContainerStrainer(SoupStrainer):
+    """Keeps only subtrees whose root can start a match of a container selector.
+
+    Each comma-separated part of the selector is reduced to its leftmost
+    compound (the outermost element in the chain), so descendant and child
+    combinators still resolve inside the kept subtrees.
+    """
+
+    def __init__(self, compounds):
+        super().__init__()
+        self.compounds = compounds
+
+    def allows(self, name, attrs) -> bool:
+        if hasattr(name, "attrs"):
+            name, attrs = name.name, name.attrs
+        attrs = attrs or {}
+        for tag, tests in self.compounds:
+            if tag != "*" and tag != name:
+                continue
+            if all(_attr_matches(attrs.get(attr), op, value) for attr, op, value in tests):
+                return True
+        return False
+
+    # bs4 >= 4.13 consults the filter before creating each top-level tag
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return self.allows(name, attrs)
+
+    def allow_string_creation(self, string):
+        return False
+
+    # bs4 < 4.13 calls search_tag(name, attrs) instead
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        return markup_name if self.allows(markup_name, markup_attrs) else None
+
+
+def container_strainer(selector: str) -> Optional[ContainerStrainer]:
+    """A ContainerStrainer for selector, or None when it needs the whole document.
+
+    Sibling combinators and pseudo-classes can depend on elements outside
+    the kept subtrees, so those selectors are not strained.
+    """
+    compounds = []
+    for part in _split_outside_brackets(selector, ","):
+        if _split_outside_brackets(part, "+~:") != [part]:
+            return None
+        steps = _split_outside_brackets(part, " >")
+        compound = _parse_compound(steps[0]) if steps else None
+        if compound is None:
+            return None
+        compounds.append(compound)
+    return ContainerStrainer(compounds) if compounds else None
+
+
+def _fragment_root(html: str):
+    soup = make_soup(html)
+    root = soup.body or soup
+    return root.find(True, recursive=False)
+
+
+def _fast_select(markup, selector: str, limit: Optional[int]):
+    """Match with selectolax; None when the selector or page is beyond it."""
+    try:
+        nodes = FastHTMLParser(markup).css(selector)
+    except Exception:
+        return None
+    # lexbor yields a node once per comma-separated part it matches; bs4 yields it once
+    seen = set()
+    nodes = [node for node in nodes if not (node.mem_id in seen or seen.add(node.mem_id))]
+    if limit is not None:
+        nodes = nodes[:limit]
+    containers = []
+    for node in nodes:
+        tag = _fragment_root(node.html)
+        if tag is not None:
+            containers.append(tag)
+    return containers
+
+
+def _strained_select(markup, selector: str, limit: Optional[int]) -> list:
+    """BeautifulSoup select() over only the subtrees that can hold a match."""
+    strainer = container_strainer(selector)
+    if strainer is None:
+        return make_soup(markup).select(selector, limit=limit or 0)
+    return BeautifulSoup(markup, BS4_FEATURES, parse_only=strainer).select(selector, limit=limit or 0)
+
+
+def select_containers(markup, selector: str, limit: Optional[int] = None) -> list:
+    """Job containers matching a CSS selector, as BeautifulSoup tags.
+
+    With selectolax installed the whole page is matched by lexbor and only the
+    matched containers are handed to BeautifulSoup, so field extraction keeps
+    using select_one()/get_text() on small fragments. Otherwise, or for
+    selectors lexbor rejects, BeautifulSoup parses only the container
+    subtrees, skipping headers, scripts and footers. An empty list means
+    nothing matched; callers fall back to whole-document heuristics.
+    """
+    if SELECTOLAX_ENABLED:
+        containers = _fast_select(markup, selector, limit)
+        if containers is not None:
+            return containers
+    return _strained_select(markup, selector, limit)
+
+
+def backend_name() -> str:
+    if SELECTOLAX_ENABLED:
+        return f"selectolax + bs4[{BS4_FEATURES}]"
+    return f"bs4[{BS4_FEATURES}]"
@@ -0,0 +1,154 @@
+# http_transport.py
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from rate_limiter import domain_of, get_limiter
+from record_replay import get_store, recording, replaying
+from response_cache import get_cache
+
+try:
+    import brotli  # noqa: F401  (enables 'br' decoding in urllib3/httpx)
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401  (urllib3 and httpx accept either package)
+        ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        ACCEPT_ENCODING = 'gzip, deflate'
+
+try:
+    import httpx
+    import h2  # noqa: F401  (httpx needs it for HTTP/2)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+MOBILE_USER_AGENT = 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1'
+DESKTOP_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+DEFAULT_HEADERS = {
+    'User-Agent': MOBILE_USER_AGENT,
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# Keep-alive connections kept open per host
+MAX_CONNECTIONS_PER_HOST = 4
+# Distinct hosts whose pools are kept warm
+MAX_HOSTS = 10
+
+_local = threading.local()
+# httpx.Limits only bounds a client's total connections, so requests per host are capped here,
+# across every thread's client, to match the requests adapter's pool_maxsize
+_host_slots: Dict[str, threading.BoundedSemaphore] = {}
+_host_slots_lock = threading.Lock()
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=MAX_HOSTS, pool_maxsize=MAX_CONNECTIONS_PER_HOST, pool_block=True)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    return session
+
+
+def _build_http2_client() -> 'httpx.Client':
+    limits = httpx.Limits(max_connections=MAX_HOSTS * MAX_CONNECTIONS_PER_HOST,
+                          max_keepalive_connections=MAX_HOSTS * MAX_CONNECTIONS_PER_HOST)
+    return httpx.Client(http2=True, headers=DEFAULT_HEADERS, limits=limits, follow_redirects=True)
+
+
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    host = domain_of(url)
+    with _host_slots_lock:
+        if host not in _host_slots:
+            _host_slots[host] = threading.BoundedSemaphore(MAX_CONNECTIONS_PER_HOST)
+        return _host_slots[host]
+
+
+def get_session():
+    """Return this thread's pooled client (httpx with HTTP/2 when installed, else requests)."""
+    client = getattr(_local, 'client', None)
+    if client is None:
+        client = _build_http2_client() if HTTP2_AVAILABLE else _build_session()
+        _local.client = client
+    return client
+
+
+def http_get(url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 15, use_cache: bool = True):
+    """GET a URL over the shared keep-alive pool, served from the response cache when fresh.
+
+    Stale cache entries are revalidated with ETag/Last-Modified. Failures are
+    raised as requests.exceptions.RequestException whichever client is
+    underneath, so callers keep a single except clause. With
+    SCRAPER_FIXTURE_MODE=replay the recorded response is returned instead.
+    """
+    if replaying():
+        response = get_store().replay_http(url)
+        if response is None:
+            raise requests.exceptions.ConnectionError(f"No recorded fixture for {url}")
+        return response
+    
+    response = _cached_get(url, headers, timeout, use_cache)
+    if recording():
+        get_store().record_http(url, response.status_code, response.headers, response.content)
+    return response
+
+
+def _cached_get(url: str, headers: Optional[Dict[str, str]], timeout: float, use_cache: bool):
+    cache = get_cache() if use_cache else None
+    # The session's defaults are sent too, so they are part of what the response varies on
+    sent_headers = {**DEFAULT_HEADERS, **(headers or {})}
+    entry = cache.lookup(url, sent_headers) if cache else None
+    if entry and entry.fresh:
+        return entry.as_response()
+    
+    request_headers = dict(headers or {})
+    if entry:
+        request_headers.update(entry.validators())
+    
+    response = _send(url, request_headers, timeout)
+    if entry and response.status_code == 304:
+        cache.refresh(url, response.headers, sent_headers)
+        return entry.as_response()
+    if cache and response.status_code == 200:
+        cache.store(url, response.status_code, response.headers, response.content, sent_headers)
+    return response
+
+
+def _send(url: str, headers: Dict[str, str], timeout: float):
+    get_limiter().acquire(url)
+    client = get_session()
+    if not HTTP2_AVAILABLE:
+        return client.get(url, headers=headers, timeout=timeout)
+    try:
+        with _host_slot(url):
+            response = client.get(url, headers=headers, timeout=timeout)
+        response.raise_for_status = _wrap_raise_for_status(response.raise_for_status)
+        return response
+    except httpx.HTTPError as e:
+        raise requests.exceptions.RequestException(str(e)) from e
+
+
+def _wrap_raise_for_status(raise_for_status):
+    def wrapped():
+        try:
+            return raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise requests.exceptions.HTTPError(str(e)) from e
+    return wrapped
+
+
+def close_session():
+    """Close this thread's pooled client."""
+    client = getattr(_local, 'client', None)
+    if client is not None:
+        client.close()
+        _local.client = None
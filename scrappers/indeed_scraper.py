@@ -2,20 +2,28 @@ import os
 import json
 import re
 import pandas as pd
-import time
-import random
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
-from bs4 import BeautifulSoup
 import datetime
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
 
+from container_finder import find_card_containers
+from html_parser import make_soup, select_containers
+from debug_snapshots import save_snapshot, snapshot_driver
+from dom_waits import scroll_until_settled
+from driver_pool import get_driver_pool
+from driver_profile import apply_blocking, apply_chrome_options, report_transfer
+from normalize import normalize_jobs
+from page_load import open_page
+from parse_pool import ParsePool
+from rate_limiter import get_limiter
+from skill_taxonomy import find_skills
+from structured_data import extract_structured_jobs, job_data_from_structured
+from record_replay import ReplayDriver, replaying, wrap_driver
+
 load_dotenv()
 
 # Indeed-specific config (from 2025 selectors)
@@ -51,6 +59,9 @@ def generate_indeed_urls(query: str, num_pages: int = 5) -> List[Dict[str, str]]
 
 def init_driver():
     """Initialize headless Chrome driver."""
+    if replaying():
+        return ReplayDriver()
+    
     options = Options()
     options.add_argument("--headless")
     options.add_argument("--no-sandbox")
@@ -60,9 +71,11 @@ def init_driver():
     options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
     options.add_experimental_option("excludeSwitches", ["enable-automation"])
     options.add_experimental_option('useAutomationExtension', False)
+    apply_chrome_options(options)
     driver = webdriver.Chrome(options=options)
+    apply_blocking(driver)
     driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-    return driver
+    return wrap_driver(driver)
 
 def extract_job_data(container, base_url: str, site: str, selectors: Dict, text_content: str) -> dict:
     """Extract job data from container."""
@@ -108,8 +121,8 @@ def extract_job_data(container, base_url: str, site: str, selectors: Dict, text_
                 job_data["company"] = match
                 break
     
-    common_skills = ['python', 'django', 'flask', 'java', 'javascript', 'react', 'angular', 'node', 'sql', 'mysql', 'postgresql', 'aws', 'docker', 'git', 'api', 'machine learning']
-    job_data["skills"] = [s.capitalize() for s in common_skills if s in text_content.lower()]
+    # text_content is joined without separators, so re-read with spaces for word-boundary matching
+    job_data["skills"] = find_skills(container.get_text(" ", strip=True))
     
     return job_data
 
@@ -124,79 +137,87 @@ def is_valid_job(job_data: dict) -> bool:
         return False
     return bool(job_data.get('title') and job_data.get('company'))
 
-def scrape_indeed_site(url_info: Dict[str, str]) -> List[dict]:
-    """Scrape a single Indeed URL."""
+def parse_indeed_page(page_source: str, url: str, site: str = "indeed") -> List[dict]:
+    """Extract valid jobs from a rendered Indeed listing page."""
+    jobs = []
+    # Embedded JSON-LD / hydration state first; CSS selectors only when it is absent
+    structured = extract_structured_jobs(page_source, site, url)
+    if structured:
+        for found in structured[:50]:  # Same 50-per-page cap as the cards below
+            job_data = job_data_from_structured(found, url, site)
+            if is_valid_job(job_data):
+                jobs.append(job_data)
+                print(f"📝 {site}: {job_data['title'][:50]} at {job_data['company']} (structured)")
+        return jobs
+    
+    selectors = SITE_CONFIG[site]["selectors"]
+    containers = select_containers(page_source, selectors.get("job_container", "div[class*='job']"), limit=50)
+    
+    if not containers:
+        containers = find_card_containers(make_soup(page_source), keywords=["python"], min_text=200, max_text=3000)
+    
+    for container in containers[:50]:  # Limit to 50 per page
+        try:
+            text_content = container.get_text(strip=True)
+            if len(text_content) < 100 or 'python' not in text_content.lower():
+                continue
+            
+            skip_keywords = ['sign in', 'register', 'footer', 'header', 'advertisement']
+            if any(kw in text_content.lower() for kw in skip_keywords):
+                continue
+            
+            job_data = extract_job_data(container, url, site, selectors, text_content)
+            
+            if job_data.get('title') != "Not specified" and job_data.get('company') != "Not specified":
+                if is_valid_job(job_data):
+                    jobs.append(job_data)
+                    print(f"📝 {site}: {job_data['title'][:50]} at {job_data['company']}")
+        
+        except Exception as e:
+            print(f"❌ Error in {site} container: {e}")
+            continue
+    
+    return jobs
+
+def load_indeed_page(url_info: Dict[str, str]) -> Optional[str]:
+    """Render a single Indeed URL and return its page source, or None on failure."""
     site = url_info["site"]
     url = url_info["url"]
     config = SITE_CONFIG.get(site, {})
     if not config:
-        return []
+        return None
     
-    driver = None
-    try:
-        driver = init_driver()
-        print(f"🌐 Selenium scraping {site}: {url}")
-        driver.get(url)
-        
-        # Scroll to load dynamic content (3 times)
-        for _ in range(3):
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(5)
-        
-        # Wait for jobs (30s timeout)
-        wait = WebDriverWait(driver, 30)
-        wait_for = config.get("wait_for", "div[class*='job']")
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, wait_for)))
-        
-        soup = BeautifulSoup(driver.page_source, 'html.parser')
-        
-        # Debug HTML save
-        debug_file = f"debug_indeed_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-        with open(debug_file, "w", encoding="utf-8") as f:
-            f.write(soup.prettify())
-        
-        jobs = []
-        selectors = config["selectors"]
-        containers = soup.select(selectors.get("job_container", "div[class*='job']"))
-        
-        if not containers:
-            all_divs = soup.find_all('div')
-            containers = [div for div in all_divs if 200 < len(div.get_text(strip=True)) < 3000 and 'python' in div.get_text().lower()]
-        
-        for container in containers[:50]:  # Limit to 50 per page
-            try:
-                text_content = container.get_text(strip=True)
-                if len(text_content) < 100 or 'python' not in text_content.lower():
-                    continue
-                
-                skip_keywords = ['sign in', 'register', 'footer', 'header', 'advertisement']
-                if any(kw in text_content.lower() for kw in skip_keywords):
-                    continue
-                
-                job_data = extract_job_data(container, url, site, selectors, text_content)
-                
-                if job_data.get('title') != "Not specified" and job_data.get('company') != "Not specified":
-                    if is_valid_job(job_data):
-                        jobs.append(job_data)
-                        print(f"📝 {site}: {job_data['title'][:50]} at {job_data['company']}")
+    with get_driver_pool(init_driver).lease(site) as driver:
+        try:
+            print(f"🌐 Selenium scraping {site}: {url}")
+            get_limiter().acquire(url)
+            # Returns once the first cards are in (30s timeout), without waiting on the rest of the page
+            wait_for = config["selectors"].get("wait_for", "div[class*='job']")
+            open_page(driver, url, wait_for)
             
-            except Exception as e:
-                print(f"❌ Error in {site} container: {e}")
-                continue
-        
-        print(f"✅ {site}: {len(jobs)} jobs scraped")
-        return jobs
-        
-    except TimeoutException:
-        print(f"❌ Timeout loading {site}")
-    except WebDriverException as e:
-        print(f"❌ Selenium error on {site}: {e}")
-    finally:
-        if driver:
-            driver.quit()
-    
-    time.sleep(random.uniform(5, 10))
-    return []
+            # Scroll to load dynamic content (up to 3 times), stopping when a scroll adds no cards
+            scroll_until_settled(driver, wait_for, max_scrolls=3)
+            
+            report_transfer(driver, url)
+            return driver.page_source
+            
+        except TimeoutException:
+            print(f"❌ Timeout loading {site}")
+            snapshot_driver(driver, site, url)
+        except WebDriverException as e:
+            print(f"❌ Selenium error on {site}: {e}")
+    
+    return None
+
+def scrape_indeed_site(url_info: Dict[str, str]) -> List[dict]:
+    """Scrape a single Indeed URL."""
+    page_source = load_indeed_page(url_info)
+    if page_source is None:
+        return []
+    jobs = parse_indeed_page(page_source, url_info["url"], url_info["site"])
+    save_snapshot(url_info["site"], page_source, url_info["url"], reason="sample" if jobs else "failure")
+    print(f"✅ {url_info['site']}: {len(jobs)} jobs scraped")
+    return jobs
 
 def scrape_indeed(query: str, num_pages: int = 5):
     """Main scraping function for Indeed."""
@@ -204,14 +225,23 @@ def scrape_indeed(query: str, num_pages: int = 5):
     urls = generate_indeed_urls(query, num_pages)
     
     all_jobs = []
-    for url_info in urls:
-        jobs = scrape_indeed_site(url_info)
-        all_jobs.extend(jobs)
+    pages = {}
+    # Pages are parsed in worker processes while the next one loads
+    with ParsePool() as pool:
+        for url_info in urls:
+            page_source = load_indeed_page(url_info)
+            if page_source is not None:
+                pages[url_info["url"]] = page_source
+                pool.submit(parse_indeed_page, page_source, url_info["url"], url_info["site"], key=url_info["url"])
+        for url, jobs in pool.results():
+            save_snapshot("indeed", pages.pop(url), url, reason="sample" if jobs else "failure")
+            print(f"✅ {url}: {len(jobs or [])} jobs scraped")
+            all_jobs.extend(jobs or [])
     
     # Deduplicate and prepare for CSV
     df = pd.DataFrame(all_jobs)
     if not df.empty:
-        df = df.drop_duplicates(subset=['title', 'company', 'url'])
+        df = normalize_jobs(df.drop_duplicates(subset=['title', 'company', 'url']))
         df['skills'] = df['skills'].apply(lambda x: ', '.join(x) if isinstance(x, list) else str(x))
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
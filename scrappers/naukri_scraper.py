@@ -6,7 +6,6 @@ import pandas as pd
 import time
 import random
 from typing import List, Dict
-from bs4 import BeautifulSoup
 import datetime
 from datetime import datetime
 from selenium import webdriver
@@ -15,6 +14,163 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
+from crawl_frontier import CrawlFrontier
+from debug_snapshots import snapshot_driver
+from delta_extract import DeltaExtractor
+from dom_waits import wait_until_settled
+from driver_pool import get_driver_pool
+from driver_profile import apply_blocking, apply_chrome_options, report_transfer
+from html_parser import select_containers
+from normalize import normalize_jobs
+from page_load import open_page
+from skill_taxonomy import find_skills
+from structured_data import collect_structured_jobs, extract_structured_jobs
+from rate_limiter import get_limiter
+from record_replay import ReplayDriver, replaying, wrap_driver
+
+# Multiple container selectors for Naukri
+NAUKRI_CONTAINER_SELECTOR = ".jobTuple, .srp-jobtuple, [data-job-id], .tuple, .list"
+
+def naukri_job_from_structured(found):
+    """Naukri job dict from a structured-data record (see structured_data.py)"""
+    description = found.get("description", "")
+    return {
+        "title": found["title"],
+        "company": found["company"],
+        "location": found.get("location", "N/A"),
+        "experience": found.get("experience", "N/A"),
+        "skills": found["skills"],
+        "salary": found.get("salary", "N/A"),
+        "description": description[:300] + "..." if len(description) > 300 else description,
+        "posted_date": found.get("posted_date", "N/A"),
+        "url": found["url"],
+        "source": "Naukri",
+        "scraped_at": datetime.now().isoformat()
+    }
+
+def parse_naukri_page(page_source):
+    """Extract job dicts from a rendered Naukri listing page"""
+    # Embedded JSON-LD / hydration state first; CSS selectors only when it is absent
+    structured = extract_structured_jobs(page_source, "naukri", "https://www.naukri.com")
+    if structured:
+        print(f"🧾 Found {len(structured)} jobs in structured data")
+        return [naukri_job_from_structured(found) for found in structured[:25]]  # Same per-page limit as the cards
+
+    jobs = []
+    job_containers = select_containers(page_source, NAUKRI_CONTAINER_SELECTOR, limit=25)  # Limit per page
+
+    if not job_containers:
+        print("❌ No job containers found with any selector")
+        return jobs
+
+    print(f"🔍 Found {len(job_containers)} job containers")
+
+    for container in job_containers:
+        try:
+            # Multiple selector patterns for each field
+            title_elem = (container.select_one("a.title") or 
+                         container.select_one(".title") or
+                         container.select_one("a[class*='title']") or
+                         container.select_one("[data-automation='jobTitle']"))
+
+            company_elem = (container.select_one(".comp-name") or
+                           container.select_one(".company") or
+                           container.select_one(".comp-name a") or
+                           container.select_one("[data-automation='jobCompany']"))
+
+            location_elem = (container.select_one(".loc") or
+                            container.select_one(".location") or
+                            container.select_one(".loc a") or
+                            container.select_one("[data-automation='jobLocation']"))
+
+            experience_elem = (container.select_one(".exp") or
+                              container.select_one(".experience") or
+                              container.select_one(".expwdth"))
+
+            salary_elem = (container.select_one(".sal") or
+                          container.select_one(".salary") or
+                          container.select_one(".sal span"))
+
+            # Extract text with fallbacks
+            title = title_elem.get_text(strip=True) if title_elem else "N/A"
+            company = company_elem.get_text(strip=True) if company_elem else "N/A"
+            location = location_elem.get_text(strip=True) if location_elem else "N/A"
+            experience = experience_elem.get_text(strip=True) if experience_elem else "N/A"
+            salary = salary_elem.get_text(strip=True) if salary_elem else "N/A"
+
+            # Get job URL
+            job_url = ""
+            if title_elem and title_elem.get('href'):
+                job_url = title_elem.get('href')
+                if not job_url.startswith('http'):
+                    job_url = "https://www.naukri.com" + job_url
+
+            # Enhanced skills detection
+            text_content = container.get_text(strip=True).lower()
+            skills = find_skills(container.get_text(" ", strip=True))
+
+            job_data = {
+                "title": title,
+                "company": company,
+                "location": location,
+                "experience": experience,
+                "skills": skills,
+                "salary": salary,
+                "description": text_content[:300] + "..." if len(text_content) > 300 else text_content,
+                "url": job_url,
+                "source": "Naukri",
+                "scraped_at": datetime.now().isoformat()
+            }
+
+            if title != "N/A" and company != "N/A":
+                jobs.append(job_data)
+                print(f"✅ Scraped: {title[:40]}... at {company} | {location}")
+
+        except Exception as e:
+            print(f"⚠️ Error parsing job container: {e}")
+            continue
+
+    print(f"📊 Page completed: {len(job_containers)} containers processed")
+    return jobs
+
+def init_driver():
+    """Chrome with Naukri's stealth settings."""
+    if replaying():
+        return ReplayDriver()
+    
+    options = Options()
+    # Comment out headless for debugging
+    # options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-popup-blocking")
+    options.add_argument("--start-maximized")
+    
+    # Enhanced user agent
+    user_agents = [
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ]
+    options.add_argument(f"--user-agent={random.choice(user_agents)}")
+    
+    options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
+    options.add_experimental_option('useAutomationExtension', False)
+    
+    apply_chrome_options(options)
+    driver = webdriver.Chrome(options=options)
+    apply_blocking(driver)
+    
+    # Stealth modifications
+    driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+    driver.execute_cdp_cmd('Network.setUserAgentOverride', {
+        "userAgent": random.choice(user_agents)
+    })
+    return wrap_driver(driver)
 
 class NaukriScraper:
     def __init__(self, query="python+developer"):
@@ -22,38 +178,7 @@ class NaukriScraper:
         self.base_url = f"https://www.naukri.com/{query}-jobs"
         self.driver = None
         self.jobs = []
-
-    def init_driver(self):
-        options = Options()
-        # Comment out headless for debugging
-        # options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--disable-popup-blocking")
-        options.add_argument("--start-maximized")
-        
-        # Enhanced user agent
-        user_agents = [
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        ]
-        options.add_argument(f"--user-agent={random.choice(user_agents)}")
-        
-        options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
-        options.add_experimental_option('useAutomationExtension', False)
-        
-        self.driver = webdriver.Chrome(options=options)
-        
-        # Stealth modifications
-        self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {
-            "userAgent": random.choice(user_agents)
-        })
+        self.frontier = CrawlFrontier(f"naukri_frontier_{query.replace('+', '_')}.sqlite")
 
     def close_popups(self):
         """Enhanced popup handling for Naukri"""
@@ -100,20 +225,23 @@ class NaukriScraper:
         except Exception as e:
             print(f"⚠️ Popup handling issue: {e}")
 
-    def smart_scroll(self):
-        """Smart scrolling to load dynamic content"""
+    def smart_scroll(self, delta=None):
+        """Smart scrolling to load dynamic content, handing new cards to delta after each scroll"""
         try:
             last_height = self.driver.execute_script("return document.body.scrollHeight")
             
             for i in range(5):
                 # Scroll down
                 self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(random.uniform(2, 4))
+                wait_until_settled(self.driver, NAUKRI_CONTAINER_SELECTOR)
                 
                 # Scroll up a bit to trigger lazy loading
                 if i % 2 == 0:
                     self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight - 500);")
-                    time.sleep(1)
+                    wait_until_settled(self.driver, NAUKRI_CONTAINER_SELECTOR, quiet_ms=300)
+                
+                if delta:
+                    delta.take()
                 
                 # Calculate new scroll height
                 new_height = self.driver.execute_script("return document.body.scrollHeight")
@@ -127,8 +255,9 @@ class NaukriScraper:
     def scrape_page(self, url):
         try:
             print(f"🌐 Loading URL: {url}")
-            self.driver.get(url)
-            time.sleep(random.uniform(3, 5))
+            get_limiter().acquire(url)
+            # Returns once the first cards are rendered instead of after every subresource
+            open_page(self.driver, url, NAUKRI_CONTAINER_SELECTOR, timeout=20)
             
             # Debug info
             print(f"📄 Page title: {self.driver.title}")
@@ -137,144 +266,95 @@ class NaukriScraper:
             # Close popups
             self.close_popups()
             
-            # Smart scrolling
-            self.smart_scroll()
-            
-            # Wait for job listings with multiple selector options
-            wait = WebDriverWait(self.driver, 20)
-            try:
-                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".jobTuple, .srp-jobtuple, [data-job-id], .tuple")))
-            except TimeoutException:
-                print("❌ No job listings found with common selectors")
-                # Save page source for debugging
-                with open("naukri_debug.html", "w", encoding="utf-8") as f:
-                    f.write(self.driver.page_source)
-                print("💾 Saved page source to naukri_debug.html for inspection")
-                return
-
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-
-            # Multiple container selectors for Naukri
-            job_containers = soup.select(".jobTuple, .srp-jobtuple, [data-job-id], .tuple, .list")
-            
-            if not job_containers:
-                print("❌ No job containers found with any selector")
-                return
+            with DeltaExtractor(self.driver, NAUKRI_CONTAINER_SELECTOR, parse_naukri_page) as delta:
+                # Smart scrolling; cards appended by each scroll are parsed while the next one loads
+                delta.take()
+                self.smart_scroll(delta)
                 
-            print(f"🔍 Found {len(job_containers)} job containers")
-
-            for container in job_containers[:25]:  # Limit per page
+                # Wait for job listings with multiple selector options
+                wait = WebDriverWait(self.driver, 20)
                 try:
-                    # Multiple selector patterns for each field
-                    title_elem = (container.select_one("a.title") or 
-                                 container.select_one(".title") or
-                                 container.select_one("a[class*='title']") or
-                                 container.select_one("[data-automation='jobTitle']"))
-                    
-                    company_elem = (container.select_one(".comp-name") or
-                                   container.select_one(".company") or
-                                   container.select_one(".comp-name a") or
-                                   container.select_one("[data-automation='jobCompany']"))
-                    
-                    location_elem = (container.select_one(".loc") or
-                                    container.select_one(".location") or
-                                    container.select_one(".loc a") or
-                                    container.select_one("[data-automation='jobLocation']"))
-                    
-                    experience_elem = (container.select_one(".exp") or
-                                      container.select_one(".experience") or
-                                      container.select_one(".expwdth"))
-                    
-                    salary_elem = (container.select_one(".sal") or
-                                  container.select_one(".salary") or
-                                  container.select_one(".sal span"))
-
-                    # Extract text with fallbacks
-                    title = title_elem.get_text(strip=True) if title_elem else "N/A"
-                    company = company_elem.get_text(strip=True) if company_elem else "N/A"
-                    location = location_elem.get_text(strip=True) if location_elem else "N/A"
-                    experience = experience_elem.get_text(strip=True) if experience_elem else "N/A"
-                    salary = salary_elem.get_text(strip=True) if salary_elem else "N/A"
-                    
-                    # Get job URL
-                    job_url = ""
-                    if title_elem and title_elem.get('href'):
-                        job_url = title_elem.get('href')
-                        if not job_url.startswith('http'):
-                            job_url = "https://www.naukri.com" + job_url
-
-                    # Enhanced skills detection
-                    text_content = container.get_text(strip=True).lower()
-                    skills_keywords = ['python', 'django', 'flask', 'java', 'javascript', 'react', 'angular', 
-                                     'node', 'sql', 'mongodb', 'aws', 'docker', 'kubernetes', 'machine learning']
-                    skills = [s.capitalize() for s in skills_keywords if s in text_content]
-
-                    job_data = {
-                        "title": title,
-                        "company": company,
-                        "location": location,
-                        "experience": experience,
-                        "skills": skills,
-                        "salary": salary,
-                        "description": text_content[:300] + "..." if len(text_content) > 300 else text_content,
-                        "url": job_url,
-                        "source": "Naukri",
-                        "scraped_at": datetime.now().isoformat()
-                    }
-
-                    if title != "N/A" and company != "N/A":
-                        self.jobs.append(job_data)
-                        print(f"✅ Scraped: {title[:40]}... at {company} | {location}")
-
-                except Exception as e:
-                    print(f"⚠️ Error parsing job container: {e}")
-                    continue
+                    wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".jobTuple, .srp-jobtuple, [data-job-id], .tuple")))
+                except TimeoutException:
+                    print("❌ No job listings found with common selectors")
+                    snapshot_driver(self.driver, "naukri", url)
+                    return
+                
+                delta.take()
+                jobs = delta.results()
 
-            print(f"📊 Page completed: {len(job_containers)} containers processed")
+            # Embedded structured data has fuller fields than the cards; it may only cover the
+            # first batch of an infinite-scroll page, so keep the cards if they found more
+            structured = collect_structured_jobs(self.driver, "naukri", url)
+            if structured and len(structured) >= len(jobs):
+                print(f"🧾 Found {len(structured)} jobs in structured data")
+                jobs = [naukri_job_from_structured(found) for found in structured]
+            elif not delta.cards_taken:
+                # Nothing collected in-browser (e.g. replaying fixtures): parse the full page
+                jobs = parse_naukri_page(self.driver.page_source)
+            report_transfer(self.driver, url)
+            snapshot_driver(self.driver, "naukri", url, reason="sample" if jobs else "failure")
+            self.jobs.extend(jobs)
 
         except TimeoutException:
             print(f"❌ Timeout loading {url}")
+            snapshot_driver(self.driver, "naukri", url)
         except Exception as e:
             print(f"❌ Error scraping {url}: {e}")
 
     def scrape_multiple_pages(self, max_pages=3):
         """Scrape multiple pages with improved pagination"""
-        self.init_driver()
-        try:
-            for page in range(1, max_pages + 1):
-                if page == 1:
-                    current_url = self.base_url
-                else:
-                    # Naukri pagination patterns
-                    current_url = f"{self.base_url}-{page}"
-                
-                print(f"\n{'='*50}")
-                print(f"📖 Scraping Page {page}: {current_url}")
-                print(f"{'='*50}")
-                
-                self.scrape_page(current_url)
-                
-                # Random delay between pages
-                delay = random.uniform(8, 12)
-                print(f"⏳ Waiting {delay:.1f} seconds before next page...")
-                time.sleep(delay)
-                
-        except Exception as e:
-            print(f"❌ Error in multi-page scraping: {e}")
-        finally:
-            if self.driver:
-                self.driver.quit()
-                print("🚪 Browser closed")
+        # Resume from the frontier: jobs from pages finished by an earlier run are reloaded
+        self.jobs.extend(self.frontier.results(site="naukri", base_url=self.base_url))
+        for page in range(1, max_pages + 1):
+            if page == 1:
+                current_url = self.base_url
+            else:
+                # Naukri pagination patterns
+                current_url = f"{self.base_url}-{page}"
+            self.frontier.add("naukri", self.base_url, page, current_url)
+        # Same rule as scrap_website3: done pages and pages out of retries are skipped
+        pages_to_scrape = [(page, url) for site, base_url, page, url in self.frontier.pending()
+                           if site == "naukri" and base_url == self.base_url and page <= max_pages]
+        skipped = max_pages - len(pages_to_scrape)
+        if skipped:
+            print(f"⏭️ {skipped} page(s) already scraped or out of retries, skipping")
+        
+        if not pages_to_scrape:
+            return
+        
+        # One warm browser serves every page; it goes back to the pool afterwards
+        with get_driver_pool(init_driver).lease("naukri") as self.driver:
+            try:
+                for page, current_url in pages_to_scrape:
+                    print(f"\n{'='*50}")
+                    print(f"📖 Scraping Page {page}: {current_url}")
+                    print(f"{'='*50}")
+                    
+                    # Pacing between pages is handled by the per-domain rate limiter
+                    jobs_before = len(self.jobs)
+                    self.scrape_page(current_url)
+                    page_jobs = self.jobs[jobs_before:]
+                    if page_jobs:
+                        self.frontier.mark_done("naukri", self.base_url, page, page_jobs)
+                    else:
+                        self.frontier.mark_failed("naukri", self.base_url, page, "no jobs scraped")
+                    
+            except Exception as e:
+                print(f"❌ Error in multi-page scraping: {e}")
+        self.driver = None
 
     def save_to_csv(self):
         if self.jobs:
-            df = pd.DataFrame(self.jobs)
+            df = normalize_jobs(pd.DataFrame(self.jobs))
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"naukri_jobs_{timestamp}.csv"
             df.to_csv(filename, index=False, encoding='utf-8')
             print(f"\n🎉 Successfully saved {len(self.jobs)} jobs to {filename}")
             
+            # The crawl is exported, so the next run starts from a clean frontier
+            self.frontier.reset()
+            
             # Print summary
             print(f"\n📈 Summary:")
             print(f"   Total jobs: {len(self.jobs)}")
@@ -0,0 +1,167 @@
+# normalize.py
+import re
+from datetime import datetime
+from typing import Optional
+
+import pandas as pd
+
+NUMBER = r"\d[\d,]*(?:\.\d+)?"
+
+# "5 - 7 Years", "3-5 yrs", "2 to 4 years"; matched anywhere, so text that ran
+# into a neighbouring field ("Pune5 - 7  YearsAs per Industry Standards") still parses
+EXP_RANGE_RE = rf"(?P<low>{NUMBER})\s*(?:-|–|to)\s*(?P<high>{NUMBER})\s*\+?\s*(?:yrs?|years?)"
+EXP_SINGLE_RE = rf"(?P<low>{NUMBER})\s*(?P<plus>\+)?\s*(?:yrs?|years?)"
+EXP_FRESHER_RE = r"(?P<fresher>\bfresher|\bentry[\s-]?level|\bno experience)"
+# The phrase Glassdoor used to copy into "experience" from the job description; only
+# consulted when the description has no range or "N years" that EXP_*_RE understand
+EXP_DESCRIPTION_RE = r"(\d+[\s-]?years?|entry level|senior|mid[\s-]?level)"
+
+CURRENCY_RE = r"(?P<currency>₹|rs\.?|inr|\$|usd|€|eur|£|gbp)"
+CURRENCY_CODES = {"₹": "INR", "rs": "INR", "rs.": "INR", "inr": "INR", "$": "USD", "usd": "USD",
+                  "€": "EUR", "eur": "EUR", "£": "GBP", "gbp": "GBP"}
+
+AMOUNT_UNIT = r"k\b|l\b|lpa\b|lakhs?\b|lacs?\b|cr\b|crores?\b"
+SALARY_RANGE_RE = (rf"(?P<low>{NUMBER})\s*(?P<low_unit>{AMOUNT_UNIT})?\s*(?:-|–|to)\s*"
+                   rf"{CURRENCY_RE[:-1]})?\s*(?P<high>{NUMBER})\s*(?P<high_unit>{AMOUNT_UNIT})?")
+SALARY_SINGLE_RE = rf"(?P<low>{NUMBER})\s*(?P<low_unit>{AMOUNT_UNIT})?"
+SALARY_PERIOD_RE = (r"(?P<period>lpa|p\.?\s?a\b|per annum|annum|annual|yearly|a year|per year|/\s*year|/\s*yr"
+                    r"|monthly|a month|per month|/\s*month|/\s*mo\b|p\.?\s?m\b"
+                    r"|hourly|an hour|per hour|/\s*hour|/\s*hr)")
+
+# k = thousand, l/lpa/lakh/lac = lakh, c = crore; keyed on the unit's first letter
+UNIT_MULTIPLIERS = {"k": 1e3, "l": 1e5, "c": 1e7}
+# Amounts are reported per year
+PERIOD_MULTIPLIERS = {"year": 1, "month": 12, "hour": 2080}
+
+POSTED_RELATIVE_RE = (r"(?P<n>\d+)\s*\+?\s*(?P<unit>minutes?|mins?|hours?|hrs?|h\b|days?|d\b|weeks?|w\b"
+                      r"|months?|mo\b|years?|y\b)")
+POSTED_TODAY_RE = r"just posted|today|just now|few hours|few minutes|hour ago"
+POSTED_ISO_RE = r"(?P<date>\d{4}-\d{2}-\d{2})"
+# Days per relative unit, keyed on the unit's first letter ("mo" is told apart from minutes below)
+UNIT_DAYS = {"h": 0, "d": 1, "w": 7, "m": 30, "y": 365}
+
+
+def _text(df: pd.DataFrame, column: str) -> pd.Series:
+    if column not in df:
+        return pd.Series("", index=df.index, dtype="object")
+    return df[column].fillna("").astype(str)
+
+
+def _number(values: pd.Series) -> pd.Series:
+    return pd.to_numeric(values.str.replace(",", "", regex=False), errors="coerce")
+
+
+def normalize_experience(text: pd.Series) -> pd.DataFrame:
+    """exp_min / exp_max in years from experience strings ("5 - 7 Years", "3+ yrs", "Fresher")."""
+    ranged = text.str.extract(EXP_RANGE_RE, flags=re.I)
+    single = text.str.extract(EXP_SINGLE_RE, flags=re.I)
+    fresher = text.str.extract(EXP_FRESHER_RE, flags=re.I)["fresher"].notna()
+
+    exp_min = _number(ranged["low"]).fillna(_number(single["low"]))
+    # "3+ yrs" has a floor but no ceiling
+    exp_max = _number(ranged["high"]).fillna(_number(single["low"]).where(single["plus"].isna()))
+    exp_min = exp_min.mask(exp_min.isna() & fresher, 0)
+    exp_max = exp_max.mask(exp_max.isna() & fresher, 0)
+    return pd.DataFrame({"exp_min": exp_min, "exp_max": exp_max})
+
+
+def _described_experience(description: pd.Series) -> pd.Series:
+    """The experience phrase in each description, preferring numbers over seniority words.
+
+    "Senior Engineer 5-8 years" yields "5-8 years", not "Senior".
+    """
+    phrase = description.str.extract(rf"(?P<phrase>{EXP_RANGE_RE})", flags=re.I)["phrase"]
+    phrase = phrase.fillna(description.str.extract(rf"(?P<phrase>{EXP_SINGLE_RE})", flags=re.I)["phrase"])
+    return phrase.fillna(description.str.extract(EXP_DESCRIPTION_RE, flags=re.I)[0])
+
+
+def normalize_salary(text: pd.Series) -> pd.DataFrame:
+    """salary_min / salary_max per year, plus currency and the quoted period.
+
+    Understands "₹5,00,000 - ₹8,00,000 a year", "3-6 Lacs P.A.", "12 LPA",
+    "$50K - $70K", "₹25,000 a month" and the "INR 500000-800000 / year" form
+    structured data is flattened to. Lakh amounts with no currency are INR;
+    amounts with no period are taken as annual.
+    """
+    lowered = text.str.lower()
+    ranged = lowered.str.extract(SALARY_RANGE_RE)
+    single = lowered.str.extract(SALARY_SINGLE_RE)
+    currency = lowered.str.extract(CURRENCY_RE)["currency"].map(CURRENCY_CODES)
+    period = lowered.str.extract(SALARY_PERIOD_RE)["period"]
+
+    has_range = ranged["low"].notna()
+    low = _number(ranged["low"]).fillna(_number(single["low"]))
+    high = _number(ranged["high"]).fillna(_number(single["low"]))
+    # "3-6 Lacs": the unit written once after the range applies to both ends
+    low_unit = ranged["low_unit"].fillna(ranged["high_unit"]).where(has_range, single["low_unit"])
+    high_unit = ranged["high_unit"].fillna(ranged["low_unit"]).where(has_range, single["low_unit"])
+    low = low * low_unit.str[0].map(UNIT_MULTIPLIERS).fillna(1)
+    high = high * high_unit.str[0].map(UNIT_MULTIPLIERS).fillna(1)
+
+    # A bare number is only a salary when a currency or unit says so
+    priced = currency.notna() | low_unit.notna() | high_unit.notna()
+    low, high = low.where(priced), high.where(priced)
+
+    in_lakhs = low_unit.str.startswith("l", na=False) | high_unit.str.startswith("l", na=False)
+    currency = currency.mask(currency.isna() & in_lakhs, "INR")
+
+    period = period.str.replace(r"[^a-z]", "", regex=True)
+    period = period.replace({"lpa": "year", "pa": "year", "perannum": "year", "annum": "year", "annual": "year",
+                             "yearly": "year", "ayear": "year", "peryear": "year", "yr": "year",
+                             "monthly": "month", "amonth": "month", "permonth": "month", "mo": "month",
+                             "pm": "month", "hourly": "hour", "anhour": "hour", "perhour": "hour", "hr": "hour"})
+    period = period.where(low.isna(), period.fillna("year")).where(low.notna())
+    per_year = period.map(PERIOD_MULTIPLIERS).fillna(1)
+
+    return pd.DataFrame({
+        "salary_min": (low * per_year).round(),
+        "salary_max": (high * per_year).round(),
+        "salary_currency": currency.where(low.notna()),
+        "salary_period": period,
+    })
+
+
+def normalize_posted(text: pd.Series, scraped_at: pd.Series) -> pd.Series:
+    """Absolute posting date from "3 days ago", "30+ Days Ago", "5d", "Just posted" or an ISO date."""
+    lowered = text.str.lower()
+    relative = lowered.str.extract(POSTED_RELATIVE_RE)
+    unit = relative["unit"].str[0].where(~relative["unit"].str.startswith("mi", na=False), "h")
+    days = _number(relative["n"]) * unit.map(UNIT_DAYS)
+    days = days.mask(days.isna() & lowered.str.contains(POSTED_TODAY_RE, regex=True), 0)
+
+    posted_at = (scraped_at - pd.to_timedelta(days, unit="D")).dt.normalize()
+    absolute = pd.to_datetime(text.str.extract(POSTED_ISO_RE)["date"], format="%Y-%m-%d", errors="coerce")
+    return absolute.fillna(posted_at)
+
+
+def normalize_jobs(df: pd.DataFrame, experience: str = "experience", salary: str = "salary",
+                   posted: str = "posted_date", description: str = "description",
+                   now: Optional[datetime] = None) -> pd.DataFrame:
+    """Adds typed exp_min, exp_max, salary_min, salary_max, salary_currency, salary_period and posted_at columns.
+
+    Works column-at-a-time with Series.str.extract, so a whole scrape is
+    normalised in a handful of regex passes instead of one per job. The raw
+    text columns are kept. An experience cell that names no experience is
+    filled from the description first. Relative posting dates count back from
+    each row's scraped_at (or now).
+    """
+    if df.empty:
+        return df
+    df = df.copy()
+
+    if description in df:
+        exp_text = _text(df, experience)
+        from_description = _described_experience(_text(df, description))
+        unstated = exp_text.isin(["", "N/A", "Not specified"]) & from_description.notna()
+        df[experience] = exp_text.mask(unstated, from_description)
+
+    df[["exp_min", "exp_max"]] = normalize_experience(_text(df, experience))
+    salary_columns = normalize_salary(_text(df, salary))
+    for column in salary_columns:
+        df[column] = salary_columns[column]
+
+    base = pd.Series(pd.Timestamp(now or datetime.now()), index=df.index)
+    if "scraped_at" in df:
+        base = pd.to_datetime(df["scraped_at"], errors="coerce", format="ISO8601").fillna(base)
+    df["posted_at"] = normalize_posted(_text(df, posted), base)
+    return df
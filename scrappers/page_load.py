@@ -0,0 +1,246 @@
+# page_load.py
+"""Page-load strategy and per-site readiness predicates for the Selenium scrapers.
+
+Chrome's default "normal" strategy makes driver.get() wait for every
+subresource, while the scrapers only need the job cards. Drivers are
+created with the "eager" strategy instead (SCRAPER_PAGE_LOAD_STRATEGY),
+and open_page() returns as soon as the page's readiness predicate holds,
+stopping whatever is still loading.
+
+Running the module compares strategies on recorded pages:
+
+    python page_load.py                             # normal vs eager vs none
+    python page_load.py --strategies normal eager --repeat 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from record_replay import FixtureStore, ReplayDriver
+from rate_limiter import domain_of
+
+STRATEGIES = ("normal", "eager", "none")
+DEFAULT_STRATEGY = "eager"
+
+# Readiness predicate: at least min_count matches in the document the navigation opened.
+# Under "none", driver.get() can return before the old document is replaced, so the old
+# one is marked stale first and never counts.
+MARK_STALE_JS = "window.__scraperStale = true;"
+READY_JS = """
+return !window.__scraperStale && document.readyState !== 'loading'
+    && document.querySelectorAll(arguments[0]).length >= arguments[1];
+"""
+STOP_LOADING_JS = "window.stop();"
+
+
+def load_strategy() -> str:
+    strategy = os.getenv("SCRAPER_PAGE_LOAD_STRATEGY", DEFAULT_STRATEGY).lower()
+    return strategy if strategy in STRATEGIES else DEFAULT_STRATEGY
+
+
+def stop_loading_enabled() -> bool:
+    return os.getenv("SCRAPER_STOP_LOADING", "on").lower() not in ("off", "0", "false")
+
+
+def apply_load_strategy(options, strategy: Optional[str] = None):
+    """Set Chrome's page-load strategy; call before webdriver.Chrome(options=...)."""
+    options.page_load_strategy = strategy or load_strategy()
+    return options
+
+
+def wait_until_ready(driver, selector: str, min_count: int = 1, timeout: float = 30):
+    """Block until selector matches min_count elements; raises TimeoutException otherwise."""
+    # Script calls can fail while a navigation is committing; keep polling through them
+    WebDriverWait(driver, timeout, poll_frequency=0.1, ignored_exceptions=(WebDriverException,)).until(
+        lambda d: d.execute_script(READY_JS, selector, min_count)
+    )
+
+
+def open_page(driver, url: str, ready: str, min_count: int = 1, timeout: float = 30, stop: bool = True) -> float:
+    """Navigate to url and return once the `ready` selector matches; returns seconds taken.
+
+    With a non-normal strategy, loading is then stopped (window.stop()) so
+    leftover subresources do not compete with the scrape. Pass stop=False
+    for pages that still need their scripts afterwards, e.g. a "Show more"
+    button that only works once the page has hydrated. Raises
+    TimeoutException when the predicate does not hold within timeout.
+    """
+    start = time.perf_counter()
+    if isinstance(driver, ReplayDriver):
+        # Recorded snapshots are complete pages: nothing to wait for
+        driver.get(url)
+        return 0.0
+    try:
+        driver.execute_script(MARK_STALE_JS)
+    except WebDriverException:
+        pass
+    driver.get(url)
+    wait_until_ready(driver, ready, min_count, timeout)
+    # Under "normal" the page has already finished loading; nothing is left to stop
+    if stop and stop_loading_enabled() and driver.capabilities.get("pageLoadStrategy") != "normal":
+        try:
+            driver.execute_script(STOP_LOADING_JS)
+        except WebDriverException:
+            pass
+    return time.perf_counter() - start
+
+
+# A/B timing report
+
+def ready_selector(url: str) -> str:
+    """The readiness predicate each scraper uses for a page like url, from their own configs."""
+    domain = domain_of(url)
+    if domain.endswith("indeed.com"):
+        from indeed_scraper import SITE_CONFIG
+        return SITE_CONFIG["indeed"]["selectors"]["wait_for"]
+    if domain.endswith("naukri.com"):
+        from naukri_scraper import NAUKRI_CONTAINER_SELECTOR
+        return NAUKRI_CONTAINER_SELECTOR
+    if domain.startswith("glassdoor."):
+        from glassdoor_scraper import SITE_CONFIG
+        selectors = SITE_CONFIG["glassdoor"]["selectors"]
+        return selectors["wait_for_search"] if "SRCH" in url else selectors["wait_for_detail"]
+    return "body"
+
+
+class _FixtureHandler(BaseHTTPRequestHandler):
+    pages: List[bytes] = []
+
+    def do_GET(self):
+        try:
+            body = self.pages[int(self.path.strip("/").split("?")[0])]
+        except (ValueError, IndexError):
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _with_base(html: str, url: str) -> bytes:
+    # Relative subresources should load from the original site, as they did when recorded
+    base = f'<base href="{url}">'
+    lowered = html[:4096].lower()
+    index = lowered.find("<head")
+    if index >= 0:
+        index = html.index(">", index) + 1
+        html = html[:index] + base + html[index:]
+    else:
+        html = base + html
+    return html.encode("utf-8")
+
+
+def _report_driver(strategy: str):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from driver_profile import apply_blocking, apply_chrome_options
+
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    apply_chrome_options(options)
+    apply_load_strategy(options, strategy)
+    driver = webdriver.Chrome(options=options)
+    return apply_blocking(driver)
+
+
+def time_strategy(strategy: str, pages: List[tuple], base: str, repeat: int, timeout: float) -> Dict[str, List[float]]:
+    """Seconds until each page is ready under strategy; a timed-out load is left out."""
+    timings: Dict[str, List[float]] = {}
+    driver = _report_driver(strategy)
+    try:
+        for i, (url, _) in enumerate(pages):
+            ready = ready_selector(url)
+            for _ in range(repeat):
+                # Start each load from a blank page so no run reuses the previous document
+                driver.get("about:blank")
+                try:
+                    elapsed = open_page(driver, f"{base}/{i}", ready, timeout=timeout)
+                except WebDriverException:
+                    print(f"⚠️ {strategy}: {url} not ready within {timeout:.0f}s")
+                    continue
+                timings.setdefault(url, []).append(elapsed)
+    finally:
+        driver.quit()
+    return timings
+
+
+def print_report(results: Dict[str, Dict[str, List[float]]], urls: List[str]):
+    strategies = list(results)
+    print(f"\n{'page':<50}" + "".join(f"{s + ' ms':>12}" for s in strategies))
+    for url in urls:
+        cells = []
+        for strategy in strategies:
+            runs = results[strategy].get(url)
+            cells.append(f"{statistics.median(runs) * 1000:>12.0f}" if runs else f"{'-':>12}")
+        print(f"{url[:49]:<50}" + "".join(cells))
+
+    baseline = results.get("normal")
+    print()
+    for strategy in strategies:
+        runs = results[strategy]
+        medians = [statistics.median(r) for r in runs.values()]
+        if not medians:
+            print(f"⏱️ {strategy:<7} no page became ready")
+            continue
+        line = f"⏱️ {strategy:<7} mean {statistics.mean(medians) * 1000:.0f} ms over {len(medians)} pages"
+        if baseline and strategy != "normal":
+            # Compare only pages that became ready under both strategies
+            shared = [url for url in runs if url in baseline]
+            if shared:
+                speedup = (sum(statistics.median(baseline[u]) for u in shared)
+                           / sum(statistics.median(runs[u]) for u in shared))
+                line += f", {speedup:.2f}x vs normal"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", help="fixture directory (defaults to SCRAPER_FIXTURE_DIR or ./fixtures)")
+    parser.add_argument("--strategies", nargs="*", default=list(STRATEGIES), choices=STRATEGIES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=30)
+    args = parser.parse_args(argv)
+
+    store = FixtureStore(args.fixtures)
+    # First snapshot per URL: later ones were taken after scrolling or clicking
+    first: Dict[str, str] = {}
+    for _, url, body in store.entries("page"):
+        first.setdefault(url, body.decode("utf-8", errors="replace"))
+    pages = list(first.items())
+    if not pages:
+        print("❌ No recorded pages. Record some first with SCRAPER_FIXTURE_MODE=record.")
+        return 1
+
+    _FixtureHandler.pages = [_with_base(html, url) for url, html in pages]
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FixtureHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    print(f"🧪 Timing {len(pages)} recorded pages under {', '.join(args.strategies)} ({args.repeat} runs each)")
+
+    results = {}
+    try:
+        for strategy in args.strategies:
+            results[strategy] = time_strategy(strategy, pages, base, args.repeat, args.timeout)
+    finally:
+        server.shutdown()
+    print_report(results, [url for url, _ in pages])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+# pagination.py
+import asyncio
+import json
+import math
+import os
+import threading
+from typing import Callable, Dict, List, Optional
+
+from async_fetch import AsyncFetcher
+from rate_limiter import domain_of
+
+DEFAULT_STATS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".pagination_stats.json")
+DEFAULT_LOOKAHEAD = 3
+MAX_LOOKAHEAD = 8
+# Weight of the newest run when updating a site's average result depth
+DEPTH_SMOOTHING = 0.3
+
+
+def curpage_url(base_url: str, page: int) -> str:
+    """TimesJobs-style pagination: append &curPage=N."""
+    return f"{base_url}&curPage={page}"
+
+
+class PaginationStats:
+    """Remembers how deep each site's result sets usually go."""
+
+    def __init__(self, path: str = DEFAULT_STATS_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.depths: Dict[str, float] = json.load(f)
+        except (OSError, ValueError):
+            self.depths = {}
+
+    def lookahead(self, site: str) -> int:
+        """Pages to keep in flight: the usual depth plus the empty page that ends it."""
+        depth = self.depths.get(site)
+        if depth is None:
+            return DEFAULT_LOOKAHEAD
+        return max(1, min(MAX_LOOKAHEAD, math.ceil(depth) + 1))
+
+    def record(self, site: str, depth: int):
+        with self._lock:
+            previous = self.depths.get(site)
+            self.depths[site] = depth if previous is None else (1 - DEPTH_SMOOTHING) * previous + DEPTH_SMOOTHING * depth
+            try:
+                with open(self.path, "w", encoding="utf-8") as f:
+                    json.dump(self.depths, f, indent=2)
+            except OSError as e:
+                print(f"⚠️ Could not save pagination stats: {e}")
+
+
+def _fingerprint(jobs: List[dict]) -> frozenset:
+    return frozenset((job.get("url"), job.get("title")) for job in jobs)
+
+
+async def paginate(fetcher: AsyncFetcher, base_url: str, parse: Callable[[bytes, str], List[dict]],
+                   max_pages: int, page_url: Callable[[str, int], str] = curpage_url,
+                   stats: Optional[PaginationStats] = None) -> List[List[dict]]:
+    """Fetch pages of one search speculatively, stopping at the first empty or repeated page.
+
+    Up to `lookahead` pages, counting the one being awaited, are kept in
+    flight; as soon as the end of results is seen, the outstanding requests
+    are cancelled. A request cancelled while waiting for its rate-limit
+    slot gives the token back.
+    """
+    site = domain_of(base_url)
+    lookahead = stats.lookahead(site) if stats else DEFAULT_LOOKAHEAD
+    in_flight: Dict[int, asyncio.Task] = {}
+    next_to_launch = 1
+    pages: List[List[dict]] = []
+    seen = set()
+
+    def launch_up_to(limit: int):
+        nonlocal next_to_launch
+        while next_to_launch <= min(limit, max_pages):
+            url = page_url(base_url, next_to_launch)
+            in_flight[next_to_launch] = asyncio.ensure_future(fetcher.fetch(url))
+            next_to_launch += 1
+
+    try:
+        for page in range(1, max_pages + 1):
+            launch_up_to(page + lookahead - 1)
+            url = page_url(base_url, page)
+            body = await in_flight.pop(page)
+            jobs = parse(body, url) if body else []
+            fingerprint = _fingerprint(jobs)
+            if not jobs or fingerprint in seen:
+                print(f"❌ No new jobs at page {page}. Stopping this search.")
+                break
+            seen.add(fingerprint)
+            pages.append(jobs)
+            print(f"✅ Found {len(jobs)} jobs on page {page}")
+    finally:
+        for task in in_flight.values():
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight.values(), return_exceptions=True)
+
+    if stats:
+        stats.record(site, len(pages))
+    return pages
+
+
+async def _paginate_all(base_urls, parse, max_pages, page_url, stats, fetcher_kwargs):
+    async with AsyncFetcher(**fetcher_kwargs) as fetcher:
+        results = await asyncio.gather(*(
+            paginate(fetcher, base_url, parse, max_pages, page_url, stats) for base_url in base_urls
+        ))
+    return dict(zip(base_urls, results))
+
+
+def paginate_all(base_urls: List[str], parse: Callable[[bytes, str], List[dict]], max_pages: int,
+                 page_url: Callable[[str, int], str] = curpage_url, **fetcher_kwargs) -> Dict[str, List[List[dict]]]:
+    """Run speculative pagination for every search at once; returns pages of jobs per base URL."""
+    stats = PaginationStats()
+    return asyncio.run(_paginate_all(base_urls, parse, max_pages, page_url, stats, fetcher_kwargs))
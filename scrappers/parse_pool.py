@@ -0,0 +1,104 @@
+# parse_pool.py
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from typing import Any, Callable, Hashable, List, Optional, Tuple
+
+# Worker processes for parsing; 0 parses inline on the calling thread
+DEFAULT_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+
+def parse_workers() -> int:
+    return int(os.getenv("SCRAPER_PARSE_WORKERS", DEFAULT_WORKERS))
+
+
+class ParsePool:
+    """Runs page parsers in worker processes while the driver loads the next page.
+
+    Hand each rendered page to submit() and move straight on; parsed results
+    come back from ready() (whatever has finished, without blocking) or
+    results() (everything, waiting as needed). Parsers must be module-level
+    functions taking picklable arguments, e.g. parse_indeed_page(html, url, site).
+    Workers are spawned, so scripts using the pool need an `if __name__ == "__main__":` guard.
+
+        with ParsePool() as pool:
+            for url in urls:
+                driver.get(url)
+                pool.submit(parse_indeed_page, driver.page_source, url, site, key=url)
+            for url, jobs in pool.results():
+                ...
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = parse_workers() if workers is None else workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._pending: List[Tuple[Hashable, Future]] = []
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                # Created lazily, often from a browser worker thread while other threads hold
+                # locks; forking then can deadlock the child, so start workers fresh instead
+                self._executor = ProcessPoolExecutor(max_workers=self.workers,
+                                                     mp_context=multiprocessing.get_context("spawn"))
+            return self._executor
+
+    def submit(self, parse: Callable, *args, key: Hashable = None) -> Future:
+        """Queue parse(*args); key is handed back alongside its result."""
+        if self.workers <= 0:
+            future = Future()
+            try:
+                future.set_result(parse(*args))
+            except Exception as e:
+                future.set_exception(e)
+        else:
+            future = self._get_executor().submit(parse, *args)
+        self._pending.append((key, future))
+        return future
+
+    def parse(self, parse: Callable, *args):
+        """Run parse(*args) in a worker process and wait for it.
+
+        For callers that already run on their own thread (one per browser),
+        so they can share the pool without going through submit()/results().
+        """
+        if self.workers <= 0:
+            return parse(*args)
+        return self._get_executor().submit(parse, *args).result()
+
+    def _collect(self, finished) -> List[Tuple[Hashable, Any]]:
+        done, pending = [], []
+        for key, future in self._pending:
+            (done if future in finished else pending).append((key, future))
+        self._pending = pending
+        results = []
+        for key, future in done:
+            try:
+                results.append((key, future.result()))
+            except Exception as e:
+                print(f"⚠️ Error parsing {'page' if key is None else key}: {e}")
+                results.append((key, None))
+        return results
+
+    def ready(self) -> List[Tuple[Hashable, Any]]:
+        """(key, result) for each parse that has finished since the last call; None if it raised."""
+        return self._collect({future for _, future in self._pending if future.done()})
+
+    def results(self) -> List[Tuple[Hashable, Any]]:
+        """(key, result) for every outstanding parse, in submission order, waiting for them."""
+        wait([future for _, future in self._pending])
+        return self._collect({future for _, future in self._pending})
+
+    def close(self):
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
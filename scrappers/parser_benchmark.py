@@ -0,0 +1,249 @@
+# parser_benchmark.py
+"""Parser throughput benchmarks over recorded listing pages.
+
+Feeds the pages captured with SCRAPER_FIXTURE_MODE=record through each
+scraper's extraction routine and reports pages/sec, microseconds per job
+container and peak Python-heap memory, compared against a stored baseline.
+The heap figure comes from tracemalloc, which does not see memory that
+lxml or selectolax allocate in C, so it understates those backends.
+
+    python parser_benchmark.py                    # run and compare
+    python parser_benchmark.py --save-baseline    # run and store as the new baseline
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from bs4 import BeautifulSoup
+
+from html_parser import backend_name, make_soup
+from rate_limiter import domain_of
+from record_replay import FixtureStore
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(HERE, "..", "reflection_agent"))
+
+DEFAULT_BASELINE_PATH = os.path.join(HERE, "parser_baseline.json")
+# Slowdown versus baseline reported as a regression
+REGRESSION_THRESHOLD = 0.10
+
+
+class Benchmark:
+    """One extraction routine plus the fixtures it applies to."""
+
+    def __init__(self, name: str, load: Callable[[], Callable[[str, str], list]],
+                 matches: Callable[[str, str], bool], count_containers: Callable[[BeautifulSoup, str], int]):
+        self.name = name
+        self.load = load
+        self.matches = matches
+        self.count_containers = count_containers
+
+
+def _timesjobs():
+    from timesjobs_scraper import parse_timesjobs_page
+    return parse_timesjobs_page
+
+
+def _naukri():
+    from naukri_scraper import parse_naukri_page
+    return lambda html, url: parse_naukri_page(html)
+
+
+def _glassdoor_search():
+    from glassdoor_scraper import parse_search_page
+    return lambda html, url: parse_search_page(html, url)
+
+
+def _glassdoor_detail():
+    from glassdoor_scraper import SITE_CONFIG, parse_detail_html
+    selectors = SITE_CONFIG["glassdoor"]["selectors"]
+    return lambda html, url: parse_detail_html(html, selectors, {"url": url, "skills": [], "snippet": ""})
+
+
+def _indeed():
+    from indeed_scraper import parse_indeed_page
+    return parse_indeed_page
+
+
+def _scrap_website3():
+    from scrap_website3 import SITE_CONFIGS, parse_site_page
+
+    def parse(html, url):
+        site = _website3_site(url)
+        return parse_site_page(html, site, url) if site in SITE_CONFIGS else []
+    return parse
+
+
+def _foundit():
+    from foundit_scraper import parse_selenium_jobs
+    return lambda html, url: parse_selenium_jobs(make_soup(html), "", "")
+
+
+def _website3_site(url: str) -> Optional[str]:
+    domain = domain_of(url)
+    for site in ("naukri", "indeed", "upwork", "glassdoor", "freelancer", "freshersworld", "findit"):
+        if site in domain:
+            return site
+    return None
+
+
+def _website3_containers(soup, url: str) -> int:
+    from scrap_website3 import SITE_CONFIGS
+    selector = SITE_CONFIGS[_website3_site(url)]["selectors"]["job_container"]
+    return len(soup.select(selector))
+
+
+def _is_domain(*domains):
+    return lambda kind, url: any(domain_of(url).endswith(d) for d in domains)
+
+
+BENCHMARKS = [
+    Benchmark(
+        "timesjobs", _timesjobs, _is_domain("timesjobs.com"),
+        lambda soup, url: len(soup.find_all('div', {'data-jobid': True}))
+        or len(soup.find_all('div', class_=re.compile(r'srp|job|tuple'))),
+    ),
+    Benchmark(
+        "naukri", _naukri, _is_domain("naukri.com"),
+        lambda soup, url: len(soup.select(".jobTuple, .srp-jobtuple, [data-job-id], .tuple, .list")),
+    ),
+    Benchmark(
+        "glassdoor_search", _glassdoor_search,
+        lambda kind, url: domain_of(url).startswith("glassdoor.") and "SRCH" in url,
+        lambda soup, url: len(soup.select("li[data-qa='job-card-list'], article[data-qa='job-card'], "
+                                     "li[data-test='job-card-list'], article[data-test='job-card']")),
+    ),
+    Benchmark(
+        "glassdoor_detail", _glassdoor_detail,
+        lambda kind, url: domain_of(url).startswith("glassdoor.") and "SRCH" not in url,
+        lambda soup, url: 1,
+    ),
+    Benchmark(
+        "indeed", _indeed, _is_domain("indeed.com"),
+        lambda soup, url: len(soup.select("div[data-jk]")),
+    ),
+    Benchmark(
+        "scrap_website3", _scrap_website3,
+        lambda kind, url: kind == "page" and _website3_site(url) is not None,
+        lambda soup, url: _website3_containers(soup, url),
+    ),
+    Benchmark(
+        "foundit", _foundit, _is_domain("foundit.in"),
+        lambda soup, url: len([c for c in soup.find_all(['div', 'section'], class_=True)
+                          if any(k in ' '.join(c.get('class', [])).lower() for k in ['card', 'job', 'tuple'])]),
+    ),
+]
+
+
+def _quiet(parse, html, url):
+    # The scrapers print per job; keep that out of the measurement
+    with contextlib.redirect_stdout(io.StringIO()):
+        return parse(html, url)
+
+
+def run_benchmark(bench: Benchmark, parse: Callable[[str, str], list], pages: List[tuple], repeat: int) -> dict:
+    containers = sum(bench.count_containers(make_soup(html), url) for url, html in pages) or 1
+
+    _quiet(parse, pages[0][1], pages[0][0])  # warm-up
+    best = float("inf")
+    jobs = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        jobs = sum(len(_quiet(parse, html, url) or []) for url, html in pages)
+        best = min(best, time.perf_counter() - start)
+
+    peak = 0
+    for url, html in pages:
+        tracemalloc.start()
+        _quiet(parse, html, url)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    return {
+        "pages": len(pages),
+        "containers": containers,
+        "jobs": jobs,
+        "pages_per_sec": len(pages) / best if best else 0.0,
+        "us_per_container": best / containers * 1e6,
+        "peak_heap_kib": peak / 1024,
+    }
+
+
+def collect_pages(store: FixtureStore, bench: Benchmark) -> List[tuple]:
+    return [(url, body.decode("utf-8", errors="replace"))
+            for kind, url, body in store.entries() if bench.matches(kind, url)]
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict]) -> List[str]:
+    regressions = []
+    print(f"\n{'parser':<18}{'pages':>6}{'pages/s':>10}{'µs/cont':>10}{'heap KiB':>10}{'vs base':>10}")
+    for name, r in results.items():
+        delta = ""
+        base = baseline.get(name)
+        if base and base.get("pages_per_sec"):
+            change = r["pages_per_sec"] / base["pages_per_sec"] - 1
+            delta = f"{change:+.0%}"
+            if change < -REGRESSION_THRESHOLD:
+                regressions.append(name)
+        print(f"{name:<18}{r['pages']:>6}{r['pages_per_sec']:>10.1f}{r['us_per_container']:>10.1f}{r['peak_heap_kib']:>10.0f}{delta:>10}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--fixtures", help="fixture directory (defaults to SCRAPER_FIXTURE_DIR or ./fixtures)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="*", help="benchmark names to run")
+    args = parser.parse_args(argv)
+
+    print(f"🧪 HTML backend: {backend_name()}")
+    store = FixtureStore(args.fixtures)
+    results = {}
+    for bench in BENCHMARKS:
+        if args.only and bench.name not in args.only:
+            continue
+        pages = collect_pages(store, bench)
+        if not pages:
+            print(f"⏭️ {bench.name}: no recorded pages")
+            continue
+        # Loading can fail beyond ImportError, e.g. scrap_website3 builds its LLM client at import
+        try:
+            parse = bench.load()
+        except Exception as e:
+            print(f"⏭️ {bench.name}: skipped ({e})")
+            continue
+        results[bench.name] = run_benchmark(bench, parse, pages, args.repeat)
+
+    if not results:
+        print("❌ Nothing to benchmark. Record pages first with SCRAPER_FIXTURE_MODE=record.")
+        return 1
+
+    try:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    except (OSError, ValueError):
+        baseline = {}
+
+    regressions = compare(results, baseline)
+    if args.save_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"💾 Saved baseline to {args.baseline}")
+    elif regressions:
+        print(f"⚠️ Slower than baseline by more than {REGRESSION_THRESHOLD:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+# rate_limiter.py
+import asyncio
+import threading
+import time
+from typing import Dict, Tuple
+from urllib.parse import urlsplit
+
+# Per-domain budgets: (requests per second, burst size)
+DOMAIN_BUDGETS: Dict[str, Tuple[float, int]] = {
+    "m.timesjobs.com": (0.5, 2),
+    "naukri.com": (0.1, 1),
+    "indeed.com": (0.15, 1),
+    "glassdoor.co.in": (0.15, 1),
+    "glassdoor.com": (0.15, 1),
+    "foundit.in": (0.5, 1),
+}
+DEFAULT_BUDGET: Tuple[float, int] = (1.0, 2)
+
+
+def domain_of(url: str) -> str:
+    host = urlsplit(url).netloc.lower().split(':')[0]
+    return host[4:] if host.startswith('www.') else host
+
+
+class TokenBucket:
+    """Token bucket that hands out waits instead of fixed sleeps."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def refund(self):
+        """Give back a reserved token whose request was never sent."""
+        with self._lock:
+            self.tokens = min(self.burst, self.tokens + 1)
+
+    def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        wait = self.reserve()
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self.refund()
+                raise
+
+
+class RateLimiter:
+    """One token bucket per domain, created on first use."""
+
+    def __init__(self, budgets: Dict[str, Tuple[float, int]] = None, default: Tuple[float, int] = DEFAULT_BUDGET):
+        self.budgets = DOMAIN_BUDGETS if budgets is None else budgets
+        self.default = default
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str) -> TokenBucket:
+        domain = domain_of(url)
+        with self._lock:
+            if domain not in self._buckets:
+                rate, burst = self.budgets.get(domain, self.default)
+                self._buckets[domain] = TokenBucket(rate, burst)
+            return self._buckets[domain]
+
+    def acquire(self, url: str):
+        """Block until the URL's domain has budget for one more request."""
+        self.bucket(url).acquire()
+
+    async def acquire_async(self, url: str):
+        await self.bucket(url).acquire_async()
+
+
+_limiter = RateLimiter()
+
+
+def get_limiter() -> RateLimiter:
+    return _limiter
@@ -0,0 +1,248 @@
+# record_replay.py
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import Dict, List, Optional
+
+from response_cache import CachedResponse, normalize_url
+
+# off | record | replay
+FIXTURE_MODE = os.getenv("SCRAPER_FIXTURE_MODE", "off").lower()
+DEFAULT_FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+
+def recording() -> bool:
+    return FIXTURE_MODE == "record"
+
+
+def replaying() -> bool:
+    return FIXTURE_MODE == "replay"
+
+
+# Shared by every FixtureStore: two stores on one directory write the same index.json
+_index_lock = threading.Lock()
+
+
+class FixtureStore:
+    """Directory of captured HTTP bodies and page_source snapshots.
+
+    index.json maps "http:<url>" to one response and "page:<url>" to the
+    ordered page_source snapshots taken while that URL was loaded.
+    """
+
+    def __init__(self, root: str = None):
+        self.root = root or os.getenv("SCRAPER_FIXTURE_DIR", DEFAULT_FIXTURE_DIR)
+        self.index_path = os.path.join(self.root, "index.json")
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                self.index: Dict[str, list] = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+
+    def _write(self, key: str, seq: int, body: bytes) -> str:
+        os.makedirs(self.root, exist_ok=True)
+        name = f"{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}_{seq}.html"
+        with open(os.path.join(self.root, name), "wb") as f:
+            f.write(body)
+        return name
+
+    def _read(self, name: str) -> bytes:
+        with open(os.path.join(self.root, name), "rb") as f:
+            return f.read()
+
+    def _save_index(self):
+        os.makedirs(self.root, exist_ok=True)
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, indent=2, sort_keys=True)
+
+    # HTTP responses
+
+    def record_http(self, url: str, status_code: int, headers, body: bytes):
+        key = "http:" + normalize_url(url)
+        with _index_lock:
+            name = self._write(key, 0, body)
+            # Bodies are stored decoded, so transfer-level headers no longer apply
+            headers = {k: v for k, v in dict(headers).items()
+                       if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")}
+            self.index[key] = [{"url": url, "status": status_code, "headers": headers, "file": name}]
+            self._save_index()
+
+    def replay_http(self, url: str) -> Optional[CachedResponse]:
+        entries = self.index.get("http:" + normalize_url(url))
+        if not entries:
+            return None
+        entry = entries[0]
+        return CachedResponse(url, entry["status"], entry["headers"], self._read(entry["file"]))
+
+    # Selenium page_source snapshots
+
+    def start_page(self, url: str):
+        """Forget earlier snapshots of a URL before it is recorded again."""
+        with _index_lock:
+            self.index["page:" + normalize_url(url)] = []
+            self._save_index()
+
+    def record_page(self, url: str, html: str):
+        key = "page:" + normalize_url(url)
+        with _index_lock:
+            snapshots = self.index.setdefault(key, [])
+            name = self._write(key, len(snapshots), html.encode("utf-8"))
+            snapshots.append({"url": url, "file": name})
+            self._save_index()
+
+    def replay_pages(self, url: str) -> List[str]:
+        entries = self.index.get("page:" + normalize_url(url), [])
+        return [self._read(entry["file"]).decode("utf-8") for entry in entries]
+
+    def entries(self, kind: str = None):
+        """Yield (kind, url, body) for every stored fixture, e.g. for benchmarks."""
+        for key, items in sorted(self.index.items()):
+            entry_kind = key.split(":", 1)[0]
+            if kind and entry_kind != kind:
+                continue
+            for item in items:
+                yield entry_kind, item["url"], self._read(item["file"])
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> FixtureStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = FixtureStore()
+        return _store
+
+
+class _ReplayElement:
+    """Inert element returned by ReplayDriver lookups."""
+
+    def __init__(self, displayed: bool = True):
+        self._displayed = displayed
+        self.text = ""
+
+    def is_displayed(self):
+        return self._displayed
+
+    def is_enabled(self):
+        return self._displayed
+
+    def click(self):
+        pass
+
+    def get_attribute(self, name):
+        return None
+
+
+class ReplayDriver:
+    """Offline stand-in for a Chrome WebDriver that serves recorded page_source snapshots.
+
+    Each driver.get(url) rewinds to the first snapshot recorded for that URL;
+    every page_source read advances to the next one, so multi-step flows such
+    as "Show more jobs" see the same sequence of pages they saw when recorded.
+    """
+
+    def __init__(self, store: FixtureStore = None):
+        self.store = store or get_store()
+        self._history: List[str] = []
+        self._cursors: Dict[str, int] = {}
+        self._snapshots: Dict[str, List[str]] = {}
+
+    def get(self, url: str):
+        self._history.append(url)
+        self._snapshots.setdefault(url, self.store.replay_pages(url))
+        self._cursors[url] = 0
+        if not self._snapshots[url]:
+            print(f"⚠️ No recorded page for {url}")
+
+    def back(self):
+        if len(self._history) > 1:
+            self._history.pop()
+
+    @property
+    def current_url(self) -> str:
+        return self._history[-1] if self._history else "about:blank"
+
+    @property
+    def page_source(self) -> str:
+        snapshots = self._snapshots.get(self.current_url) or []
+        if not snapshots:
+            return "<html><head></head><body></body></html>"
+        cursor = self._cursors.get(self.current_url, 0)
+        self._cursors[self.current_url] = min(cursor + 1, len(snapshots) - 1)
+        return snapshots[cursor]
+
+    @property
+    def title(self) -> str:
+        snapshots = self._snapshots.get(self.current_url) or [""]
+        match = re.search(r"<title[^>]*>(.*?)</title>", snapshots[0], re.I | re.S)
+        return match.group(1).strip() if match else ""
+
+    def find_element(self, by=None, value=None):
+        return _ReplayElement()
+
+    def find_elements(self, by=None, value=None):
+        # Present but hidden, so popup loops see nothing to click
+        return [_ReplayElement(displayed=False)]
+
+    def execute_script(self, script, *args):
+        return None
+
+    def execute_async_script(self, script, *args):
+        return None
+
+    def execute_cdp_cmd(self, cmd, params=None):
+        return {}
+
+    def get_log(self, log_type):
+        return []
+
+    def delete_all_cookies(self):
+        pass
+
+    def set_page_load_timeout(self, seconds):
+        pass
+
+    def set_script_timeout(self, seconds):
+        pass
+
+    def quit(self):
+        pass
+
+
+class RecordingDriver:
+    """Wraps a real WebDriver and saves every page_source read to the fixture store."""
+
+    def __init__(self, driver, store: FixtureStore = None):
+        self._driver = driver
+        self._store = store or get_store()
+        self._history: List[str] = []
+
+    def get(self, url: str):
+        self._history.append(url)
+        self._store.start_page(url)
+        return self._driver.get(url)
+
+    def back(self):
+        if len(self._history) > 1:
+            self._history.pop()
+        return self._driver.back()
+
+    @property
+    def page_source(self) -> str:
+        html = self._driver.page_source
+        if self._history:
+            self._store.record_page(self._history[-1], html)
+        return html
+
+    def __getattr__(self, name):
+        return getattr(self._driver, name)
+
+
+def wrap_driver(driver):
+    """Return the driver wrapped for recording when SCRAPER_FIXTURE_MODE=record."""
+    return RecordingDriver(driver) if recording() else driver
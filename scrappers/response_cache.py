@@ -0,0 +1,193 @@
+# response_cache.py
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".http_cache.sqlite")
+# Seconds a cached page is served without asking the server
+DEFAULT_TTL = 30 * 60
+# Total body bytes kept on disk before least-recently-used pages are evicted
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+# Request headers that change the body a server sends, so they are part of the cache key
+VARY_HEADERS = ('Accept', 'Accept-Language')
+
+
+def normalize_url(url: str) -> str:
+    """Canonical cache key: lowercase scheme/host, sorted query, no fragment."""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if parts.scheme == 'https' and host.endswith(':443'):
+        host = host[:-4]
+    elif parts.scheme == 'http' and host.endswith(':80'):
+        host = host[:-3]
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), host, parts.path or '/', query, ''))
+
+
+def cache_key(url: str, request_headers: Optional[Dict[str, str]] = None) -> str:
+    """normalize_url(url) plus the VARY_HEADERS values the request was sent with."""
+    key = normalize_url(url)
+    lowered = {k.lower(): v for k, v in (request_headers or {}).items()}
+    varied = [f"{name.lower()}={lowered[name.lower()]}" for name in VARY_HEADERS if name.lower() in lowered]
+    # Normalized URLs never carry a fragment, so '#' cannot clash with the URL itself
+    return key + '#' + '&'.join(varied) if varied else key
+
+
+class CachedResponse:
+    """Minimal stand-in for requests.Response built from a cache row."""
+
+    def __init__(self, url: str, status_code: int, headers: Dict[str, str], content: bytes):
+        self.url = url
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self.content = content
+        self.from_cache = True
+
+    @property
+    def text(self) -> str:
+        return self.content.decode('utf-8', errors='replace')
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} for url: {self.url}")
+
+
+class CacheEntry:
+    def __init__(self, url, status_code, headers, body, fetched_at, ttl):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+        self.fetched_at = fetched_at
+        self.ttl = ttl
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() - self.fetched_at < self.ttl
+
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        lowered = {k.lower(): v for k, v in self.headers.items()}
+        if 'etag' in lowered:
+            headers['If-None-Match'] = lowered['etag']
+        if 'last-modified' in lowered:
+            headers['If-Modified-Since'] = lowered['last-modified']
+        return headers
+
+    def as_response(self) -> CachedResponse:
+        return CachedResponse(self.url, self.status_code, self.headers, self.body)
+
+
+class ResponseCache:
+    """Persistent HTTP response cache with TTLs, revalidation and LRU eviction."""
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttl: float = DEFAULT_TTL, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON responses(last_access)")
+        self._conn.commit()
+
+    def lookup(self, url: str, request_headers: Optional[Dict[str, str]] = None) -> Optional[CacheEntry]:
+        key = cache_key(url, request_headers)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, body, fetched_at FROM responses WHERE url = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE url = ?", (time.time(), key))
+            self._conn.commit()
+        status, headers, body, fetched_at = row
+        return CacheEntry(url, status, json.loads(headers), body, fetched_at, self.ttl)
+
+    def store(self, url: str, status_code: int, headers, body: bytes,
+              request_headers: Optional[Dict[str, str]] = None):
+        key = cache_key(url, request_headers)
+        now = time.time()
+        # Bodies are stored decoded, so transfer-level headers no longer apply
+        headers = {k: v for k, v in dict(headers).items()
+                   if k.lower() not in ('content-encoding', 'content-length', 'transfer-encoding')}
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (url, status, headers, body, size, fetched_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, status_code, json.dumps(headers), body, len(body), now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def refresh(self, url: str, headers=None, request_headers: Optional[Dict[str, str]] = None):
+        """Mark an entry fresh again after a 304 Not Modified."""
+        key = cache_key(url, request_headers)
+        now = time.time()
+        with self._lock:
+            if headers:
+                row = self._conn.execute("SELECT headers FROM responses WHERE url = ?", (key,)).fetchone()
+                if row:
+                    merged = json.loads(row[0])
+                    for name in ('ETag', 'Last-Modified', 'Cache-Control', 'Expires'):
+                        if name in headers:
+                            merged[name] = headers[name]
+                    self._conn.execute("UPDATE responses SET headers = ? WHERE url = ?", (json.dumps(merged), key))
+            self._conn.execute("UPDATE responses SET fetched_at = ?, last_access = ? WHERE url = ?", (now, now, key))
+            self._conn.commit()
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for url, size in self._conn.execute("SELECT url, size FROM responses ORDER BY last_access ASC").fetchall():
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> Optional[ResponseCache]:
+    """Shared cache instance, or None when disabled with SCRAPER_CACHE=off."""
+    global _cache
+    if os.getenv("SCRAPER_CACHE", "on").lower() in ("off", "0", "false"):
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache(
+                path=os.getenv("SCRAPER_CACHE_PATH", DEFAULT_CACHE_PATH),
+                ttl=float(os.getenv("SCRAPER_CACHE_TTL", DEFAULT_TTL)),
+            )
+        return _cache
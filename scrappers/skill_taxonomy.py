@@ -0,0 +1,156 @@
+# skill_taxonomy.py
+from collections import deque
+from typing import Dict, List, Tuple
+
+# Canonical skill id -> (display name, aliases). Aliases are matched
+# case-insensitively on word boundaries; the display name is always an alias.
+SKILL_TAXONOMY: Dict[str, Tuple[str, List[str]]] = {
+    "python": ("Python", ["python3"]),
+    "java": ("Java", ["core java", "java8", "java 8"]),
+    "javascript": ("JavaScript", ["js", "ecmascript", "es6"]),
+    "typescript": ("TypeScript", ["ts"]),
+    "react": ("React", ["react.js", "reactjs"]),
+    "angular": ("Angular", ["angularjs", "angular.js"]),
+    "node": ("Node.js", ["node", "nodejs"]),
+    "html": ("HTML", ["html5"]),
+    "css": ("CSS", ["css3"]),
+    "php": ("PHP", []),
+    "cpp": ("C++", ["cpp"]),
+    "csharp": ("C#", ["c sharp"]),
+    "dotnet": (".NET", ["dotnet", "asp.net"]),
+    "sql": ("SQL", []),
+    "mysql": ("MySQL", []),
+    "postgresql": ("PostgreSQL", ["postgres"]),
+    "mongodb": ("MongoDB", ["mongo"]),
+    "aws": ("AWS", ["amazon web services"]),
+    "docker": ("Docker", []),
+    "kubernetes": ("Kubernetes", ["k8s"]),
+    "django": ("Django", []),
+    "flask": ("Flask", []),
+    "spring": ("Spring", ["spring boot", "springboot"]),
+    "hibernate": ("Hibernate", []),
+    "rest_api": ("REST API", ["rest apis", "restful", "restful api", "restful apis"]),
+    "api": ("API", ["apis"]),
+    "graphql": ("GraphQL", []),
+    "microservices": ("Microservices", ["microservice"]),
+    "devops": ("DevOps", []),
+    "jenkins": ("Jenkins", []),
+    "git": ("Git", []),
+    "machine_learning": ("Machine Learning", ["ml"]),
+    "artificial_intelligence": ("Artificial Intelligence", ["ai"]),
+}
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _starts_token(text: str, start: int, word_start: bool) -> bool:
+    """Whether an alias can begin at text[start].
+
+    Aliases starting with a word character need a non-word character before
+    them. Ones starting with punctuation (".net") must also not follow a
+    word character, "@" or ".", so "hr@acme.net" is not a mention.
+    """
+    if start == 0:
+        return True
+    prev = text[start - 1]
+    return not _is_word_char(prev) and (word_start or prev not in "@.")
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton over every skill alias.
+
+    One scan of the text finds all aliases regardless of taxonomy size.
+    Matches must sit on word boundaries, so "java" is not found inside
+    "javascript"; overlapping matches resolve leftmost-longest, so
+    "rest api" does not also count as "api".
+    """
+
+    def __init__(self, taxonomy: Dict[str, Tuple[str, List[str]]]):
+        self.names = {}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[list] = [[]]
+        for skill_id, (name, aliases) in taxonomy.items():
+            self.names[skill_id] = name
+            for alias in {name.lower(), *(a.lower() for a in aliases)}:
+                self._add(alias, skill_id)
+        self._link()
+
+    def _add(self, pattern: str, skill_id: str):
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        # The end boundary is only checked where the alias itself ends with a word character
+        self._out[node].append((len(pattern), skill_id, _is_word_char(pattern[0]), _is_word_char(pattern[-1])))
+
+    def _link(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def scan(self, text: str) -> List[Tuple[int, int, str]]:
+        """All word-bounded (start, end, skill_id) hits in text, overlaps included."""
+        text = text.lower()
+        goto, fail, out = self._goto, self._fail, self._out
+        size = len(text)
+        hits = []
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for length, skill_id, word_start, word_end in out[node]:
+                start = i - length + 1
+                if not _starts_token(text, start, word_start):
+                    continue
+                if word_end and i + 1 < size and _is_word_char(text[i + 1]):
+                    continue
+                hits.append((start, i + 1, skill_id))
+        return hits
+
+    def match(self, text: str) -> List[str]:
+        """Canonical skill ids in order of first mention."""
+        if not text:
+            return []
+        skill_ids = []
+        covered_to = 0
+        for start, end, skill_id in sorted(self.scan(text), key=lambda h: (h[0], -h[1])):
+            if start < covered_to:
+                continue
+            covered_to = end
+            if skill_id not in skill_ids:
+                skill_ids.append(skill_id)
+        return skill_ids
+
+
+DEFAULT_MATCHER = SkillMatcher(SKILL_TAXONOMY)
+
+
+def match_skills(text: str) -> List[str]:
+    """Canonical ids of the skills mentioned in text."""
+    return DEFAULT_MATCHER.match(text)
+
+
+def skill_name(skill_id: str) -> str:
+    return DEFAULT_MATCHER.names.get(skill_id, skill_id)
+
+
+def find_skills(text: str) -> List[str]:
+    """Display names of the skills mentioned in text, e.g. ["Python", "Machine Learning"]."""
+    return [skill_name(skill_id) for skill_id in match_skills(text)]
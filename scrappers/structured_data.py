@@ -0,0 +1,303 @@
+# structured_data.py
+import html
+import json
+import re
+from datetime import datetime
+from typing import Iterator, List, Optional
+from urllib.parse import urljoin
+
+from skill_taxonomy import find_skills
+
+try:
+    import orjson
+    loads = orjson.loads
+except ImportError:
+    loads = json.loads
+
+_raw_decoder = json.JSONDecoder()
+
+_JSON_LD_RE = re.compile(r'<script[^>]*type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.S | re.I)
+_NEXT_DATA_RE = re.compile(r'<script[^>]*id=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>', re.S | re.I)
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+# Hydration state assigned to a global in an inline script, per site
+SITE_HYDRATION_VARS = {
+    "indeed": ['window.mosaic.providerData["mosaic-provider-jobcards"]', "window._initialData"],
+    "glassdoor": ["window.__APOLLO_STATE__", "window.appCache"],
+    "naukri": ["window._initialState"],
+}
+ALL_HYDRATION_VARS = sorted({var for variables in SITE_HYDRATION_VARS.values() for var in variables})
+
+# Keys job boards use for each field in hydration JSON, in order of preference
+FIELD_KEYS = {
+    "title": ["jobTitleText", "jobTitle", "displayTitle", "title"],
+    "company": ["employerNameFromSearch", "companyName", "employerName", "company", "employer", "hiringOrganization"],
+    "location": ["formattedLocation", "locationName", "location", "jobLocation", "city"],
+    "experience": ["experienceText", "experience", "experienceRequirements"],
+    "salary": ["salarySnippet", "salaryText", "salary", "baseSalary"],
+    "posted_date": ["datePosted", "pubDate", "createdDate", "postedDate", "formattedRelativeTime", "footerPlaceholderLabel"],
+    "description": ["jobDescription", "description", "descriptionFragmentsText", "snippet"],
+    "skills": ["tagsAndSkills", "skills", "skillList"],
+    "url": ["jdURL", "seoJobLink", "jobViewUrl", "url", "link"],
+}
+
+SITE_BASE_URLS = {
+    "indeed": "https://www.indeed.com",
+    "glassdoor": "https://www.glassdoor.co.in",
+    "naukri": "https://www.naukri.com",
+}
+
+# Returns the <script> tags that can carry structured data, so the page never
+# has to be serialised just to look for them.
+STRUCTURED_SCRIPTS_JS = """
+const markers = arguments[0];
+const out = [];
+for (const s of document.querySelectorAll('script')) {
+    const text = s.textContent || '';
+    if ((s.type || '').toLowerCase() === 'application/ld+json' || s.id === '__NEXT_DATA__'
+            || markers.some(m => text.includes(m))) {
+        out.push(s.outerHTML);
+    }
+}
+return out.join('\\n');
+"""
+
+
+def clean_text(value: str) -> str:
+    """Plain text from a possibly HTML-escaped HTML fragment."""
+    text = _TAG_RE.sub(" ", html.unescape(value))
+    return _SPACE_RE.sub(" ", html.unescape(text)).strip()
+
+
+def _text(value) -> str:
+    if value is None or isinstance(value, bool):
+        return ""
+    if isinstance(value, str):
+        return clean_text(value)
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, list):
+        return ", ".join(t for t in (_text(v) for v in value) if t)
+    if isinstance(value, dict):
+        for key in ("name", "text", "label", "formattedText", "value"):
+            if value.get(key):
+                return _text(value[key])
+    return ""
+
+
+def _load(blob: str):
+    try:
+        return loads(blob.strip())
+    except ValueError:
+        return None
+
+
+def _assigned_json(page: str, variable: str) -> Iterator:
+    """JSON values assigned to `variable = {...}` anywhere in the page."""
+    start = page.find(variable)
+    while start != -1:
+        brace = page.find("{", start + len(variable))
+        if brace != -1 and page[start + len(variable):brace].strip() == "=":
+            try:
+                yield _raw_decoder.raw_decode(page, brace)[0]
+            except ValueError:
+                pass
+        start = page.find(variable, start + len(variable))
+
+
+# JSON-LD (schema.org JobPosting)
+
+def _ld_nodes(data) -> Iterator[dict]:
+    if isinstance(data, list):
+        for item in data:
+            yield from _ld_nodes(item)
+    elif isinstance(data, dict):
+        types = data.get("@type")
+        if types == "JobPosting" or (isinstance(types, list) and "JobPosting" in types):
+            yield data
+        for item in data.get("@graph", []) or []:
+            yield from _ld_nodes(item)
+
+
+def _ld_location(posting: dict) -> str:
+    if posting.get("jobLocationType") == "TELECOMMUTE":
+        return "Remote"
+    places = posting.get("jobLocation") or []
+    if isinstance(places, dict):
+        places = [places]
+    names = []
+    for place in places:
+        address = place.get("address", {}) if isinstance(place, dict) else {}
+        if isinstance(address, dict):
+            parts = [_text(address.get(k)) for k in ("addressLocality", "addressRegion", "addressCountry")]
+            name = ", ".join(p for p in parts if p)
+        else:
+            name = _text(address)
+        if name and name not in names:
+            names.append(name)
+    return "; ".join(names)
+
+
+def _ld_salary(posting: dict) -> str:
+    salary = posting.get("baseSalary") or posting.get("estimatedSalary")
+    if isinstance(salary, list):
+        salary = salary[0] if salary else None
+    if not isinstance(salary, dict):
+        return _text(salary)
+    value = salary.get("value")
+    currency = salary.get("currency", "")
+    if isinstance(value, dict):
+        low, high = value.get("minValue"), value.get("maxValue")
+        amount = f"{low}-{high}" if low is not None and high is not None else _text(value.get("value", low or high))
+        unit = value.get("unitText", "")
+    else:
+        amount, unit = _text(value), salary.get("unitText", "")
+    text = f"{currency} {amount}".strip()
+    return f"{text} / {unit.lower()}" if unit and text else text
+
+
+def _ld_months(requirement) -> Optional[float]:
+    """monthsOfExperience as a number, or None when it is missing or malformed ("3-5")."""
+    if not isinstance(requirement, dict):
+        return None
+    try:
+        return float(requirement.get("monthsOfExperience"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _ld_experience(posting: dict) -> str:
+    requirement = posting.get("experienceRequirements")
+    months = _ld_months(requirement)
+    if months is not None:
+        return f"{months / 12:g} years" if months >= 12 else f"{months:g} months"
+    return _text(requirement)
+
+
+def _from_json_ld(posting: dict) -> dict:
+    return {
+        "title": _text(posting.get("title")),
+        "company": _text(posting.get("hiringOrganization")),
+        "location": _ld_location(posting),
+        "experience": _ld_experience(posting),
+        "salary": _ld_salary(posting),
+        "posted_date": _text(posting.get("datePosted")),
+        "description": _text(posting.get("description")),
+        "skills_text": _text(posting.get("skills")),
+        "url": _text(posting.get("url")),
+    }
+
+
+def json_ld_postings(page: str) -> List[dict]:
+    """JobPosting entries from the page's JSON-LD blocks, as job field dicts."""
+    postings = []
+    for blob in _JSON_LD_RE.findall(page):
+        for posting in _ld_nodes(_load(blob)):
+            postings.append(_from_json_ld(posting))
+    return postings
+
+
+# Hydration state (__NEXT_DATA__, window._initialData, ...)
+
+def _first(record: dict, keys: List[str]) -> str:
+    for key in keys:
+        text = _text(record.get(key))
+        if text:
+            return text
+    return ""
+
+
+def _job_records(data) -> Iterator[dict]:
+    """Dicts anywhere in a JSON tree that carry both a title and a company."""
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if any(node.get(k) for k in FIELD_KEYS["title"]) and any(node.get(k) for k in FIELD_KEYS["company"]):
+                yield node
+                continue
+            stack.extend(reversed(list(node.values())))
+        elif isinstance(node, list):
+            stack.extend(reversed(node))
+
+
+def _from_hydration(record: dict, site: str) -> dict:
+    job = {field: _first(record, keys) for field, keys in FIELD_KEYS.items() if field != "skills"}
+    job["skills_text"] = _first(record, FIELD_KEYS["skills"])
+    if site == "indeed" and record.get("jobkey"):
+        job["url"] = f"https://www.indeed.com/viewjob?jk={record['jobkey']}"
+    # Naukri keeps experience, salary and location in a typed "placeholders" list
+    for placeholder in record.get("placeholders") or []:
+        if isinstance(placeholder, dict) and placeholder.get("type") in ("experience", "salary", "location"):
+            job[placeholder["type"]] = job.get(placeholder["type"]) or _text(placeholder.get("label"))
+    return job
+
+
+def hydration_postings(page: str, site: Optional[str] = None) -> List[dict]:
+    """Job field dicts found in the page's hydration state."""
+    blobs = [_load(blob) for blob in _NEXT_DATA_RE.findall(page)]
+    for variable in SITE_HYDRATION_VARS.get(site, ALL_HYDRATION_VARS):
+        blobs.extend(_assigned_json(page, variable))
+    return [_from_hydration(record, site) for blob in blobs if blob for record in _job_records(blob)]
+
+
+def _finish(job: dict, site: Optional[str], base_url: str) -> dict:
+    skills_text = job.pop("skills_text", "")
+    job = {field: value for field, value in job.items() if value}
+    job["skills"] = find_skills(" ".join([job.get("title", ""), skills_text, job.get("description", "")]))
+    url = job.get("url", "")
+    job["url"] = urljoin(SITE_BASE_URLS.get(site, base_url), url) if url else base_url
+    return job
+
+
+def extract_structured_jobs(page: str, site: Optional[str] = None, base_url: str = "") -> List[dict]:
+    """Jobs embedded in the page as JSON-LD JobPosting or hydration JSON.
+
+    JSON-LD wins when present; hydration state is only searched without it.
+    Returns dicts holding only the fields that were present (plus skills and
+    url); callers merge them over their own defaults and fall back to DOM
+    selectors when the list is empty.
+    """
+    if not page:
+        return []
+    jobs, seen = [], set()
+    for job in json_ld_postings(page) or hydration_postings(page, site):
+        if not job.get("title") or not job.get("company"):
+            continue
+        job = _finish(job, site, base_url)
+        key = (job["title"].lower(), job["company"].lower(), job["url"])
+        if key not in seen:
+            seen.add(key)
+            jobs.append(job)
+    return jobs
+
+
+def job_data_from_structured(found: dict, base_url: str, site: str) -> dict:
+    """A scraper job dict from an extract_structured_jobs() record, with the DOM path's "Not specified" defaults."""
+    description = found.get("description", "")
+    job_data = {
+        "title": "Not specified",
+        "company": "Not specified",
+        "location": "Not specified",
+        "experience": "Not specified",
+        "salary": "Not specified",
+        "posted_date": "Not specified",
+        "url": base_url,
+        "source": site.title(),
+        "scraped_at": datetime.now().isoformat()
+    }
+    job_data.update(found)
+    job_data["description"] = description[:1000] + "..." if len(description) > 1000 else description
+    return job_data
+
+
+def collect_structured_jobs(driver, site: Optional[str] = None, base_url: str = "") -> List[dict]:
+    """extract_structured_jobs over just the page's data-bearing <script> tags, read in-browser."""
+    markers = SITE_HYDRATION_VARS.get(site, ALL_HYDRATION_VARS)
+    try:
+        scripts = driver.execute_script(STRUCTURED_SCRIPTS_JS, markers)
+    except Exception as e:
+        print(f"⚠️ Could not read structured data: {e}")
+        return []
+    return extract_structured_jobs(scripts or "", site, base_url)
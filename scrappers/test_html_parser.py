@@ -0,0 +1,24 @@
+# test_html_parser.py
+import pytest
+
+import html_parser
+from html_parser import _fast_select, _strained_select
+
+NAUKRI_CONTAINER_SELECTOR = ".jobTuple, .srp-jobtuple, [data-job-id], .tuple, .list"
+
+PAGE = """
+<html><body>
+  <div class="list"><span>first</span></div>
+  <div class="tuple" data-job-id="1"><span>second</span></div>
+  <div class="jobTuple"><span>third</span></div>
+</body></html>
+"""
+
+
+@pytest.mark.skipif(html_parser.FastHTMLParser is None, reason="selectolax not installed")
+@pytest.mark.parametrize("limit", [None, 2])
+def test_fast_select_matches_bs4_when_a_card_matches_two_selector_parts(limit):
+    fast = _fast_select(PAGE, NAUKRI_CONTAINER_SELECTOR, limit)
+    slow = _strained_select(PAGE, NAUKRI_CONTAINER_SELECTOR, limit)
+    assert [tag.get_text(strip=True) for tag in fast] == [tag.get_text(strip=True) for tag in slow]
+    assert len(fast) == (limit or 3)
@@ -0,0 +1,12 @@
+# test_normalize.py
+import pandas as pd
+
+from normalize import normalize_jobs
+
+
+def test_description_range_wins_over_seniority_keyword():
+    df = pd.DataFrame({"experience": ["", "N/A"],
+                       "description": ["Senior Engineer 5-8 years", "Senior role, mentoring juniors"]})
+    out = normalize_jobs(df)
+    assert out["experience"].tolist() == ["5-8 years", "Senior"]
+    assert out["exp_min"].iloc[0] == 5 and out["exp_max"].iloc[0] == 8
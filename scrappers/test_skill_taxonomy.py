@@ -0,0 +1,8 @@
+# test_skill_taxonomy.py
+from skill_taxonomy import find_skills
+
+
+def test_leading_dot_alias_needs_a_boundary():
+    assert find_skills("email hr@acme.net") == []
+    assert find_skills("Python developer, www.acme.net") == ["Python"]
+    assert find_skills("C#/.NET, ASP.NET and .net core") == ["C#", ".NET"]
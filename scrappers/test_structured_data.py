@@ -0,0 +1,19 @@
+# test_structured_data.py
+import json
+
+from structured_data import json_ld_postings
+
+
+def _page(requirement) -> str:
+    posting = {"@type": "JobPosting", "title": "Data Engineer", "experienceRequirements": requirement}
+    return f'<script type="application/ld+json">{json.dumps(posting)}</script>'
+
+
+def test_months_of_experience_is_converted():
+    assert json_ld_postings(_page({"monthsOfExperience": 36}))[0]["experience"] == "3 years"
+
+
+def test_malformed_months_of_experience_is_ignored():
+    postings = json_ld_postings(_page({"@type": "OccupationalExperienceRequirements", "monthsOfExperience": "3-5"}))
+    assert postings[0]["title"] == "Data Engineer"
+    assert postings[0]["experience"] == ""
@@ -1,28 +1,104 @@
 import requests
-from bs4 import BeautifulSoup
-import json
 from datetime import datetime
-import time
 import pandas as pd
 import re
-import os
+from functools import lru_cache
+from pagination import paginate_all
+from http_transport import http_get
+from html_parser import make_soup
+from normalize import normalize_jobs
+from skill_taxonomy import find_skills
+
+# Fallback chain per field, highest priority first: (tag, class rule). A class
+# rule is None (any element of that tag), an exact class token, or a regex
+# searched in each class token. Order matches the old chained job.find() calls.
+TIMESJOBS_FIELD_RULES = {
+    "title": [
+        ("h3", None),
+        ("h2", None),
+        ("a", re.compile(r'title|job')),
+        ("span", re.compile(r'title|job')),
+    ],
+    "company": [
+        ("span", "srp-comp-name"),
+        ("div", re.compile(r'comp|company')),
+        ("span", re.compile(r'comp|company')),
+        ("h4", None),
+    ],
+    "location": [
+        ("div", "srp-loc"),
+        ("span", re.compile(r'loc|location')),
+        ("div", re.compile(r'loc|location')),
+        ("i", re.compile(r'location')),
+    ],
+    "experience": [
+        ("div", re.compile(r'exp|experience')),
+        ("span", re.compile(r'exp|experience')),
+        ("i", re.compile(r'experience')),
+    ],
+    "salary": [
+        ("div", re.compile(r'sal|salary')),
+        ("span", re.compile(r'sal|salary')),
+        ("i", re.compile(r'salary')),
+    ],
+    "description": [
+        ("div", re.compile(r'desc|description')),
+        ("span", re.compile(r'desc|description')),
+        ("p", re.compile(r'desc|description')),
+    ],
+}
+
+def _build_extraction_plan(field_rules):
+    """Index the field rules by tag name: tag -> [(field, priority, class rule)]"""
+    plan = {}
+    for field, rules in field_rules.items():
+        for priority, (tag, class_rule) in enumerate(rules):
+            plan.setdefault(tag, []).append((field, priority, class_rule))
+    return plan
+
+TIMESJOBS_PLAN = _build_extraction_plan(TIMESJOBS_FIELD_RULES)
+
+@lru_cache(maxsize=4096)
+def _field_roles(tag, classes):
+    """(field, priority) pairs an element with this tag and class tuple can fill"""
+    roles = []
+    for field, priority, class_rule in TIMESJOBS_PLAN.get(tag, ()):
+        if class_rule is None:
+            matched = True
+        elif isinstance(class_rule, str):
+            matched = class_rule in classes
+        else:
+            matched = any(class_rule.search(c) for c in classes)
+        if matched:
+            roles.append((field, priority))
+    return tuple(roles)
+
+def extract_timesjobs_fields(job):
+    """Walk a job container once and pick each field's element by fallback priority"""
+    best = {}
+    for elem in job.find_all(True):
+        roles = _field_roles(elem.name, tuple(elem.get('class') or ()))
+        for field, priority in roles:
+            # Document order breaks ties, like find() within one rule
+            if field not in best or priority < best[field][0]:
+                best[field] = (priority, elem)
+    return {field: elem for field, (_, elem) in best.items()}
 
 def scrape_timesjobs_live(url):
     """Scrape live TimesJobs mobile site with enhanced data extraction"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-    }
-    
     try:
-        response = requests.get(url, headers=headers, timeout=15)
+        response = http_get(url, timeout=15)
         response.raise_for_status()
+        return parse_timesjobs_page(response.content, url)
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+    except requests.exceptions.RequestException as e:
+        print(f"❌ Network error scraping {url}: {e}")
+        return []
+
+def parse_timesjobs_page(content, url):
+    """Parse a fetched TimesJobs listing page into job dicts"""
+    try:
+        soup = make_soup(content)
         jobs = []
         
         # Multiple selectors for job listings - TimesJobs mobile structure
@@ -50,12 +126,9 @@ def scrape_timesjobs_live(url):
         
         for job in job_listings:
             try:
-                # Extract job title with multiple selectors
-                title_elem = (job.find('h3') or 
-                             job.find('h2') or 
-                             job.find('a', class_=re.compile(r'title|job')) or
-                             job.find('span', class_=re.compile(r'title|job')))
+                fields = extract_timesjobs_fields(job)
                 
+                title_elem = fields.get("title")
                 if title_elem:
                     title_link = title_elem.find('a') if title_elem.find('a') else title_elem
                     title = title_link.get_text(strip=True) if title_link else "N/A"
@@ -64,47 +137,24 @@ def scrape_timesjobs_live(url):
                     title = "N/A"
                     job_url = "N/A"
                 
-                # Extract company with multiple selectors
-                company_elem = (job.find('span', class_='srp-comp-name') or
-                               job.find('div', class_=re.compile(r'comp|company')) or
-                               job.find('span', class_=re.compile(r'comp|company')) or
-                               job.find('h4'))
+                company_elem = fields.get("company")
                 company = company_elem.get_text(strip=True) if company_elem else "N/A"
                 
-                # Extract location with multiple selectors
-                location_elem = (job.find('div', class_='srp-loc') or
-                                job.find('span', class_=re.compile(r'loc|location')) or
-                                job.find('div', class_=re.compile(r'loc|location')) or
-                                job.find('i', class_=re.compile(r'location')))
+                location_elem = fields.get("location")
                 location = location_elem.get_text(strip=True) if location_elem else "N/A"
                 
-                # Extract experience
-                experience_elem = (job.find('div', class_=re.compile(r'exp|experience')) or
-                                  job.find('span', class_=re.compile(r'exp|experience')) or
-                                  job.find('i', class_=re.compile(r'experience')))
+                experience_elem = fields.get("experience")
                 experience = experience_elem.get_text(strip=True) if experience_elem else "N/A"
                 
-                # Extract salary
-                salary_elem = (job.find('div', class_=re.compile(r'sal|salary')) or
-                              job.find('span', class_=re.compile(r'sal|salary')) or
-                              job.find('i', class_=re.compile(r'salary')))
+                salary_elem = fields.get("salary")
                 salary = salary_elem.get_text(strip=True) if salary_elem else "N/A"
                 
-                # Extract skills from description
-                description_elem = (job.find('div', class_=re.compile(r'desc|description')) or
-                                   job.find('span', class_=re.compile(r'desc|description')) or
-                                   job.find('p', class_=re.compile(r'desc|description')))
+                description_elem = fields.get("description")
                 description = description_elem.get_text(strip=True) if description_elem else ""
                 
                 # Extract skills from the entire job text
-                all_text = job.get_text(strip=True).lower()
-                skills_keywords = [
-                    'python', 'java', 'javascript', 'react', 'angular', 'node', 'html', 'css',
-                    'sql', 'mongodb', 'aws', 'docker', 'kubernetes', 'machine learning',
-                    'django', 'flask', 'php', 'c++', 'c#', '.net', 'spring', 'hibernate',
-                    'rest api', 'graphql', 'microservices', 'devops', 'jenkins', 'git'
-                ]
-                skills_found = [skill.title() for skill in skills_keywords if skill in all_text]
+                all_text = job.get_text(" ", strip=True).lower()
+                skills_found = find_skills(all_text)
                 
                 # Extract posted date
                 posted_date = "N/A"
@@ -145,11 +195,8 @@ def scrape_timesjobs_live(url):
                 
         return jobs
         
-    except requests.exceptions.RequestException as e:
-        print(f"❌ Network error scraping {url}: {e}")
-        return []
     except Exception as e:
-        print(f"❌ Error scraping {url}: {e}")
+        print(f"❌ Error parsing {url}: {e}")
         return []
 
 def save_to_csv(jobs, filename=None):
@@ -163,7 +210,7 @@ def save_to_csv(jobs, filename=None):
         filename = f"timesjobs_jobs_{timestamp}.csv"
     
     try:
-        df = pd.DataFrame(jobs)
+        df = normalize_jobs(pd.DataFrame(jobs))
         
         # Ensure skills list is saved properly
         df['skills'] = df['skills'].apply(lambda x: ', '.join(x) if isinstance(x, list) else x)
@@ -193,7 +240,7 @@ def save_to_excel(jobs, filename=None):
         filename = f"timesjobs_jobs_{timestamp}.xlsx"
     
     try:
-        df = pd.DataFrame(jobs)
+        df = normalize_jobs(pd.DataFrame(jobs))
         
         with pd.ExcelWriter(filename, engine='openpyxl') as writer:
             # Main jobs sheet
@@ -235,49 +282,20 @@ def main():
     ]
     
     all_jobs = []
+    max_pages_per_url = 2
+    
+    # Paginate every search at once; pages are requested ahead and cancelled at the end of results
+    print(f"🚀 Fetching {len(base_urls)} searches concurrently...")
+    pages_by_search = paginate_all(base_urls, parse_timesjobs_page, max_pages=max_pages_per_url)
     
-    # Loop through each search URL
     for i, base_url in enumerate(base_urls):
-        print(f"\n{'='*60}")
-        print(f"🔍 Scraping URL {i+1}/{len(base_urls)}")
-        print(f"📝 Search: {base_url.split('?')[1][:50]}...")
-        print(f"{'='*60}")
-        
-        current_page = 1
-        max_pages_per_url = 2
-        pages_scraped = 0
-        
-        while pages_scraped < max_pages_per_url:
-            # Construct the URL for the current page
-            paginated_url = f"{base_url}&curPage={current_page}"
-            
-            print(f"📄 Scraping page {current_page}: {paginated_url}")
-            jobs = scrape_timesjobs_live(paginated_url)
-            
-            if not jobs:
-                print(f"❌ No jobs found at page {current_page}. Moving to next URL.")
-                break
-                
+        pages = pages_by_search[base_url]
+        jobs_from_search = sum(len(jobs) for jobs in pages)
+        for jobs in pages:
             all_jobs.extend(jobs)
-            print(f"✅ Found {len(jobs)} jobs on page {current_page}")
-            
-            # Move to the next page
-            current_page += 1
-            pages_scraped += 1
-            
-            # Be polite: add delay to avoid spamming the server
-            if pages_scraped < max_pages_per_url:
-                delay = 2  # seconds
-                print(f"⏳ Waiting {delay} seconds before next page...")
-                time.sleep(delay)
-        
-        print(f"📊 Completed URL {i+1}: {pages_scraped} pages, {len([j for j in all_jobs if j.get('source_url') == base_url])} total jobs from this search")
         
-        # Delay between different search URLs
-        if i < len(base_urls) - 1:
-            delay_between_searches = 3
-            print(f"🕒 Waiting {delay_between_searches} seconds before next search...")
-            time.sleep(delay_between_searches)
+        print(f"📝 Search: {base_url.split('?')[1][:50]}...")
+        print(f"📊 Completed URL {i+1}: {len(pages)} pages, {jobs_from_search} total jobs from this search")
 
     print(f"\n{'='*60}")
     print(f"🎉 SCRAPING COMPLETED!")